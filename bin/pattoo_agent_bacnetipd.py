@@ -8,6 +8,7 @@ Posts system data to remote host over HTTP.
 # Standard libraries
 from __future__ import print_function
 from time import sleep, time
+import threading
 import sys
 import os
 
@@ -29,8 +30,13 @@ else:
 from pattoo_shared import log
 from pattoo_shared.phttp import PostAgent
 from pattoo_shared.agent import Agent, AgentCLI
+from pattoo_agents.deadband import ChangeFilter
 from pattoo_agents.bacnet.ip.constants import PATTOO_AGENT_BACNETIPD
 from pattoo_agents.bacnet.ip.configuration import ConfigBACnetIP as Config
+from pattoo_agents.bacnet.ip.cache import ObjectNameCache
+from pattoo_agents.bacnet.ip.cov import COVSubscriptions
+from pattoo_agents.bacnet.ip.discovery import DeviceCache
+from pattoo_agents.bacnet.ip import discovery
 from pattoo_agents.bacnet.ip import collector
 
 
@@ -82,6 +88,11 @@ class PollingAgent(Agent):
         config = Config()
         interval = config.polling_interval()
         agent_ip_address = config.agent_ip_address()
+        changefilter = ChangeFilter()
+        names = ObjectNameCache(ttl=config.object_name_ttl())
+        devices = DeviceCache(
+            config.device_cache_file(), ttl=config.discovery_ttl())
+        ip_targets = config.ip_targets()
 
         # Start BACnet daemon
         ip_with_subnet_mask = '{}/32'.format(agent_ip_address)
@@ -93,13 +104,32 @@ Cannot start BACnet daemon on IP address {}. Please check configuration or \
 other daemons that could be using BACnet'''.format(agent_ip_address))
             log.log2die(51010, log_message)
 
+        # Renew COV subscriptions at least two polling cycles before they
+        # expire
+        cov = COVSubscriptions(
+            bacnet, lifetime=config.cov_lifetime(), renewal=interval * 2)
+
         # Post data to the remote server
+        discoverer = None
         while True:
             # Get start time
             ts_start = time()
 
+            # Discover targets that are new or whose capabilities expired
+            # without delaying the poll. Targets are polled without their
+            # capabilities until they are discovered.
+            if discoverer is None or discoverer.is_alive() is False:
+                discoverer = threading.Thread(
+                    target=discovery.discover,
+                    args=(bacnet, devices, ip_targets),
+                    kwargs={'workers': config.max_concurrent_requests()},
+                    daemon=True)
+                discoverer.start()
+
             # Get system data
-            agentdata = collector.poll(bacnet)
+            agentdata = collector.poll(
+                bacnet, changefilter=changefilter, names=names, cov=cov,
+                devices=devices)
 
             # Post to remote server
             server = PostAgent(agentdata)
@@ -26,6 +26,7 @@ else:
 from pattoo_shared import log
 from pattoo_shared.phttp import PostAgent
 from pattoo_shared.agent import Agent, AgentCLI
+from pattoo_agents.deadband import ChangeFilter
 from pattoo_agents.modbus.tcp.constants import PATTOO_AGENT_MODBUSTCPD
 from pattoo_agents.modbus.tcp import collector
 from pattoo_agents.modbus.tcp.configuration import ConfigModbusTCP as Config
@@ -77,6 +78,7 @@ class PollingAgent(Agent):
         # Initialize key variables
         config = Config()
         _pi = config.polling_interval()
+        changefilter = ChangeFilter()
 
         # Post data to the remote server
         while True:
@@ -84,7 +86,7 @@ class PollingAgent(Agent):
             ts_start = time()
 
             # Get system data
-            agentdata = collector.poll()
+            agentdata = collector.poll(changefilter=changefilter)
 
             # Post to remote server
             server = PostAgent(agentdata)
@@ -8,6 +8,7 @@ Posts system data to remote host over HTTP.
 # Standard libraries
 from __future__ import print_function
 from time import sleep, time
+import multiprocessing
 import sys
 import os
 
@@ -28,6 +29,10 @@ from pattoo_shared.phttp import PostAgent
 from pattoo_shared.agent import Agent, AgentCLI
 from pattoo_agents.opcua.constants import PATTOO_AGENT_OPCUAD
 from pattoo_agents.opcua import collector
+from pattoo_agents.opcua.loop import EventLoop
+from pattoo_agents.opcua.session import Sessions
+from pattoo_agents.opcua.subscription import Subscriptions
+from pattoo_agents.opcua.nodes import NodeResolver
 from pattoo_agents.opcua.configuration import ConfigOPCUA as Config
 
 
@@ -76,29 +81,62 @@ class PollingAgent(Agent):
         """
         # Initialize key variables
         config = Config()
-        _pi = config.polling_interval()
+        shards = config.polling_processes()
 
-        # Post data to the remote server
-        while True:
-            # Get start time
-            ts_start = time()
+        # Share the servers among processes. Each polls its servers
+        # concurrently in its own event loop. Processes are started before
+        # any event loop threads are.
+        for shard in range(1, shards):
+            process = multiprocessing.Process(
+                target=_query, args=(shard, shards), daemon=True)
+            process.start()
+        _query(0, shards)
 
-            # Get system data
-            agentdata = collector.poll()
 
-            # Post to remote server
-            server = PostAgent(agentdata)
+def _query(shard, shards):
+    """Poll a shard of the OPC UA servers and post the data.
 
-            # Post data
-            success = server.post()
+    Args:
+        shard: Index of the shard of servers to poll
+        shards: Number of shards into which the servers are split
 
-            # Purge cache if success is True
-            if success is True:
-                server.purge()
+    Returns:
+        None
 
-            # Sleep
-            duration = time() - ts_start
-            sleep(abs(_pi - duration))
+    """
+    # Initialize key variables
+    config = Config()
+    _pi = config.polling_interval()
+
+    # Keep sessions, subscriptions and resolved nodes between polling cycles
+    sessions = Sessions(
+        EventLoop(), session_timeout=config.session_timeout())
+    resolver = NodeResolver(config.nodeid_cache_file(shard))
+    subscriptions = Subscriptions(sessions, resolver=resolver)
+
+    # Post data to the remote server
+    while True:
+        # Get start time
+        ts_start = time()
+
+        # Get system data
+        agentdata = collector.poll(
+            subscriptions=subscriptions, sessions=sessions,
+            shard=shard, shards=shards, resolver=resolver)
+
+        # Post to remote server
+        server = PostAgent(agentdata)
+
+        # Post data
+        success = server.post()
+
+        # Purge cache if success is True
+        if success is True:
+            server.purge()
+
+        # Sleep
+        duration = time() - ts_start
+        sleep(abs(_pi - duration))
 
 
 def main():
@@ -28,6 +28,11 @@ from pattoo_shared.agent import Agent, AgentCLI
 from pattoo_shared.phttp import PostAgent
 from pattoo_agents.os.constants import PATTOO_AGENT_OS_AUTONOMOUSD
 from pattoo_agents.os import collector
+from pattoo_agents.os.disk import DiskUsage
+from pattoo_agents.os.metadata import HostMetadata
+from pattoo_agents.os.processes import ProcessStats
+from pattoo_agents.os.cgroups import CgroupStats
+from pattoo_agents.os.sampler import Sampler
 from pattoo_agents.os.configuration import ConfigAutonomousd as Config
 
 
@@ -62,6 +67,24 @@ class PollingAgent(Agent):
         # Initialize key variables
         config = Config()
         _pi = config.polling_interval()
+        disk_usage = DiskUsage(
+            workers=config.disk_usage_workers(),
+            timeout=config.disk_usage_timeout(),
+            filters=config.disk_filters())
+        host_metadata = HostMetadata(
+            refresh_interval=config.metadata_refresh_interval())
+        process_stats = None
+        if bool(config.process_top()) is True:
+            process_stats = ProcessStats(top=config.process_top())
+        cgroup_stats = None
+        if config.cgroup_stats() is True:
+            cgroup_stats = CgroupStats()
+        nic_filter = config.nic_filter()
+        disk_io_filter = config.disk_io_filter()
+        sampler = None
+        if bool(config.sampling_interval()) is True:
+            sampler = Sampler(config.sampling_interval(), _pi)
+            sampler.start()
 
         # Post data to the remote server
         while True:
@@ -69,7 +92,12 @@ class PollingAgent(Agent):
             ts_start = time()
 
             # Get system data
-            agentdata = collector.poll(self._parent, _pi)
+            agentdata = collector.poll(
+                self._parent, _pi, disk_usage=disk_usage,
+                host_metadata=host_metadata, process_stats=process_stats,
+                cgroup_stats=cgroup_stats, sampler=sampler,
+                per_cpu=config.per_cpu(), nic_filter=nic_filter,
+                disk_io_filter=disk_io_filter)
 
             # Post to remote server
             server = PostAgent(agentdata)
@@ -8,9 +8,9 @@ Retrieve's system data from remote host over HTTP.
 # Standard libraries
 from __future__ import print_function
 from time import sleep, time
+import asyncio
 import sys
 import os
-import multiprocessing
 
 # Try to create a working PYTHONPATH
 _BIN_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
@@ -28,10 +28,10 @@ from pattoo_shared import log
 from pattoo_shared.configuration import Config
 from pattoo_shared.agent import Agent, AgentCLI
 from pattoo_shared import files
-from pattoo_shared.phttp import PassiveAgent
 from pattoo_agents.os.constants import (
     PATTOO_AGENT_OS_HUBD, PATTOO_AGENT_OS_SPOKED_API_PREFIX)
 from pattoo_agents.os import configuration
+from pattoo_agents.os.hub import Hub
 
 
 class PollingAgent(Agent):
@@ -63,36 +63,46 @@ class PollingAgent(Agent):
         # Initialize key variables
         config = configuration.ConfigHubd()
         interval = config.polling_interval()
+        agent_id = files.get_agent_id(PATTOO_AGENT_OS_HUBD, Config())
+
+        # Keep connections to spokes open between polling cycles
+        hub = Hub(
+            agent_id,
+            concurrency=config.spoke_concurrency(),
+            timeout=config.spoke_timeout(),
+            post_workers=config.post_workers(),
+            keepalive=interval * 2)
+        loop = asyncio.new_event_loop()
 
         # Post data to the remote server
         while True:
             # Get start time
             ts_start = time()
 
-            _parallel_poll()
+            loop.run_until_complete(hub.poll(_urls()))
 
             # Sleep
             duration = time() - ts_start
             sleep(abs(interval - duration))
 
 
-def _parallel_poll():
-    """Poll each spoke in parallel.
+def _urls():
+    """Get the URLs of the spokes to poll.
 
     Args:
         None
 
     Returns:
-        none: result
+        result: List of spoke URLs
 
     """
     # Initialize key variables
-    sub_processes_in_pool = max(1, multiprocessing.cpu_count())
     config = configuration.ConfigHubd()
     ip_targets = config.ip_targets()
-    argument_list = []
+    polling_interval = config.polling_interval()
+    result = []
 
-    # Create tuple list of parameters
+    # Create list of URLs
     for ip_target in ip_targets:
         # Test
         if isinstance(ip_target, dict) is False:
@@ -102,61 +112,35 @@ def _parallel_poll():
         if 'ip_bind_port' not in ip_target:
             continue
 
-        # Append argument
-        url = _spoked_url(ip_target['ip_address'], ip_target['ip_bind_port'])
-        argument_list.append((url,))
-
-    # Create a pool of sub process resources
-    with multiprocessing.Pool(processes=sub_processes_in_pool) as pool:
-
-        # Create sub processes from the pool
-        pool.starmap(_relay, argument_list)
-
-    # Wait for all the processes to end
-    pool.join()
-
-
-def _relay(url):
-    """Relay data to pattoo server.
-
-    Args:
-        url: Pattoo spoked agent URL
-
-    Returns:
-        None
+        # Append URL
+        url = _spoked_url(
+            ip_target['ip_address'], ip_target['ip_bind_port'],
+            polling_interval)
+        result.append(url)
+    return result
 
-    """
-    # Initialize key variables
-    config = Config()
-    agent_id = files.get_agent_id(PATTOO_AGENT_OS_HUBD, config)
 
-    # Initialize key variables
-    passive = PassiveAgent(PATTOO_AGENT_OS_HUBD, agent_id, url)
-    passive.relay()
-
-
-def _spoked_url(ip_target, ip_bind_port):
+def _spoked_url(ip_target, ip_bind_port, polling_interval):
     """Poll a spoke.
 
     Args:
         ip_target: IP target to poll for data
         ip_bind_port: TCP listening port
+        polling_interval: Polling interval of the hub
 
     Returns:
         url: URL of spoke
 
     """
     # Initialize key variables
-    config = configuration.ConfigHubd()
-    _pi = config.polling_interval()
-
     hostname = ip_target
     if ':' in ip_target:
         hostname = '[{}]'.format(hostname)
 
     # Return
     url = ('http://{}:{}{}/{}'.format(
-        ip_target, ip_bind_port, PATTOO_AGENT_OS_SPOKED_API_PREFIX, _pi))
+        hostname, ip_bind_port, PATTOO_AGENT_OS_SPOKED_API_PREFIX,
+        polling_interval))
     return url
 
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Pattoo classes that cache BACnetIP data between polling cycles."""
+
+# Standard libraries
+from time import time
+import threading
+
+
+class ObjectNameCache():
+    """Cache of BACnet objectName values.
+
+    objectName values rarely change, so they only need to be read again when
+    they expire or when the target is suspected to have restarted. The cache
+    is shared by the threads polling each target.
+
+    """
+
+    def __init__(self, ttl=86400):
+        """Initialize the class.
+
+        Args:
+            ttl: Time in seconds for which cached names are valid
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._ttl = ttl
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def get(self, target, address, now=None):
+        """Get the cached objectName of a point.
+
+        Args:
+            target: Target on which the point resides
+            address: Point object identifier
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: objectName. None if not cached or expired.
+
+        """
+        # Initialize key variables
+        result = None
+        if now is None:
+            now = time()
+        key = (target, address)
+
+        # Get the name
+        with self._lock:
+            if key in self._names:
+                (name, timestamp) = self._names[key]
+                if now - timestamp < self._ttl:
+                    result = name
+                else:
+                    del self._names[key]
+        return result
+
+    def set(self, target, address, name, now=None):
+        """Cache the objectName of a point.
+
+        Args:
+            target: Target on which the point resides
+            address: Point object identifier
+            name: objectName
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            None
+
+        """
+        # Don't cache failed reads
+        if name is None:
+            return
+        if now is None:
+            now = time()
+        with self._lock:
+            self._names[(target, address)] = (name, now)
+
+    def invalidate(self, target):
+        """Remove all the cached names of a target.
+
+        Args:
+            target: Target
+
+        Returns:
+            None
+
+        """
+        # Remove
+        with self._lock:
+            for key in [_ for _ in self._names if _[0] == target]:
+                del self._names[key]
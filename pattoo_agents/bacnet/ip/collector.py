@@ -2,6 +2,9 @@
 """Pattoo library for collecting BACnetIP data."""
 
 # Standard libraries
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
 import sys
 
 # PIP libraries
@@ -16,16 +19,30 @@ from pattoo_shared import log
 from pattoo_shared.constants import DATA_FLOAT, DATA_STRING
 from pattoo_shared.variables import (
     DataPoint, DataPointMetadata, TargetDataPoints, AgentPolledData)
+from .cache import ObjectNameCache
+from . import discovery
 from .constants import PATTOO_AGENT_BACNETIPD
 
+# Estimated sizes in bytes of the parts of a ReadPropertyMultiple response.
+# Used to keep responses within the maximum APDU length of the target.
+_RPM_HEADER_SIZE = 5
+_RPM_OBJECT_SIZE = 7
+_RPM_PROPERTY_SIZES = {'presentValue': 9, 'objectName': 70}
+_RPM_DEFAULT_PROPERTY_SIZE = 20
 
-def poll(bacnet):
+
+def poll(bacnet, changefilter=None, names=None, cov=None, devices=None):
     """Get BACnetIP agent data.
 
     Performance data from BACnetIP enabled targets.
 
     Args:
-        None
+        bacnet: BAC0 object
+        changefilter: ChangeFilter object used to suppress unchanged values
+        names: ObjectNameCache object used to cache objectName values
+        cov: COVSubscriptions object used to get values from targets that
+            support change of value subscriptions
+        devices: DeviceCache object with the capabilities of the targets
 
     Returns:
         agentdata: AgentPolledData object for all data gathered by the agent
@@ -40,7 +57,9 @@ def poll(bacnet):
     agentdata = AgentPolledData(agent_program, _pi)
 
     # Poll oids for all targets and update the TargetDataPoints
-    poller = _PollBACnetIP(bacnet)
+    poller = _PollBACnetIP(
+        bacnet, changefilter=changefilter, names=names, cov=cov,
+        devices=devices)
     ddv_list = poller.data()
     agentdata.add(ddv_list)
 
@@ -51,11 +70,23 @@ def poll(bacnet):
 class _PollBACnetIP():
     """Poll BACnetIP targets."""
 
-    def __init__(self, bacnet):
+    def __init__(
+            self, bacnet, changefilter=None, names=None, cov=None,
+            devices=None):
         """Initialize the class.
 
         Args:
             bacnet: BAC0 object
+            changefilter: ChangeFilter object used to suppress unchanged
+                values
+            names: ObjectNameCache object used to cache objectName values.
+                objectName values are read every time if None.
+            cov: COVSubscriptions object used to get values from targets
+                that support change of value subscriptions. All targets are
+                polled if None.
+            devices: DeviceCache object with the capabilities of the
+                targets. Targets are probed for ReadPropertyMultiple support
+                every polling cycle if None.
 
         Returns:
             None
@@ -63,11 +94,29 @@ class _PollBACnetIP():
         """
         # Initialize key variables.
         self._bacnet = bacnet
+        self._changefilter = changefilter
+        if names is None:
+            self._names = ObjectNameCache(ttl=0)
+        else:
+            self._names = names
 
         config = configuration.ConfigBACnetIP()
 
-        # Get points to be polled (Along with authorizations and ip_targets)
-        self._target_poll_targets = config.target_polling_points()
+        # Get the BACnet variables to be polled for each ip_target
+        self._devices = devices
+        if devices is None:
+            self._target_variables = config.target_variables()
+        else:
+            self._target_variables = config.target_variables(
+                objects=devices.objects())
+        self._cov = cov
+        self._cov_targets = config.cov_targets()
+        self._max_apdu_length = config.max_apdu_length()
+
+        # Limit the number of outstanding confirmed requests
+        self._max_requests = config.max_concurrent_requests()
+        self._target_requests = config.target_concurrent_requests()
+        self._requests = threading.BoundedSemaphore(self._max_requests)
 
     def data(self):
         """Get agent data.
@@ -83,12 +132,15 @@ class _PollBACnetIP():
         """
         # Initialize key variables
         ddv_list = []
+        workers = max(1, min(
+            self._max_requests, len(self._target_variables)))
 
-        # Poll all targets in sequence
-        for item in self._target_poll_targets:
-            result = self._get_target_datapoints(item)
-            if result.valid is True:
-                ddv_list.append(result)
+        # Poll targets concurrently so that slow targets don't delay others
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(
+                    self._get_target_datapoints, self._target_variables):
+                if result.valid is True:
+                    ddv_list.append(result)
 
         # Return
         return ddv_list
@@ -97,10 +149,10 @@ class _PollBACnetIP():
         """Poll each spoke in parallel.
 
         Args:
-            item: TargetPollingPoints object
+            item: TargetBACnetVariables object
 
         Returns:
-            ddv: TargetDataPoints for the SNMPVariable target
+            ddv: TargetDataPoints for the target
 
         """
         # Intialize data gathering
@@ -112,14 +164,35 @@ class _PollBACnetIP():
         if bool(ip_address) is False:
             return ddv
 
+        # Get presentValue values from COV subscriptions
+        values = {}
+        if self._cov is not None and ip_target in self._cov_targets:
+            objectids = sorted(set(
+                _.objectid for _ in item.data
+                if _.property_name == 'presentValue'))
+            self._cov.subscribe(
+                ip_target, ip_address, objectids, requests=self._requests)
+            for objectid, value in self._cov.values(
+                    ip_target, objectids).items():
+                values[objectid + ('presentValue',)] = value
+
+        # Get the read strategy of the target
+        if self._devices is None:
+            device = None
+        else:
+            device = self._devices.get(ip_target)
+
+        # Get polling results for points without COV values
+        polled = [_ for _ in item.points() if _ not in values]
+        if bool(polled) is True:
+            values.update(self._read_points(ip_address, polled, device))
+        names = self._read_names(ip_target, ip_address, values, device)
+
         # Get list of type DataPoint
         datapoints = []
-        for polltarget in item.data:
-            # Get polling results
-            value = poll_target_address(
-                ip_address, polltarget.address, 'presentValue', self._bacnet)
-            name = poll_target_address(
-                ip_address, polltarget.address, 'objectName', self._bacnet)
+        for variable in item.data:
+            value = values.get(variable.point)
+            name = names.get(variable.objectid)
 
             # Skip if invalid data is received
             if value is None:
@@ -127,34 +200,282 @@ class _PollBACnetIP():
 
             # Do multiplication
             if data.is_numeric(value) is True:
-                value = float(value) * polltarget.multiplier
+                value = float(value) * variable.multiplier
                 data_type = DATA_FLOAT
             else:
                 data_type = DATA_STRING
 
             # Update datapoints
-            datapoint = DataPoint(
-                'analog_value_point_{}'.format(polltarget.address),
-                value,
-                data_type=data_type)
+            datapoint = DataPoint(variable.key, value, data_type=data_type)
             datapoint.add(
                 DataPointMetadata('target', ip_target))
             if name is not None:
                 datapoint.add(DataPointMetadata('object_name', name))
+
+            # Suppress values that haven't changed
+            if self._changefilter is not None:
+                if self._changefilter.report(
+                        datapoint, variable.deadband,
+                        target=ip_target) is False:
+                    continue
             datapoints.append(datapoint)
 
         # Return
         ddv.add(datapoints)
         return ddv
 
+    def _read_names(self, ip_target, ip_address, values, device=None):
+        """Get the objectName of objects, reading only those not cached.
+
+        Args:
+            ip_target: Target
+            ip_address: IP address of the target
+            values: Dict of values keyed by (object_type, address,
+                property_name) point
+            device: Discovered Device object of the target
+
+        Returns:
+            result: Dict of objectName values keyed by (object_type, address)
+                object identifier
+
+        """
+        # Initialize key variables
+        result = {}
+        missing = []
+
+        # The target may have restarted if it didn't respond
+        responded = sorted(set(
+            point[:2] for point, value in values.items()
+            if value is not None))
+        if bool(responded) is False:
+            self._names.invalidate(ip_target)
+            return result
+
+        # Get cached names of the objects that responded
+        for objectid in responded:
+            name = self._names.get(ip_target, objectid)
+            if name is None:
+                missing.append(objectid + ('objectName',))
+            else:
+                result[objectid] = name
+
+        # Read names that aren't cached
+        if bool(missing) is True:
+            names = self._read_points(ip_address, missing, device)
+            for point, name in names.items():
+                self._names.set(ip_target, point[:2], name)
+                if name is not None:
+                    result[point[:2]] = name
+
+        # Return
+        return result
+
+    def _read_points(self, ip_address, points, device=None):
+        """Read many points using ReadPropertyMultiple.
+
+        Points are read in batches sized to fit the maximum APDU length.
+        Points are read individually if the target doesn't support
+        ReadPropertyMultiple. The first batch is read on its own to find out
+        whether the target responds and supports ReadPropertyMultiple. The
+        remaining batches are read concurrently within the per target limit
+        of outstanding requests.
+
+        Args:
+            ip_address: IP address of the target
+            points: Sorted list of (object_type, address, property_name)
+                points to read
+            device: Discovered Device object of the target. Its maximum APDU
+                length and ReadPropertyMultiple support are used if not None.
+
+        Returns:
+            result: Dict of values keyed by point
+
+        """
+        # Initialize key variables
+        result = {}
+        multiple = True if device is None else device.rpm
+        batches = _batches(
+            discovery.max_apdu_length(device, self._max_apdu_length), points)
+        if bool(batches) is False:
+            return result
+
+        # Read the first batch
+        (values, multiple) = self._read_batch(
+            ip_address, batches[0], multiple=multiple)
+        result.update(values)
+
+        # Stop if the target didn't respond
+        responded = [_ for _ in values.values() if _ is not None]
+        if bool(responded) is False or len(batches) == 1:
+            return result
+
+        # Read the remaining batches
+        workers = max(1, min(self._target_requests, len(batches) - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for values, _ in executor.map(
+                    lambda batch: self._read_batch(
+                        ip_address, batch, multiple=multiple),
+                    batches[1:]):
+                result.update(values)
+
+        # Return
+        return result
+
+    def _read_batch(self, ip_address, batch, multiple=True):
+        """Read a batch of points.
+
+        Args:
+            ip_address: IP address of the target
+            batch: List of (object_type, address, property_name) points
+            multiple: Use ReadPropertyMultiple if True
+
+        Returns:
+            result: Tuple of (dict of values keyed by point, True if
+                ReadPropertyMultiple is supported)
+
+        """
+        # Initialize key variables
+        values = {}
+
+        # Read all the points in the batch at once
+        if multiple is True:
+            with self._requests:
+                _values = poll_target_addresses(
+                    ip_address, batch, self._bacnet)
+            if _values is None:
+                # ReadPropertyMultiple failed. Read each point instead.
+                multiple = False
+            elif bool(_values) is False or len(_values) == len(batch):
+                # No values are returned if the target didn't respond
+                values = dict(zip(batch, _values))
+                result = (values, multiple)
+                return result
+            else:
+                # Some properties couldn't be read. Read each point of this
+                # batch instead.
+                log_message = ('''\
+BACnet ReadPropertyMultiple response from {} has {} of {} values. Reading \
+the points individually.'''.format(ip_address, len(_values), len(batch)))
+                log.log2info(51057, log_message)
+
+        # Read each point one at a time
+        for point in batch:
+            (object_type, address, property_name) = point
+            with self._requests:
+                values[point] = poll_target_address(
+                    ip_address, address, property_name, self._bacnet,
+                    object_type=object_type)
+
+        # Return
+        result = (values, multiple)
+        return result
+
+
+def _batches(max_apdu_length, points):
+    """Split points into ReadPropertyMultiple requests.
+
+    Properties of the same object share a single object identifier in the
+    request, so each request is sized using the estimated size of the
+    response for the objects and properties it contains.
+
+    Args:
+        max_apdu_length: Maximum APDU length accepted by the target
+        points: Sorted list of (object_type, address, property_name) points
+
+    Returns:
+        result: List of point lists
+
+    """
+    # Initialize key variables
+    result = []
+    batch = []
+    size = _RPM_HEADER_SIZE
+
+    # Process data
+    for point in points:
+        # Get the size of the point in the response
+        increment = _RPM_PROPERTY_SIZES.get(
+            point[2], _RPM_DEFAULT_PROPERTY_SIZE)
+        if bool(batch) is False or batch[-1][:2] != point[:2]:
+            increment += _RPM_OBJECT_SIZE
+
+        # Start a new batch if the point doesn't fit
+        if bool(batch) is True and size + increment > max_apdu_length:
+            result.append(batch)
+            batch = []
+            size = _RPM_HEADER_SIZE + _RPM_OBJECT_SIZE
+            increment = _RPM_PROPERTY_SIZES.get(
+                point[2], _RPM_DEFAULT_PROPERTY_SIZE)
+
+        # Update
+        batch.append(point)
+        size += increment
+
+    # Return
+    if bool(batch) is True:
+        result.append(batch)
+    return result
+
+
+def poll_target_addresses(ip_target, points, bacnet):
+    """Poll many points on a target with a ReadPropertyMultiple request.
+
+    Args:
+        ip_target: Target to poll
+        points: List of (object_type, address, property_name) points to poll
+        bacnet: BAC0 connect object
+
+    Returns:
+        result: List of values in the order requested. An empty list if the
+            target didn't respond. None if the request failed for any other
+            reason, such as ReadPropertyMultiple not being supported.
+
+    """
+    # Intialize data gathering
+    result = None
+    requests = []
+    for (object_type, address), group in itertools.groupby(
+            points, lambda _: _[:2]):
+        requests.append('{} {} {}'.format(
+            object_type, address, ' '.join([_[2] for _ in group])))
+    poller_string = '{} {}'.format(ip_target, ' '.join(requests))
+
+    try:
+        result = bacnet.readMultiple(poller_string)
+    except NoResponseFromController:
+        log_message = (
+            'No BACnet response from {}. Timeout.'.format(ip_target))
+        log.log2warning(51037, log_message)
+        result = []
+    except Exception as reason:
+        log_message = ('''\
+BACnet ReadPropertyMultiple error polling {}. Reason: {}\
+'''.format(ip_target, str(reason)))
+        log.log2warning(51038, log_message)
+    except:
+        log_message = ('''\
+Unknown BACnet ReadPropertyMultiple error polling {}: [{}, {}, {}]\
+'''.format(ip_target, sys.exc_info()[0], sys.exc_info()[1], sys.exc_info()[2]))
+        log.log2warning(51039, log_message)
+
+    # Return
+    if isinstance(result, (list, tuple)) is True:
+        result = list(result)
+    else:
+        result = None
+    return result
+
 
-def poll_target_address(ip_target, address, object2poll, bacnet):
+def poll_target_address(
+        ip_target, address, object2poll, bacnet, object_type='analogValue'):
     """Poll each spoke in parallel.
 
     Args:
         ip_target: Target to poll
-        polltargets: List of PollingPoint objects to poll
+        address: Instance number of the BACnet object to poll
+        object2poll: Property of the BACnet object to poll
         bacnet: BAC0 connect object
+        object_type: BACnet object type to poll
 
     Returns:
         result: Result of the poll
@@ -162,8 +483,8 @@ def poll_target_address(ip_target, address, object2poll, bacnet):
     """
     # Intialize data gathering
     result = None
-    poller_string = (
-        '{} analogValue {} {}'.format(ip_target, address, object2poll))
+    poller_string = '{} {} {} {}'.format(
+        ip_target, object_type, address, object2poll)
 
     try:
         result = bacnet.read(poller_string)
@@ -173,8 +494,8 @@ def poll_target_address(ip_target, address, object2poll, bacnet):
         log.log2warning(51004, log_message)
     except UnknownObjectError:
         log_message = ('''\
-Unknown BACnet object {} requested from target {} at address {}.\
-'''.format(object2poll, ip_target, address))
+Unknown BACnet object {} requested from target {} at {} address {}.\
+'''.format(object2poll, ip_target, object_type, address))
         log.log2warning(51005, log_message)
     except Exception as reason:
         log_message = ('BACnet error polling {}. Reason: {}'.format(
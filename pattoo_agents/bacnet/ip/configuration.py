@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 """Classe to manage SNMP agent configurations."""
 
+# Standard libraries
+import os
+
 # Import project libraries
 from pattoo_shared import configuration, files
 from pattoo_shared.configuration import Config
 from pattoo_shared.variables import IPTargetPollingPoints
-from .constants import PATTOO_AGENT_BACNETIPD
+from pattoo_agents.deadband import deadband
+from pattoo_agents.bacnet.variables import (
+    BACnetVariable, TargetBACnetVariables)
+from .constants import (
+    PATTOO_AGENT_BACNETIPD, BACNET_MAX_APDU_LENGTH, BACNET_MIN_APDU_LENGTH)
 
 
 class ConfigBACnetIP(Config):
@@ -86,6 +93,290 @@ class ConfigBACnetIP(Config):
                         result.append(dpt)
         return result
 
+    def target_variables(self, objects=None):
+        """Get list of BACnet points to poll in the configuration file.
+
+        Args:
+            objects: Dict of discovered (object_type, address) object
+                identifier lists keyed by target. These are polled on the
+                targets of groups with discovery enabled.
+
+        Returns:
+            result: List of TargetBACnetVariables objects, one per target.
+                The points of all the groups of a target are merged so that
+                the per target request limit applies to all of them.
+
+        """
+        # Initialize key variables
+        merged = {}
+        discoveries = []
+        datapoint_key = 'points'
+        if objects is None:
+            objects = {}
+
+        # Get configuration snippet
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'polling_groups'
+        groups = configuration.search(
+            key, sub_key, self._agent_config, die=True)
+
+        # Process data
+        for group in groups:
+            # Ignore bad values
+            if isinstance(group, dict) is False:
+                continue
+            points = group.get(datapoint_key, [])
+            if isinstance(points, list) is False:
+                continue
+
+            # Get the group's points
+            default = deadband(group)
+            object_type = group.get('object_type', 'analogValue')
+            variables = [
+                _create_variable(point, object_type, default)
+                for point in points]
+
+            # Assign to targets
+            for ip_target in group.get('ip_targets', []):
+                if ip_target not in merged:
+                    merged[ip_target] = TargetBACnetVariables(ip_target)
+                merged[ip_target].add(variables)
+
+                # Only objects of the group's object_type are discovered if
+                # it is set
+                if group.get('discover') is True:
+                    discoveries.append((
+                        ip_target,
+                        object_type if 'object_type' in group else None,
+                        default))
+
+        # Add the discovered objects that aren't configured in any group
+        for (ip_target, object_type, default) in discoveries:
+            tbv = merged[ip_target]
+            configured = set(_.objectid for _ in tbv.data)
+            for objectid in objects.get(ip_target, []):
+                if objectid in configured:
+                    continue
+                if object_type is not None and objectid[0] != object_type:
+                    continue
+                tbv.add(_create_variable(
+                    {'address': objectid[1]}, objectid[0], default))
+
+        # Return
+        result = [_ for _ in merged.values() if _.valid is True]
+        return result
+
+    def ip_targets(self):
+        """Get all the targets in the configuration file.
+
+        Args:
+            None
+
+        Returns:
+            result: Sorted list of unique ip_targets
+
+        """
+        # Initialize key variables
+        result = set()
+
+        # Get configuration snippet
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'polling_groups'
+        groups = configuration.search(
+            key, sub_key, self._agent_config, die=True)
+
+        # Process data
+        for group in groups:
+            # Ignore bad values
+            if isinstance(group, dict) is False:
+                continue
+            result.update(group.get('ip_targets', []))
+        return sorted(result)
+
+    def cov_targets(self):
+        """Get the targets to poll using COV subscriptions.
+
+        Args:
+            None
+
+        Returns:
+            result: Set of ip_targets in polling groups with cov enabled
+
+        """
+        # Initialize key variables
+        result = set()
+
+        # Get configuration snippet
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'polling_groups'
+        groups = configuration.search(
+            key, sub_key, self._agent_config, die=True)
+
+        # Process data
+        for group in groups:
+            # Ignore bad values
+            if isinstance(group, dict) is False:
+                continue
+            if group.get('cov') is True:
+                result.update(group.get('ip_targets', []))
+        return result
+
+    def cov_lifetime(self):
+        """Get the lifetime of COV subscriptions.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'cov_lifetime'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to an hour
+        if bool(intermediate) is False:
+            result = 3600
+        else:
+            result = abs(int(intermediate))
+        return result
+
+    def max_apdu_length(self):
+        """Get the maximum APDU length to use in requests to targets.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'max_apdu_length'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to the maximum for BACnet/IP
+        if bool(intermediate) is False:
+            result = BACNET_MAX_APDU_LENGTH
+        else:
+            result = min(
+                BACNET_MAX_APDU_LENGTH,
+                max(BACNET_MIN_APDU_LENGTH, abs(int(intermediate))))
+        return result
+
+    def max_concurrent_requests(self):
+        """Get the maximum number of outstanding requests to all targets.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'max_concurrent_requests'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 16
+        if bool(intermediate) is False:
+            result = 16
+        else:
+            result = max(1, abs(int(intermediate)))
+        return result
+
+    def target_concurrent_requests(self):
+        """Get the maximum number of outstanding requests to each target.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'target_concurrent_requests'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 1
+        if bool(intermediate) is False:
+            result = 1
+        else:
+            result = max(1, abs(int(intermediate)))
+        return result
+
+    def object_name_ttl(self):
+        """Get the time for which objectName values are cached.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'object_name_ttl'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to a day
+        if intermediate is None:
+            result = 86400
+        else:
+            result = abs(int(intermediate))
+        return result
+
+    def device_cache_file(self):
+        """Get the file in which discovered device capabilities are saved.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Return
+        result = os.path.join(
+            self.cache_directory(),
+            '{}_devices.json'.format(PATTOO_AGENT_BACNETIPD))
+        return result
+
+    def discovery_ttl(self):
+        """Get the time after which devices are discovered again.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_BACNETIPD
+        sub_key = 'discovery_ttl'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to a week
+        if intermediate is None:
+            result = 604800
+        else:
+            result = abs(int(intermediate))
+        return result
+
     def polling_interval(self):
         """Get targets.
 
@@ -108,3 +399,29 @@ class ConfigBACnetIP(Config):
         else:
             result = abs(int(intermediate))
         return result
+
+
+def _create_variable(point, object_type='analogValue', default=None):
+    """Create a BACnetVariable from a point in the configuration.
+
+    Args:
+        point: Point configuration dict, or the address of the point
+        object_type: Default object type of the point
+        default: Default Deadband object of the point
+
+    Returns:
+        result: BACnetVariable object
+
+    """
+    # Points may be just an address
+    if isinstance(point, dict) is False:
+        point = {'address': point}
+
+    # Return
+    result = BACnetVariable(
+        address=point.get('address'),
+        object_type=point.get('object_type', object_type),
+        property_name=point.get('property', 'presentValue'),
+        multiplier=point.get('multiplier', 1),
+        deadband=deadband(point, default=default))
+    return result
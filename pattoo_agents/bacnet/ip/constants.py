@@ -2,3 +2,7 @@
 
 # pattoo_agent_bacnetipd constants
 PATTOO_AGENT_BACNETIPD = 'pattoo_agent_bacnetipd'
+
+# Limits of the BACnet maximum APDU length for BACnet/IP
+BACNET_MAX_APDU_LENGTH = 1476
+BACNET_MIN_APDU_LENGTH = 50
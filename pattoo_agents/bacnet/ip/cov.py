@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Pattoo classes that manage BACnet change of value (COV) subscriptions."""
+
+# Standard libraries
+from functools import partial
+from time import time
+import threading
+import sys
+
+# PIP libraries
+from BAC0.core.io.IOExceptions import UnrecognizedService
+
+# Pattoo libraries
+from pattoo_shared import log
+
+
+class COVSubscriptions():
+    """Manage BACnet COV subscriptions and store their notifications.
+
+    Targets send a notification with the presentValue of an object when it is
+    subscribed to, and whenever it changes after that. The latest values are
+    kept in memory to be posted every polling interval. Subscriptions are
+    renewed before their lifetime expires. Targets that reject subscriptions
+    are remembered so that they can be polled instead. Subscriptions that
+    fail for other reasons, such as timeouts, are tried again during the
+    next polling cycle.
+
+    """
+
+    def __init__(self, bacnet, lifetime=3600, renewal=300):
+        """Initialize the class.
+
+        Args:
+            bacnet: BAC0 object
+            lifetime: Lifetime of each subscription in seconds
+            renewal: Subscriptions are renewed when they have less than this
+                number of seconds left before they expire
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._bacnet = bacnet
+        self._lifetime = lifetime
+        self._renewal = min(renewal, lifetime)
+        self._lock = threading.Lock()
+
+        # Subscription expiry times keyed by (target, objectid)
+        self._expiry = {}
+
+        # Latest (value, timestamp) keyed by (target, objectid)
+        self._values = {}
+
+        # Targets that don't support COV
+        self._unsupported = set()
+
+    def supported(self, target):
+        """Determine whether a target accepts COV subscriptions.
+
+        Args:
+            target: Target
+
+        Returns:
+            result: False if the target has rejected a subscription
+
+        """
+        # Return
+        with self._lock:
+            result = target not in self._unsupported
+        return result
+
+    def subscribe(
+            self, target, ip_address, objectids, requests=None, now=None):
+        """Subscribe to objects that are not subscribed or about to expire.
+
+        Args:
+            target: Target
+            ip_address: IP address of the target
+            objectids: List of (object_type, address) object identifiers
+            requests: Semaphore limiting the number of outstanding requests.
+                Requests aren't limited if None.
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+        if requests is None:
+            # Requests are made one at a time, so this never blocks
+            requests = threading.BoundedSemaphore(1)
+
+        # Subscribe
+        for objectid in objectids:
+            if self.supported(target) is False:
+                break
+            key = (target, objectid)
+            with self._lock:
+                expiry = self._expiry.get(key, 0)
+            if expiry - now > self._renewal:
+                continue
+
+            try:
+                with requests:
+                    self._bacnet.cov(
+                        ip_address, objectid,
+                        lifetime=self._lifetime,
+                        callback=partial(
+                            self._notification, target, objectid))
+            except UnrecognizedService:
+                log_message = ('''\
+BACnet COV subscription to object {} rejected by target {}. Polling the \
+target instead: [{}, {}]\
+'''.format(objectid, target, sys.exc_info()[0], sys.exc_info()[1]))
+                log.log2warning(51040, log_message)
+                with self._lock:
+                    self._unsupported.add(target)
+                break
+            except:
+                log_message = ('''\
+BACnet COV subscription to object {} on target {} failed. Polling the target \
+until the next attempt: [{}, {}]\
+'''.format(objectid, target, sys.exc_info()[0], sys.exc_info()[1]))
+                log.log2info(51058, log_message)
+                break
+
+            # Update
+            with self._lock:
+                self._expiry[key] = now + self._lifetime
+
+    def values(self, target, objectids, now=None):
+        """Get the latest values of subscribed objects.
+
+        Args:
+            target: Target
+            objectids: List of (object_type, address) object identifiers
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: Dict of presentValue values keyed by object identifier.
+                Only objects with active subscriptions and values are included.
+
+        """
+        # Initialize key variables
+        result = {}
+        if now is None:
+            now = time()
+
+        # Get values
+        with self._lock:
+            for objectid in objectids:
+                key = (target, objectid)
+                if self._expiry.get(key, 0) <= now:
+                    continue
+                if key in self._values:
+                    result[objectid] = self._values[key][0]
+        return result
+
+    def _notification(self, target, objectid, *args, **kwargs):
+        """Store the value received in a COV notification.
+
+        Args:
+            target: Target
+            objectid: (object_type, address) object identifier
+            args: Positional arguments supplied by BAC0
+            kwargs: Keyword arguments supplied by BAC0
+
+        Returns:
+            None
+
+        """
+        # Get the notification's properties
+        elements = kwargs.get('elements')
+        if elements is None and bool(args) is True:
+            elements = args[0]
+        if isinstance(elements, dict) is False:
+            return
+        properties = elements.get('properties', {})
+        if 'presentValue' not in properties:
+            return
+
+        # Update
+        with self._lock:
+            self._values[(target, objectid)] = (
+                properties['presentValue'], time())
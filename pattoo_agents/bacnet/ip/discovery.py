@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""Pattoo classes that discover and remember BACnetIP device capabilities."""
+
+# Standard libraries
+from time import time
+import collections
+import concurrent.futures
+import threading
+import sys
+
+# Pattoo libraries
+from pattoo_shared import log
+from pattoo_shared import network
+from pattoo_agents import jsonfile
+
+# Define namedtuple type
+Device = collections.namedtuple(
+    'Device', 'device_id max_apdu_length segmentation rpm objects')
+
+# Segmentation values of devices that can send segmented responses
+_SEGMENTED_TRANSMIT = ['segmentedBoth', 'segmentedTransmit']
+
+
+class DeviceCache():
+    """Cache of BACnet device capabilities that persists across restarts.
+
+    The capabilities of each target are discovered once and saved to a file
+    so that the most efficient way of reading a target is known at startup,
+    without probing the target again. Entries are discovered again when they
+    expire. Targets that can't be discovered are retried after a delay that
+    doubles with each consecutive failure, up to the ttl.
+
+    """
+
+    def __init__(self, filename, ttl=604800, retry=300):
+        """Initialize the class.
+
+        Args:
+            filename: Name of the file in which to save the cache
+            ttl: Time in seconds after which devices are discovered again
+            retry: Time in seconds after which a target that couldn't be
+                discovered is tried again for the first time
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._filename = filename
+        self._ttl = ttl
+        self._retry = min(retry, ttl)
+        self._lock = threading.Lock()
+
+        # (Device, timestamp) keyed by target
+        self._devices = _load(filename)
+
+        # (consecutive failures, time of next attempt) keyed by target
+        self._failures = {}
+
+    def get(self, target, now=None):
+        """Get the capabilities of a target.
+
+        Args:
+            target: Target
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: Device object. None if not discovered or expired.
+
+        """
+        # Initialize key variables
+        result = None
+        if now is None:
+            now = time()
+
+        # Get the device
+        with self._lock:
+            if target in self._devices:
+                (device, timestamp) = self._devices[target]
+                if now - timestamp < self._ttl:
+                    result = device
+        return result
+
+    def set(self, target, device, now=None):
+        """Save the capabilities of a target.
+
+        Args:
+            target: Target
+            device: Device object
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+
+        # Update
+        with self._lock:
+            self._devices[target] = (device, now)
+            self._failures.pop(target, None)
+            _save(self._filename, self._devices)
+
+    def due(self, target, now=None):
+        """Determine whether a target needs to be discovered.
+
+        Args:
+            target: Target
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: True if the target isn't in the cache, or has expired,
+                and isn't waiting to be retried after a failure
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+        if self.get(target, now=now) is not None:
+            return False
+
+        # Check for failures
+        with self._lock:
+            (_, next_attempt) = self._failures.get(target, (0, 0))
+        result = now >= next_attempt
+        return result
+
+    def fail(self, target, now=None):
+        """Record a failure to discover a target.
+
+        Args:
+            target: Target
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+
+        # Update
+        with self._lock:
+            (count, _) = self._failures.get(target, (0, 0))
+            delay = min(self._retry * 2 ** count, self._ttl)
+            self._failures[target] = (count + 1, now + delay)
+
+    def objects(self, now=None):
+        """Get the objects discovered on each target.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: Dict of (object_type, address) object identifier lists
+                keyed by target
+
+        """
+        # Initialize key variables
+        result = {}
+        if now is None:
+            now = time()
+
+        # Get objects
+        with self._lock:
+            for target, (device, timestamp) in self._devices.items():
+                if now - timestamp < self._ttl:
+                    result[target] = list(device.objects)
+        return result
+
+
+def discover(bacnet, devices, targets, workers=1, now=None):
+    """Discover targets that are not in the DeviceCache.
+
+    Args:
+        bacnet: BAC0 object
+        devices: DeviceCache object
+        targets: List of targets
+        workers: Maximum number of targets discovered at the same time
+        now: Current timestamp. Defaults to the current time.
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    if now is None:
+        now = time()
+    targets = [_ for _ in targets if devices.due(_, now=now)]
+    if bool(targets) is False:
+        return
+
+    # Discover
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, workers)) as executor:
+        for target in targets:
+            executor.submit(_discover_target, bacnet, devices, target, now)
+
+
+def _discover_target(bacnet, devices, target, now):
+    """Discover a target and update the DeviceCache.
+
+    Args:
+        bacnet: BAC0 object
+        devices: DeviceCache object
+        target: Target
+        now: Current timestamp
+
+    Returns:
+        None
+
+    """
+    # BAC0 only works with IP addresses
+    ip_address = network.get_ipaddress(target)
+    if bool(ip_address) is False:
+        devices.fail(target, now=now)
+        return
+
+    # Discover
+    try:
+        device = discover_device(bacnet, ip_address)
+    except:
+        log_message = ('''\
+Cannot discover BACnet target {}: [{}, {}]\
+'''.format(target, sys.exc_info()[0], sys.exc_info()[1]))
+        log.log2warning(51059, log_message)
+        device = None
+    if device is None:
+        devices.fail(target, now=now)
+    else:
+        devices.set(target, device, now=now)
+
+
+def discover_device(bacnet, ip_address):
+    """Discover the capabilities and objects of a device.
+
+    Args:
+        bacnet: BAC0 object
+        ip_address: IP address of the device
+
+    Returns:
+        result: Device object. None if the device could not be discovered.
+
+    """
+    # Find the device instance number with Who-Is
+    device_id = _device_id(bacnet, ip_address)
+    if device_id is None:
+        return None
+    prefix = '{} device {}'.format(ip_address, device_id)
+
+    # Read the device's properties, finding out if ReadPropertyMultiple is
+    # supported along the way
+    rpm = True
+    properties = ['maxApduLengthAccepted', 'segmentationSupported']
+    try:
+        values = bacnet.readMultiple(
+            '{} {}'.format(prefix, ' '.join(properties)))
+    except:
+        values = None
+    if isinstance(values, (list, tuple)) is False or (
+            len(values) != len(properties)):
+        rpm = False
+        values = [
+            _read(bacnet, '{} {}'.format(prefix, _)) for _ in properties]
+    (max_apdu_length, segmentation) = values
+    if max_apdu_length is None:
+        log_message = ('''\
+BACnet device {} at {} did not report its capabilities.\
+'''.format(device_id, ip_address))
+        log.log2warning(51043, log_message)
+        return None
+
+    # Read the object list. Devices that can't send it in one response are
+    # read one element at a time.
+    objects = _read(bacnet, '{} objectList'.format(prefix))
+    if isinstance(objects, (list, tuple)) is False:
+        objects = []
+        count = _read(bacnet, '{} objectList'.format(prefix), arr_index=0)
+        if isinstance(count, int) is True:
+            for index in range(1, count + 1):
+                item = _read(
+                    bacnet, '{} objectList'.format(prefix), arr_index=index)
+                if item is not None:
+                    objects.append(item)
+
+    # Return
+    result = Device(
+        device_id=device_id,
+        max_apdu_length=int(max_apdu_length),
+        segmentation=str(segmentation),
+        rpm=rpm,
+        objects=_objectids(objects))
+    return result
+
+
+def max_apdu_length(device, default):
+    """Get the maximum APDU length to use when reading a device.
+
+    Args:
+        device: Device object. None if not discovered.
+        default: Maximum APDU length in the configuration
+
+    Returns:
+        result: Maximum APDU length
+
+    """
+    # Devices that segment responses can return more than they accept
+    if device is None or device.segmentation in _SEGMENTED_TRANSMIT:
+        result = default
+    else:
+        result = min(default, device.max_apdu_length)
+    return result
+
+
+def _device_id(bacnet, ip_address):
+    """Get the device instance number of a device using Who-Is.
+
+    Args:
+        bacnet: BAC0 object
+        ip_address: IP address of the device
+
+    Returns:
+        result: Device instance number. None if the device didn't respond.
+
+    """
+    # Initialize key variables
+    result = None
+
+    try:
+        devices = bacnet.whois(ip_address)
+    except:
+        log_message = ('''\
+BACnet Who-Is request to {} failed: [{}, {}, {}]\
+'''.format(ip_address, sys.exc_info()[0], sys.exc_info()[1],
+           sys.exc_info()[2]))
+        log.log2warning(51041, log_message)
+        return result
+
+    # Get the instance number of the responding device
+    for item in devices or []:
+        if isinstance(item, (list, tuple)) is False or len(item) != 2:
+            continue
+        (address, device_id) = item
+        if str(address).split(':')[0] == ip_address:
+            result = int(device_id)
+            break
+
+    if result is None:
+        log_message = (
+            'No BACnet I-Am response from {}.'.format(ip_address))
+        log.log2warning(51042, log_message)
+    return result
+
+
+def _read(bacnet, poller_string, arr_index=None):
+    """Read a property, returning None on failure.
+
+    Args:
+        bacnet: BAC0 object
+        poller_string: BAC0 read request
+        arr_index: Index of the array element to read
+
+    Returns:
+        result: Value read
+
+    """
+    # Read
+    try:
+        if arr_index is None:
+            result = bacnet.read(poller_string)
+        else:
+            result = bacnet.read(poller_string, arr_index=arr_index)
+    except:
+        result = None
+    return result
+
+
+def _objectids(objects):
+    """Convert BACnet objectList entries to object identifiers.
+
+    Args:
+        objects: List of (object_type, address) entries
+
+    Returns:
+        result: Sorted list of unique (object_type, address) tuples
+
+    """
+    # Initialize key variables
+    result = set()
+
+    # Ignore invalid entries
+    for item in objects:
+        if isinstance(item, (list, tuple)) is False or len(item) != 2:
+            continue
+        (object_type, address) = item
+        if isinstance(address, int) is False:
+            continue
+        result.add((str(object_type), address))
+    return sorted(result)
+
+
+def _load(filename):
+    """Read the DeviceCache file.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: Dict of (Device, timestamp) keyed by target
+
+    """
+    # Initialize key variables
+    result = {}
+    entries = jsonfile.load(filename, 51044, 'BACnet device cache')
+    if entries is None:
+        return result
+
+    # Convert
+    try:
+        for target, entry in entries.items():
+            device = Device(
+                device_id=entry['device_id'],
+                max_apdu_length=entry['max_apdu_length'],
+                segmentation=entry['segmentation'],
+                rpm=entry['rpm'],
+                objects=_objectids(entry['objects']))
+            result[target] = (device, entry['timestamp'])
+    except:
+        log_message = ('''\
+Ignoring invalid BACnet device cache file {}: [{}, {}, {}]\
+'''.format(filename, sys.exc_info()[0], sys.exc_info()[1],
+           sys.exc_info()[2]))
+        log.log2warning(51064, log_message)
+        result = {}
+    return result
+
+
+def _save(filename, devices):
+    """Write the DeviceCache file.
+
+    Args:
+        filename: Name of the file
+        devices: Dict of (Device, timestamp) keyed by target
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    entries = {}
+    for target, (device, timestamp) in devices.items():
+        entry = device._asdict()
+        entry['timestamp'] = timestamp
+        entries[target] = entry
+
+    # Write
+    jsonfile.save(filename, entries, 51045, 'BACnet device cache')
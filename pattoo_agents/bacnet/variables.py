@@ -0,0 +1,191 @@
+"""Module for classes that format variables."""
+
+# Standard libraries
+import re
+
+# Pattoo libraries
+from pattoo_shared import data
+
+# BACnet object types that can be polled
+BACNET_OBJECT_TYPES = [
+    'accumulator', 'analogInput', 'analogOutput', 'analogValue',
+    'binaryInput', 'binaryOutput', 'binaryValue', 'characterstringValue',
+    'integerValue', 'largeAnalogValue', 'loop', 'multiStateInput',
+    'multiStateOutput', 'multiStateValue', 'positiveIntegerValue',
+    'pulseConverter']
+
+
+class BACnetVariable():
+    """Variable representation for a BACnet object property."""
+
+    def __init__(
+            self, address=None, object_type='analogValue',
+            property_name='presentValue', multiplier=1, deadband=None):
+        """Initialize the class.
+
+        Args:
+            address: Instance number of the BACnet object
+            object_type: BACnet object type
+            property_name: BACnet property to poll
+            multiplier: Value to multiply results by
+            deadband: Deadband object to apply to the values
+
+        Returns:
+            None
+
+        """
+        # Apply the multiplier
+        if bool(multiplier) is False:
+            self.multiplier = 1
+        elif data.is_numeric(multiplier) is True:
+            self.multiplier = float(multiplier)
+        else:
+            self.multiplier = 1
+
+        # Set object as being.valid
+        self.valid = False not in [
+            isinstance(address, int),
+            address is not False,
+            address is not True,
+            object_type in BACNET_OBJECT_TYPES,
+            isinstance(property_name, str),
+            bool(property_name)
+            ]
+        if self.valid is True:
+            self.valid = 0 <= address <= 4194303
+
+        # Assign values
+        self.address = address
+        self.object_type = object_type
+        self.property_name = property_name
+        self.deadband = deadband
+        self.objectid = (object_type, address)
+        self.point = (object_type, address, property_name)
+
+        # Create the DataPoint key. The key of analogValue presentValue
+        # points is the same as it was before other object types were added.
+        if self.valid is True:
+            self.key = '{}_point_{}'.format(
+                _snake_case(object_type), address)
+            if property_name != 'presentValue':
+                self.key = '{}_{}'.format(
+                    self.key, _snake_case(property_name))
+        else:
+            self.key = None
+
+    def __repr__(self):
+        """Return a representation of the attributes of the class.
+
+        Args:
+            None
+
+        Returns:
+            result: String representation.
+
+        """
+        # Return repr
+        return ('''\
+<{}.valid={}, object_type={}, address={}, property_name={}>\
+'''.format(self.__class__.__name__,
+           repr(self.valid), repr(self.object_type), repr(self.address),
+           repr(self.property_name)))
+
+
+class TargetBACnetVariables():
+    """Object defining a list of BACnetVariable objects.
+
+    Stores BACnetVariables polled from a specific ip_target.
+
+    """
+
+    def __init__(self, target):
+        """Initialize the class.
+
+        Args:
+            target: Target polled to get the BACnetVariable objects
+
+        Returns:
+            None
+
+        Variables:
+            self.data: List of BACnetVariables retrieved from the target
+            self.valid: True if the object is populated with BACnetVariables
+
+        """
+        # Initialize key variables
+        self.data = []
+        self.target = target
+        self.valid = False
+
+    def __repr__(self):
+        """Return a representation of the attributes of the class.
+
+        Args:
+            None
+
+        Returns:
+            result: String representation.
+
+        """
+        # Create a printable variation of the value
+        result = (
+            '<{0} target={1}.valid={2}, data={3}'
+            ''.format(
+                self.__class__.__name__,
+                repr(self.target), repr(self.valid), repr(self.data)
+            )
+        )
+        return result
+
+    def add(self, items):
+        """Append BACnetVariable to the internal self.data list.
+
+        Args:
+            items: A BACnetVariable object list
+
+        Returns:
+            None
+
+        """
+        # Ensure there is a list of objects
+        if isinstance(items, list) is False:
+            items = [items]
+
+        # Only append approved data types
+        for item in items:
+            if isinstance(item, BACnetVariable) is True:
+                if item.valid is True:
+                    self.data.append(item)
+
+                # Set object as being.valid
+                self.valid = False not in [bool(self.data), bool(self.target)]
+
+    def points(self):
+        """Get the unique points to read, grouped by object type and object.
+
+        Args:
+            None
+
+        Returns:
+            result: Sorted list of (object_type, address, property_name)
+                tuples
+
+        """
+        # Return
+        result = sorted(set(item.point for item in self.data))
+        return result
+
+
+def _snake_case(value):
+    """Convert a camel case BACnet identifier to snake case.
+
+    Args:
+        value: Identifier
+
+    Returns:
+        result: Snake case identifier
+
+    """
+    # Return
+    result = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', value).lower()
+    return result
@@ -0,0 +1,221 @@
+"""Module used to suppress the reporting of unchanged values."""
+
+# Standard libraries
+import collections
+import threading
+from time import time
+
+# Pattoo libraries
+from pattoo_shared import data
+from pattoo_shared.variables import TargetDataPoints
+
+# Define namedtuple type
+Deadband = collections.namedtuple(
+    'Deadband', 'absolute percent heartbeat')
+
+
+def deadband(entry, default=None):
+    """Get the deadband settings from a configuration dict.
+
+    Args:
+        entry: Configuration dict of a polling point or polling group
+        default: Deadband to return if none is defined in the entry
+
+    Returns:
+        result: Deadband object
+
+    """
+    # Initialize key variables
+    result = default
+    values = {}
+
+    # Ignore invalid non-dicts
+    if isinstance(entry, dict) is False:
+        return result
+
+    # Get values
+    for key in ['deadband', 'deadband_percent', 'heartbeat']:
+        value = entry.get(key)
+        if isinstance(value, bool) is True:
+            continue
+        if data.is_numeric(value) is False:
+            continue
+        values[key] = abs(float(value))
+
+    # Return the default if nothing is defined
+    if bool(values) is False:
+        return result
+
+    # Undefined values are inherited from the default
+    if isinstance(default, Deadband) is True:
+        absolute = default.absolute
+        percent = default.percent
+        heartbeat = default.heartbeat
+    else:
+        absolute = percent = heartbeat = None
+    result = Deadband(
+        absolute=values.get('deadband', absolute),
+        percent=values.get('deadband_percent', percent),
+        heartbeat=values.get('heartbeat', heartbeat))
+    return result
+
+
+class ChangeFilter():
+    """Suppress values that have not changed since they were last reported.
+
+    A value is reported when:
+
+        1) It has never been reported before.
+        2) It differs from the last reported value by more than the absolute
+           deadband or by more than the deadband percentage of the last
+           reported value. Non numeric values are reported when they change.
+        3) More than the heartbeat interval has passed since it was last
+           reported.
+
+    Values that haven't been seen for more than the ttl are forgotten, so
+    that removed targets and variables don't accumulate.
+
+    """
+
+    def __init__(self, ttl=3600):
+        """Initialize the class.
+
+        Args:
+            ttl: Seconds after which unseen values are forgotten
+
+        Returns:
+            None
+
+        """
+        # Last reported (value, timestamp) keyed by (target, DataPoint
+        # checksum). The checksum alone doesn't identify the target, so the
+        # same register of two gateways would otherwise share a value.
+        self._reported = {}
+        self._seen = {}
+        self._ttl = ttl
+        self._pruned = None
+        self._lock = threading.Lock()
+
+    def report(self, datapoint, setting, target=None, now=None):
+        """Determine whether a DataPoint should be reported.
+
+        Args:
+            datapoint: DataPoint object
+            setting: Deadband object. None if the value is always reported.
+            target: Target from which the DataPoint was polled
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: True if the DataPoint should be reported
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+        key = (target, datapoint.checksum)
+        value = datapoint.value
+
+        # Always report values without a deadband
+        if isinstance(setting, Deadband) is False:
+            return True
+
+        with self._lock:
+            self._prune(now)
+            self._seen[key] = now
+
+            # Check against the last reported value
+            if key in self._reported:
+                (last, timestamp) = self._reported[key]
+                result = _changed(value, last, setting)
+                if bool(setting.heartbeat) is True:
+                    if now - timestamp >= setting.heartbeat:
+                        result = True
+            else:
+                result = True
+
+            # Update
+            if result is True:
+                self._reported[key] = (value, now)
+
+        # Return
+        return result
+
+    def _prune(self, now):
+        """Forget values that haven't been seen for more than the ttl.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            None
+
+        """
+        # Only check once per ttl
+        if self._pruned is None:
+            self._pruned = now
+        if now - self._pruned < self._ttl:
+            return
+        self._pruned = now
+
+        # Prune
+        for key in [
+                _ for _, seen in self._seen.items()
+                if now - seen > self._ttl]:
+            del self._seen[key]
+            self._reported.pop(key, None)
+
+    def filter(self, ddv, settings, now=None):
+        """Remove unreported DataPoints from a TargetDataPoints object.
+
+        Args:
+            ddv: TargetDataPoints object
+            settings: Dict of Deadband objects keyed by DataPoint checksum
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: TargetDataPoints object
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time()
+        result = TargetDataPoints(ddv.target)
+
+        # Filter
+        for datapoint in ddv.data:
+            setting = settings.get(datapoint.checksum)
+            if self.report(
+                    datapoint, setting, target=ddv.target, now=now) is True:
+                result.add(datapoint)
+        return result
+
+
+def _changed(value, last, setting):
+    """Determine whether a value is outside the deadband of the last value.
+
+    Args:
+        value: Current value
+        last: Last reported value
+        setting: Deadband object
+
+    Returns:
+        result: True if changed
+
+    """
+    # Non numeric values only need to be different
+    if data.is_numeric(value) is False or data.is_numeric(last) is False:
+        result = value != last
+        return result
+
+    # Check the deadbands
+    difference = abs(float(value) - float(last))
+    result = False
+    if setting.absolute is None and setting.percent is None:
+        result = difference > 0
+    if setting.absolute is not None:
+        if difference > setting.absolute:
+            result = True
+    if setting.percent is not None:
+        if difference > abs(float(last)) * setting.percent / 100:
+            result = True
+    return result
@@ -0,0 +1,70 @@
+"""Module used to keep agent caches in JSON files across restarts."""
+
+# Standard libraries
+import json
+import os
+import sys
+
+# Pattoo libraries
+from pattoo_shared import log
+
+
+def load(filename, code, description):
+    """Read a JSON cache file.
+
+    Args:
+        filename: Name of the file. Nothing is read if None.
+        code: Log code used if the file can't be read
+        description: Description of the file used in log messages
+
+    Returns:
+        result: Data read. None if the file doesn't exist or can't be read.
+
+    """
+    # Initialize key variables
+    result = None
+    if filename is None or os.path.isfile(filename) is False:
+        return result
+
+    # Read the file
+    try:
+        with open(filename, 'r') as f_handle:
+            result = json.load(f_handle)
+    except:
+        log_message = ('''\
+Ignoring unreadable {} file {}: [{}, {}]\
+'''.format(description, filename, sys.exc_info()[0], sys.exc_info()[1]))
+        log.log2warning(code, log_message)
+        result = None
+    return result
+
+
+def save(filename, data, code, description):
+    """Write a JSON cache file.
+
+    The data is written to a temporary file first, which then replaces the
+    file, so that the file is never left corrupted.
+
+    Args:
+        filename: Name of the file
+        data: Data to write
+        code: Log code used if the file can't be written
+        description: Description of the file used in log messages
+
+    Returns:
+        success: True if successful
+
+    """
+    # Write
+    temp_file = '{}.tmp'.format(filename)
+    try:
+        with open(temp_file, 'w') as f_handle:
+            json.dump(data, f_handle)
+        os.replace(temp_file, filename)
+    except:
+        log_message = ('''\
+Cannot write {} file {}: [{}, {}]\
+'''.format(description, filename, sys.exc_info()[0], sys.exc_info()[1]))
+        log.log2warning(code, log_message)
+        return False
+    return True
@@ -2,6 +2,8 @@
 """Pattoo library for collecting Modbus data."""
 
 # Standard libraries
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 import multiprocessing
 import sys
 
@@ -13,7 +15,7 @@ from pymodbus.exceptions import ModbusIOException, ConnectionException
 # Pattoo libraries
 from pattoo_agents.modbus.tcp.configuration import ConfigModbusTCP as Config
 from pattoo_agents.modbus.variables import (
-    InputRegisterVariable, HoldingRegisterVariable, RegisterVariable)
+    InputRegisterVariable, HoldingRegisterVariable, TargetRegisterVariables)
 from pattoo_shared import log
 from pattoo_shared.constants import DATA_INT
 from pattoo_shared.variables import (
@@ -21,13 +23,13 @@ from pattoo_shared.variables import (
 from .constants import PATTOO_AGENT_MODBUSTCPD
 
 
-def poll():
+def poll(changefilter=None):
     """Get Modbus agent data.
 
     Performance data from Modbus enabled targets.
 
     Args:
-        None
+        changefilter: ChangeFilter object used to suppress unchanged values
 
     Returns:
         agentdata: AgentPolledData object for all data gathered by the agent
@@ -42,21 +44,58 @@ def poll():
     agent_program = PATTOO_AGENT_MODBUSTCPD
     agentdata = AgentPolledData(agent_program, _pi)
 
-    # Get registers to be polled
-    drvs = config.registervariables()
+    # Get registers to be polled and gateway throttling parameters
+    drvs = _merge_drvs(config.registervariables())
+    connections = config.gateway_connections()
+    delay = config.bus_request_delay()
 
-    # Create a dict of register lists keyed by ip_target
+    # Create a list of arguments, one per ip_target
     for drv in drvs:
-        arguments.append((drv,))
+        arguments.append((drv, connections, delay))
 
     # Poll registers for all targets and update the TargetDataPoints
-    ddv_list = _parallel_poller(arguments)
+    ddv_list = []
+    for ddv, settings in _parallel_poller(arguments):
+        if changefilter is not None:
+            ddv = changefilter.filter(ddv, settings)
+        ddv_list.append(ddv)
     agentdata.add(ddv_list)
 
     # Return data
     return agentdata
 
 
+def _merge_drvs(drvs):
+    """Merge TargetRegisterVariables objects that share the same target.
+
+    The configuration creates a TargetRegisterVariables object per register
+    type and polling group. Merging them allows a single connection to be
+    used for all the registers and units of a target.
+
+    Args:
+        drvs: List of TargetRegisterVariables objects
+
+    Returns:
+        result: List of TargetRegisterVariables objects, one per target
+
+    """
+    # Initialize key variables
+    merged = {}
+    result = []
+
+    # Merge
+    for drv in drvs:
+        if isinstance(drv, TargetRegisterVariables) is False:
+            continue
+        if drv.target not in merged:
+            merged[drv.target] = TargetRegisterVariables(drv.target)
+            result.append(merged[drv.target])
+        merged[drv.target].add(drv.data)
+
+    # Return
+    return result
+
+
 def _parallel_poller(arguments):
     """Get data.
 
@@ -66,7 +105,8 @@ def _parallel_poller(arguments):
         arguments: List of arguments for _serial_poller
 
     Returns:
-        ddv_list: List of type TargetDataPoints
+        results: List of (TargetDataPoints, deadbands) tuples returned by
+            _serial_poller
 
     """
     # Initialize key variables
@@ -76,97 +116,186 @@ def _parallel_poller(arguments):
     with multiprocessing.Pool(processes=sub_processes_in_pool) as pool:
 
         # Create sub processes from the pool
-        ddv_list = pool.starmap(_serial_poller, arguments)
+        results = pool.starmap(_serial_poller, arguments)
 
     # Wait for all the processes to end and get results
     pool.join()
 
     # Return
-    return ddv_list
+    return results
 
 
-def _serial_poller(drv):
+def _serial_poller(drv, connections=1, delay=0):
     """Poll each spoke in parallel.
 
+    Targets are treated as gateways with one or more serial buses behind
+    them. Each bus is polled sequentially over its own connection, as the
+    gateway serializes requests on a bus. Up to "connections" buses are
+    polled at the same time. Buses with the most registers to read are
+    started first to keep all buses busy for as much of the cycle as
+    possible.
+
     Args:
-        drv: Target to poll
-        input_registers: Input registers to poll
-        holding_registers: Holding registers to poll
+        drv: TargetRegisterVariables object for the target to poll
+        connections: Maximum number of concurrent connections to the target
+        delay: Delay in seconds between consecutive requests on a bus
 
     Returns:
-        ddv: TargetDataPoints for the ip_target
+        result: Tuple of (TargetDataPoints for the ip_target, dict of the
+            Deadband objects of its DataPoints keyed by DataPoint checksum)
 
     """
     # Intialize data gathering
     ip_target = drv.target
     ddv = TargetDataPoints(ip_target)
+    deadbands = {}
+    buses = sorted(
+        drv.buses().values(),
+        key=lambda variables: sum(_rv.count for _rv in variables),
+        reverse=True)
+    if bool(buses) is False:
+        return (ddv, deadbands)
+
+    # Poll the buses
+    workers = max(1, min(len(buses), connections))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda variables: _bus_poller(ip_target, variables, delay),
+            buses)
+
+        # Update the TargetDataPoints
+        for datapoints, _deadbands in results:
+            ddv.add(datapoints)
+            deadbands.update(_deadbands)
 
-    # Get list of type DataPoint
+    # Return
+    result = (ddv, deadbands)
+    return result
+
+
+def _bus_poller(ip_target, variables, delay=0):
+    """Poll the registers of the units on a single gateway serial bus.
+
+    Args:
+        ip_target: Target to poll
+        variables: List of RegisterVariable objects sorted by unit
+        delay: Delay in seconds between consecutive requests
+
+    Returns:
+        result: Tuple of (list of DataPoint objects, dict of their Deadband
+            objects keyed by DataPoint checksum)
+
+    """
+    # Intialize data gathering
+    client = ModbusTcpClient(ip_target)
     datapoints = []
-    for _rv in drv.data:
-        # Ignore invalid data
-        if isinstance(_rv, RegisterVariable) is False:
-            continue
-        if _rv.valid is False:
-            continue
+    deadbands = {}
+
+    # Get list of type DataPoint
+    for index, _rv in enumerate(variables):
+        # Don't overrun the bus
+        if bool(index) is True and bool(delay) is True:
+            sleep(delay)
 
         # Poll
-        client = ModbusTcpClient(ip_target)
-        if isinstance(_rv, InputRegisterVariable):
-            try:
-                response = client.read_input_registers(
-                    _rv.address, count=_rv.count, unit=_rv.unit)
-                key = 'input_register'
-            except ConnectionException as _err:
-                log_message = ('''\
-Cannot connect to target {} to retrieve input register {}, count {}, \
-unit {}: {}'''.format(ip_target, _rv.register, _rv.count, _rv.unit, str(_err)))
-                log.log2warning(51028, log_message)
-                continue
-            except:
-                log_message = ('''\
-Cause unknown failure with target {} getting input register {}, count {}, \
-unit {}'''.format(ip_target, _rv.register, _rv.count, _rv.unit))
-                log.log2warning(51030, log_message)
-                continue
-        elif isinstance(_rv, HoldingRegisterVariable):
-            try:
-                response = client.read_holding_registers(_rv.address)
-                key = 'holding_register'
-            except ConnectionException:
-                log_message = ('''\
-Cannot connect to target {} to retrieve input register {}, count {}, \
-unit {}'''.format(ip_target, _rv.register, _rv.count, _rv.unit))
-                log.log2warning(51032, log_message)
-                continue
-            except:
-                log_message = ('''\
-Cause unknown failure with target {} getting holding register {}, count {}, \
-unit {}. [{}, {}, {}]\
-'''.format(ip_target, _rv.register, _rv.count, _rv.unit, sys.exc_info()[0],
-           sys.exc_info()[1], sys.exc_info()[2]))
-                log.log2warning(51031, log_message)
-                continue
+        response = _read_registers(client, ip_target, _rv)
+        if response is None:
+            continue
 
         # Process data
         if response.isError() is True:
             _log_modbus(ip_target, _rv, response)
         else:
-            values = response.registers
-            for data_index, _value in enumerate(values):
-                # Do multiplication
-                value = _value * _rv.multiplier
-
-                # Create DataPoint and append
-                new_key = ('{}_{}'.format(key, _rv.register + data_index))
-                datapoint = DataPoint(new_key, value, data_type=DATA_INT)
-                datapoint.add(
-                    DataPointMetadata('unit', str(_rv.unit).zfill(3)))
+            for datapoint in _create_datapoints(_rv, response):
                 datapoints.append(datapoint)
-    ddv.add(datapoints)
+                deadbands[datapoint.checksum] = _rv.deadband
+
+    # Disconnect
+    client.close()
+
+    # Return
+    result = (datapoints, deadbands)
+    return result
+
+
+def _read_registers(client, ip_target, _rv):
+    """Read a range of registers from a target.
+
+    Args:
+        client: ModbusTcpClient object
+        ip_target: Target to poll
+        _rv: RegisterVariable object
+
+    Returns:
+        response: Pymodbus response object. None if the read failed.
+
+    """
+    # Initialize key variables
+    response = None
+
+    # Select the Modbus function to use
+    if isinstance(_rv, InputRegisterVariable):
+        reader = client.read_input_registers
+        description = 'input'
+    elif isinstance(_rv, HoldingRegisterVariable):
+        reader = client.read_holding_registers
+        description = 'holding'
+    else:
+        return None
+
+    # Poll
+    try:
+        response = reader(_rv.address, count=_rv.count, unit=_rv.unit)
+    except ConnectionException as _err:
+        log_message = ('''\
+Cannot connect to target {} to retrieve {} register {}, count {}, \
+unit {}: {}'''.format(ip_target, description, _rv.register, _rv.count,
+                      _rv.unit, str(_err)))
+        log.log2warning(51028, log_message)
+    except:
+        log_message = ('''\
+Cause unknown failure with target {} getting {} register {}, count {}, \
+unit {}. [{}, {}, {}]\
+'''.format(ip_target, description, _rv.register, _rv.count, _rv.unit,
+           sys.exc_info()[0], sys.exc_info()[1], sys.exc_info()[2]))
+        log.log2warning(51030, log_message)
+
+    # Return
+    return response
+
+
+def _create_datapoints(_rv, response):
+    """Create DataPoints from a successful register read.
+
+    Args:
+        _rv: RegisterVariable object that was read
+        response: Pymodbus response object
+
+    Returns:
+        result: List of DataPoint objects
+
+    """
+    # Initialize key variables
+    result = []
+    if isinstance(_rv, InputRegisterVariable):
+        key = 'input_register'
+    else:
+        key = 'holding_register'
+
+    # Process data
+    for data_index, _value in enumerate(response.registers):
+        # Do multiplication
+        value = _value * _rv.multiplier
+
+        # Create DataPoint and append
+        new_key = ('{}_{}'.format(key, _rv.register + data_index))
+        datapoint = DataPoint(new_key, value, data_type=DATA_INT)
+        datapoint.add(
+            DataPointMetadata('unit', str(_rv.unit).zfill(3)))
+        result.append(datapoint)
 
     # Return
-    return ddv
+    return result
 
 
 def _log_modbus(ip_target, registervariable, response):
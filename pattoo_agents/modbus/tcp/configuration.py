@@ -9,9 +9,10 @@ from pattoo_shared import configuration, files
 from pattoo_shared.configuration import Config
 from pattoo_shared import data as lib_data
 from pattoo_shared.variables import IPTargetPollingPoints
+from pattoo_agents.deadband import deadband
 from pattoo_agents.modbus.variables import (
     InputRegisterVariable, HoldingRegisterVariable, TargetRegisterVariables)
-from .constants import PATTOO_AGENT_MODBUSTCPD
+from .constants import PATTOO_AGENT_MODBUSTCPD, MODBUS_MAX_REGISTER_COUNT
 
 
 class ConfigModbusTCP(Config):
@@ -58,6 +59,55 @@ class ConfigModbusTCP(Config):
             result = abs(int(intermediate))
         return result
 
+    def gateway_connections(self):
+        """Get the maximum number of concurrent connections per target.
+
+        Modbus TCP to RTU gateways serialize requests on each serial bus.
+        This value limits the number of buses polled at the same time.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_MODBUSTCPD
+        sub_key = 'gateway_connections'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 1
+        if bool(intermediate) is False:
+            result = 1
+        else:
+            result = max(1, abs(int(intermediate)))
+        return result
+
+    def bus_request_delay(self):
+        """Get the delay in seconds between requests on a gateway serial bus.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_MODBUSTCPD
+        sub_key = 'bus_request_delay'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 0
+        if lib_data.is_numeric(intermediate) is False:
+            result = 0
+        else:
+            result = abs(float(intermediate))
+        return result
+
     def registervariables(self):
         """Get list polling target information in configuration file..
 
@@ -111,8 +161,13 @@ class ConfigModbusTCP(Config):
                     data[register_type], list) is False:
                 return []
 
-            # Get the modbus unit value
+            # Get the modbus unit and gateway bus values
             unit = _get_unit(data)
+            bus = _get_bus(data)
+
+            # Get the deadbands of the registers
+            default = deadband(data)
+            deadbands = _get_deadbands(data[register_type], default=default)
 
             # Create polling targets
             for ip_target in data['ip_targets']:
@@ -129,23 +184,29 @@ class ConfigModbusTCP(Config):
                 m_dict = {}
                 variables = []
 
-                # Extract data from IPTargetPollingPoints
+                # Extract data from IPTargetPollingPoints. Registers can
+                # only be read together if they share the same multiplier
+                # and deadband.
                 for item in dpt.data:
-                    multiplier = item.multiplier
-                    if multiplier not in m_dict:
-                        m_dict[multiplier] = [item.address]
+                    m_key = (
+                        item.multiplier,
+                        deadbands.get(item.address, default))
+                    if m_key not in m_dict:
+                        m_dict[m_key] = [item.address]
                     else:
-                        m_dict[multiplier].append(item.address)
+                        m_dict[m_key].append(item.address)
 
                 # Create RegisterVariable objects
-                for multiplier, registers in sorted(m_dict.items()):
+                for (multiplier, _deadband), registers in sorted(
+                        m_dict.items(), key=lambda m_item: m_item[0][0]):
                     register_counts = _create_register_counts(registers)
                     for register, count in register_counts:
                         variables.append(
                             _create_register_variable(
                                 register_type,
                                 register=register, count=count,
-                                unit=unit, multiplier=multiplier))
+                                unit=unit, multiplier=multiplier, bus=bus,
+                                deadband=_deadband))
 
                 # Create TargetRegisterVariables object
                 drv = TargetRegisterVariables(ip_target)
@@ -157,11 +218,18 @@ class ConfigModbusTCP(Config):
 
 
 def _create_register_variable(
-        register_type, register=None, count=None, unit=None, multiplier=None):
+        register_type, register=None, count=None, unit=None, multiplier=None,
+        bus=0, deadband=None):
     """Create a Modbus register variable.
 
     Args:
-        listing: List of integers to group
+        register_type: Type of register to create
+        register: Register number
+        count: The number of registers to read
+        unit: The slave unit this request is targeting
+        multiplier: Value to multiply register results by
+        bus: Serial bus behind a Modbus gateway on which the unit resides
+        deadband: Deadband object to apply to the register values
 
     Returns:
         result: RegisterVariable
@@ -174,17 +242,20 @@ def _create_register_variable(
     if register_type == 'holding_registers':
         result = HoldingRegisterVariable(
             register=register, count=count,
-            unit=unit, multiplier=multiplier)
+            unit=unit, multiplier=multiplier, bus=bus, deadband=deadband)
     else:
         result = InputRegisterVariable(
             register=register, count=count,
-            unit=unit, multiplier=multiplier)
+            unit=unit, multiplier=multiplier, bus=bus, deadband=deadband)
     return result
 
 
 def _create_register_counts(listing):
     """Convert a list of integers into ranges.
 
+    Ranges are split so that none exceeds the number of registers that can
+    be read in a single Modbus request.
+
     Args:
         listing: List of integers to group
 
@@ -196,7 +267,9 @@ def _create_register_counts(listing):
     result = []
     ranges = list(_ranger(listing))
     for (start, stop) in ranges:
-        result.append((start, stop - start + 1))
+        for offset in range(start, stop + 1, MODBUS_MAX_REGISTER_COUNT):
+            count = min(MODBUS_MAX_REGISTER_COUNT, stop - offset + 1)
+            result.append((offset, count))
     result.sort()
     return result
 
@@ -265,3 +338,55 @@ def _get_unit(data):
 
     # Return
     return result
+
+
+def _get_bus(data):
+    """Get the gateway serial bus of the units in the polling_group.
+
+    Args:
+        data: Configuration dict for the polling_group
+
+    Returns:
+        result: bus value
+
+    """
+    # Default value
+    result = 0
+
+    # Ignore invalid values
+    if isinstance(data, dict) is False:
+        return result
+    bus = data.get('bus')
+    if isinstance(bus, bool) is True:
+        return result
+    if isinstance(bus, (int, float)) is False:
+        return result
+
+    # Return
+    result = abs(int(bus))
+    return result
+
+
+def _get_deadbands(registers, default=None):
+    """Get the deadbands of the registers in a polling_group.
+
+    Args:
+        registers: List of register configuration entries
+        default: Deadband object defined for the polling_group
+
+    Returns:
+        result: Dict of Deadband objects keyed by register
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Ignore invalid non-lists
+    if isinstance(registers, list) is False:
+        return result
+
+    # Process data
+    for entry in registers:
+        if isinstance(entry, dict) is True and 'address' in entry:
+            result[entry['address']] = deadband(entry, default=default)
+    return result
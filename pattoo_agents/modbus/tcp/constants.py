@@ -2,3 +2,6 @@
 
 # pattoo-modbus-tcp constants
 PATTOO_AGENT_MODBUSTCPD = 'pattoo_agent_modbustcpd'
+
+# Maximum number of registers that can be read in a single Modbus request
+MODBUS_MAX_REGISTER_COUNT = 125
@@ -6,7 +6,9 @@ from pattoo_shared import data
 class RegisterVariable():
     """Variable representation for Register data for Modbus polling."""
 
-    def __init__(self, register=None, count=1, unit=0, multiplier=1):
+    def __init__(
+            self, register=None, count=1, unit=0, multiplier=1, bus=0,
+            deadband=None):
         """Initialize the class.
 
         Args:
@@ -14,6 +16,8 @@ class RegisterVariable():
             count: The number of registers to read
             unit: The slave unit this request is targeting
             multiplier: Value to multiply register results by
+            bus: Serial bus behind a Modbus gateway on which the unit resides
+            deadband: Deadband object to apply to the register values
 
         Returns:
             None
@@ -21,6 +25,8 @@ class RegisterVariable():
         """
         # Initialize key variables
         self.address = None
+        self.bus = bus
+        self.deadband = deadband
 
         # Apply the multiplier
         if bool(multiplier) is False:
@@ -83,7 +89,9 @@ class RegisterVariable():
 class InputRegisterVariable(RegisterVariable):
     """Variable representation for Register data for Modbus polling."""
 
-    def __init__(self, register=None, count=1, unit=0, multiplier=1):
+    def __init__(
+            self, register=None, count=1, unit=0, multiplier=1, bus=0,
+            deadband=None):
         """Initialize the class.
 
         Args:
@@ -91,6 +99,8 @@ class InputRegisterVariable(RegisterVariable):
             count: The number of registers to read
             unit: The slave unit this request is targeting
             multiplier: Value to multiply register results by
+            bus: Serial bus behind a Modbus gateway on which the unit resides
+            deadband: Deadband object to apply to the register values
 
         Returns:
             None
@@ -99,7 +109,7 @@ class InputRegisterVariable(RegisterVariable):
         # Initialize variables
         RegisterVariable.__init__(
             self, register=register, count=count,
-            unit=unit, multiplier=multiplier)
+            unit=unit, multiplier=multiplier, bus=bus, deadband=deadband)
 
         # Set modbus physical address to contact
         if self.valid is True:
@@ -114,7 +124,9 @@ class InputRegisterVariable(RegisterVariable):
 class HoldingRegisterVariable(RegisterVariable):
     """Variable representation for Register data for Modbus polling."""
 
-    def __init__(self, register=None, count=1, unit=0, multiplier=1):
+    def __init__(
+            self, register=None, count=1, unit=0, multiplier=1, bus=0,
+            deadband=None):
         """Initialize the class.
 
         Args:
@@ -122,6 +134,8 @@ class HoldingRegisterVariable(RegisterVariable):
             count: The number of registers to read
             unit: The slave unit this request is targeting
             multiplier: Value to multiply register results by
+            bus: Serial bus behind a Modbus gateway on which the unit resides
+            deadband: Deadband object to apply to the register values
 
         Returns:
             None
@@ -130,7 +144,7 @@ class HoldingRegisterVariable(RegisterVariable):
         # Initialize variables
         RegisterVariable.__init__(
             self, register=register, count=count,
-            unit=unit, multiplier=multiplier)
+            unit=unit, multiplier=multiplier, bus=bus, deadband=deadband)
 
         # Set modbus physical address to contact
         if self.valid is True:
@@ -209,3 +223,28 @@ class TargetRegisterVariables():
 
                 # Set object as being.valid
                 self.valid = False not in [bool(self.data), bool(self.target)]
+
+    def buses(self):
+        """Group the RegisterVariables in self.data by gateway serial bus.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of RegisterVariable lists keyed by bus. Each list
+                is sorted by unit then register.
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Group by bus
+        for item in self.data:
+            if item.valid is False:
+                continue
+            result.setdefault(item.bus, []).append(item)
+
+        # Sort so that each unit is polled in a single sequence
+        for bus in result:
+            result[bus].sort(key=lambda _rv: (_rv.unit, _rv.register))
+        return result
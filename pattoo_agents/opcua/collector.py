@@ -2,33 +2,52 @@
 """Pattoo library for collecting Modbus data."""
 
 # Standard libraries
-import multiprocessing
 import asyncio
 import sys
-from time import sleep
+import weakref
 
 # PIP libraries
-from asyncua import Client
-from asyncua.ua.uaerrors import BadNodeIdUnknown
+from asyncua import ua
 
 # Pattoo libraries
 from pattoo_shared.variables import (
     DataPoint, DataPointMetadata, PollingPoint, AgentPolledData,
     TargetDataPoints, TargetPollingPoints)
 from pattoo_shared import log
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT
 from pattoo_shared.data import is_numeric
 
-from .constants import PATTOO_AGENT_OPCUAD, OPCUAauth
+from .constants import (
+    PATTOO_AGENT_OPCUAD, OPCUAauth, OPCUA_MAX_NODES_PER_READ)
 from .configuration import ConfigOPCUA as Config
+from .loop import EventLoop
+from .session import Sessions
+from .nodes import NodeResolver
+from .values import convert
 
+# MaxNodesPerRead operational limits keyed by asyncua Client object. Entries
+# are discarded with the client when its session is closed.
+_MAX_NODES_PER_READ = weakref.WeakKeyDictionary()
 
-def poll():
+
+def poll(subscriptions=None, sessions=None, shard=0, shards=1,
+         resolver=None):
     """Get Modbus agent data.
 
     Performance data from Modbus enabled targets.
 
     Args:
-        None
+        subscriptions: Subscriptions object used to get values from servers
+            in polling groups with subscriptions enabled. All servers are
+            polled if None.
+        sessions: Sessions object used to poll servers in its long-lived
+            event loop, reusing sessions between polling cycles. The
+            sessions of subscriptions are used if None. Otherwise sessions
+            are created and closed in a temporary event loop.
+        shard: Index of the shard of servers to poll
+        shards: Number of shards into which the servers are split
+        resolver: NodeResolver object used to resolve browse paths and
+            register nodes. Addresses must be NodeIds if None.
 
     Returns:
         agentdata: AgentPolledData object for all data gathered by the agent
@@ -43,79 +62,120 @@ def poll():
     agentdata = AgentPolledData(agent_program, _pi)
 
     # Get registers to be polled
-    tpp_list = config.target_polling_points()
-    arguments = [(tpp,) for tpp in tpp_list]
-
-    # Poll registers for all targets and update the TargetDataPoints
-    target_datapoints_list = _parallel_poller(arguments)
+    tpp_list = config.target_polling_points()[shard::shards]
+    if bool(tpp_list) is False:
+        return agentdata
+    settings = {}
+    if subscriptions is not None:
+        settings = config.subscriptions()
+        if sessions is None:
+            sessions = subscriptions.sessions
+
+    # Get the values of subscribed servers and poll the rest, updating the
+    # TargetDataPoints
+    limit = config.server_concurrent_requests()
+    if sessions is None:
+        loop = EventLoop()
+        sessions = Sessions(loop)
+        target_datapoints_list = loop.run(
+            _poll_async(tpp_list, sessions, limit, resolver))
+        loop.run(sessions.close())
+        loop.stop()
+    else:
+        target_datapoints_list = sessions.loop.run(
+            _poll_async(
+                tpp_list, sessions, limit, resolver,
+                subscriptions=subscriptions, settings=settings))
     agentdata.add(target_datapoints_list)
 
     # Return data
     return agentdata
 
 
-def _parallel_poller(arguments):
-    """Get data.
-
-    Update the TargetDataPoints with DataPoints
+async def _poll_async(
+        tpp_list, sessions, limit=1, resolver=None, subscriptions=None,
+        settings=None):
+    """Poll OPC UA servers concurrently.
 
     Args:
-        arguments: List of arguments for _serial_poller
+        tpp_list: List of TargetPollingPoints objects
+        sessions: Sessions object
+        limit: Maximum number of outstanding requests to each server
+        resolver: NodeResolver object
+        subscriptions: Subscriptions object. All servers are polled if None.
+        settings: Dict of OPCUAsubscription objects keyed by OPCUAauth for
+            the servers with subscriptions enabled
 
     Returns:
         target_datapoints_list: List of type TargetDataPoints
 
     """
     # Initialize key variables
-    sub_processes_in_pool = max(1, multiprocessing.cpu_count())
+    if settings is None:
+        settings = {}
 
-    # Create a pool of sub process resources
-    with multiprocessing.Pool(processes=sub_processes_in_pool) as pool:
-
-        # Create sub processes from the pool
-        target_datapoints_list = pool.starmap(_serial_poller, arguments)
-
-    # Wait for all the processes to end and get results
-    pool.join()
+    # Get data
+    results = await asyncio.gather(
+        *[_target_async(
+            tpp, sessions, limit, resolver, subscriptions,
+            settings.get(tpp.target)) for tpp in tpp_list])
 
     # Return
+    target_datapoints_list = [_ for items in results for _ in items]
     return target_datapoints_list
 
 
-def _serial_poller(argument):
-    """Get OPCUA agent data.
+async def _target_async(
+        tpp, sessions, limit=1, resolver=None, subscriptions=None,
+        settings=None):
+    """Get the values of an OPC UA server's subscription and poll the rest.
 
     Args:
-        argument: TargetPollingPoints object
+        tpp: TargetPollingPoints object
+        sessions: Sessions object with the open sessions to servers
+        limit: Maximum number of outstanding requests to the server
+        resolver: NodeResolver object
+        subscriptions: Subscriptions object
+        settings: OPCUAsubscription object. The server is polled if None.
 
     Returns:
-        datapoints: List of DataPoint objects
+        target_datapoints_list: List of type TargetDataPoints
 
     """
-    # Sleep for a very short time to make sure process stabilizes
-    sleep(0.1)
-
-    # Get data
-    asyncio.set_event_loop(asyncio.new_event_loop())
-    loop = asyncio.get_event_loop()
-    target_datapoints = loop.run_until_complete(_serial_poller_async(argument))
-    loop.close()
-    return target_datapoints
+    # Initialize key variables
+    target_datapoints_list = []
+
+    # Get the values of subscribed servers
+    if subscriptions is not None and settings is not None:
+        if await subscriptions.subscribe(tpp, settings) is True:
+            target_datapoints_list.append(_target_datapoints(
+                tpp, subscriptions.values(
+                    tpp.target, aggregate=settings.aggregate)))
+
+            # Poll nodes that couldn't be monitored
+            tpp = _unmonitored(tpp, subscriptions.monitored(tpp.target))
+            if tpp.valid is False:
+                return target_datapoints_list
+
+    # Poll
+    target_datapoints_list.append(
+        await _poll_target_async(tpp, sessions, limit, resolver))
+    return target_datapoints_list
 
 
-async def _serial_poller_async(tpp):
+async def _poll_target_async(tpp, sessions, limit=1, resolver=None):
     """Poll OPCUA agent data.
 
     Args:
         tpp: TargetDataPoints object
+        sessions: Sessions object with the open sessions to servers
+        limit: Maximum number of outstanding requests to the server
+        resolver: NodeResolver object
 
     Returns:
         target_datapoints: TargetDataPoints object
 
     """
-    # Initialize key variables
-    connected = False
-
     # Test for validity
     if isinstance(tpp, TargetPollingPoints) is False:
         return None
@@ -127,69 +187,251 @@ async def _serial_poller_async(tpp):
     # Create URL for polling
     ip_target = tpp.target.ip_target
     ip_port = tpp.target.ip_port
-    username = tpp.target.username
-    password = tpp.target.password
     url = 'opc.tcp://{}:{}'.format(ip_target, ip_port)
 
     # Intialize data gathering
     target_datapoints = TargetDataPoints(ip_target)
 
-    # Create a client object to connect to OPCUA server
-    client = Client(url=url)
-    client.set_user(username)
-    client.set_password(password)
-
     # Connect
     try:
-        await client.connect()
-        connected = True
+        client = await sessions.client(tpp.target)
     except:
         log_message = (
             'Authentication for polling target {} is incorrect'.format(url))
         log.log2warning(51011, log_message)
-        pass
-
-    if connected is True:
-        for point in tpp.data:
-            # Make sure we have the right data type
-            if isinstance(point, PollingPoint) is False:
-                log_message = ('''\
+        return target_datapoints
+
+    # Get the nodes to read
+    valid = []
+    for point in tpp.data:
+        # Make sure we have the right data type
+        if isinstance(point, PollingPoint) is False:
+            log_message = ('''\
 Invalid polling point {} for OPC UA URL {}'''.format(point, url))
-                log.log2info(51012, log_message)
-                continue
+            log.log2info(51012, log_message)
+            continue
+        valid.append(point)
+    if resolver is None:
+        resolver = NodeResolver(None)
+    resolved = await resolver.nodeids(
+        tpp.target, client, [_.address for _ in valid])
+    points = [_ for _ in valid if _.address in resolved]
+    nodeids = [resolved[_.address] for _ in points]
+
+    # Read the nodes in batches within the server's operational limit.
+    # Batches are read concurrently within the server's request limit.
+    max_nodes = await _max_nodes_per_read(client)
+    semaphore = asyncio.Semaphore(limit)
+    batches = [
+        (points[index:index + max_nodes], nodeids[index:index + max_nodes])
+        for index in range(0, len(points), max_nodes)]
+    results = await asyncio.gather(
+        *[_read_batch(client, _nodeids, semaphore)
+          for _, _nodeids in batches])
 
-            # Get data
-            address = point.address
-            try:
-                node = client.get_node(address)
-                value = await node.read_value()
-            except BadNodeIdUnknown:
-                log_message = ('''\
-OPC UA node {} not found on server {}'''.format(address, url))
-                log.log2warning(51015, log_message)
-                continue
-            except:
-                _exception = sys.exc_info()
-                log_message = ('OPC UA server communication error')
-                log.log2exception(51014, _exception, message=log_message)
-                log_message = ('''\
-Cannot get value from polling point {} for OPC UA URL {}\
-'''.format(address, url))
-                log.log2info(51013, log_message)
+    # Get data
+    failed = False
+    for (batch, _), datavalues in zip(batches, results):
+        if datavalues is None:
+            failed = True
+            log_message = ('''\
+Cannot get values from {} polling points for OPC UA URL {}\
+'''.format(len(batch), url))
+            log.log2info(51013, log_message)
+            continue
+
+        for point, datavalue in zip(batch, datavalues):
+            value = _value(point, datavalue, url)
+            if value is None:
                 continue
 
             # Create datapoint
-            if bool(point.multiplier) is True:
-                if is_numeric(value) is True and (
-                        is_numeric(point.multiplier) is True):
-                    value = value * point.multiplier
-            else:
-                value = 0
-            datapoint = DataPoint(address, value)
-            datapoint.add(DataPointMetadata('OPCUA Server', ip_target))
-            target_datapoints.add(datapoint)
-
-        # Disconnect client
-        await client.disconnect()
+            target_datapoints.add(_datapoint(point, value, ip_target))
+
+    # Reconnect next time if communication failed
+    if failed is True:
+        await sessions.invalidate(tpp.target)
+    return target_datapoints
+
+
+def _value(point, datavalue, url):
+    """Get the value of a polling point from its DataValue.
+
+    Values with a Bad StatusCode are dropped. Values with an Uncertain
+    StatusCode are reported and logged.
+
+    Args:
+        point: PollingPoint object
+        datavalue: DataValue read from the server
+        url: Server URL
+
+    Returns:
+        result: OPCUAvalue object. None if the value can't be reported.
+
+    """
+    # Drop bad values
+    status = datavalue.StatusCode
+    if status.is_good() is False and status.is_uncertain() is False:
+        if status.value == ua.StatusCodes.BadNodeIdUnknown:
+            log_message = ('''\
+OPC UA node {} not found on server {}'''.format(point.address, url))
+            log.log2warning(51015, log_message)
+        else:
+            log_message = ('''\
+Cannot get value from polling point {} for OPC UA URL {}: {}\
+'''.format(point.address, url, status))
+            log.log2info(51060, log_message)
+        return None
+
+    # Flag uncertain values
+    if status.is_uncertain() is True:
+        log_message = ('''\
+Value of polling point {} for OPC UA URL {} is uncertain: {}\
+'''.format(point.address, url, status))
+        log.log2info(51049, log_message)
+
+    # Convert
+    result = convert(datavalue)
+    if result is None:
+        log_message = ('''\
+Value of polling point {} for OPC UA URL {} has an unsupported type\
+'''.format(point.address, url))
+        log.log2info(51050, log_message)
+    return result
+
+
+async def _read_batch(client, nodeids, semaphore):
+    """Read the values of a batch of nodes.
+
+    Args:
+        client: Connected asyncua Client object
+        nodeids: List of NodeIds to read
+        semaphore: asyncio.Semaphore limiting requests to the server
+
+    Returns:
+        result: List of DataValues. None if the request failed.
+
+    """
+    # Read
+    async with semaphore:
+        try:
+            result = await client.uaclient.read_attributes(
+                nodeids, ua.AttributeIds.Value)
+        except:
+            _exception = sys.exc_info()
+            log_message = ('OPC UA server communication error')
+            log.log2exception(51014, _exception, message=log_message)
+            result = None
+    return result
+
 
+async def _max_nodes_per_read(client):
+    """Get the maximum number of nodes to read in each request.
+
+    The limit is only read once for each session.
+
+    Args:
+        client: Connected asyncua Client object
+
+    Returns:
+        result: MaxNodesPerRead operational limit of the server, or the
+            default if the server doesn't have one
+
+    """
+    # Reuse the limit read with this session
+    if client in _MAX_NODES_PER_READ:
+        return _MAX_NODES_PER_READ[client]
+
+    # Read the limit. Servers needn't implement the OperationLimits object.
+    result = OPCUA_MAX_NODES_PER_READ
+    try:
+        node = client.get_node(
+            ua.ObjectIds
+            .Server_ServerCapabilities_OperationLimits_MaxNodesPerRead)
+        value = await node.read_value()
+    except:
+        value = None
+
+    # Zero means that there is no limit
+    if isinstance(value, int) is True and value > 0:
+        result = value
+    _MAX_NODES_PER_READ[client] = result
+    return result
+
+
+def _target_datapoints(tpp, values):
+    """Create the TargetDataPoints of values received from a server.
+
+    Args:
+        tpp: TargetPollingPoints object
+        values: Dict of OPCUAvalue objects keyed by polling point address
+
+    Returns:
+        target_datapoints: TargetDataPoints object
+
+    """
+    # Initialize key variables
+    ip_target = tpp.target.ip_target
+    target_datapoints = TargetDataPoints(ip_target)
+
+    # Create datapoints
+    for point in tpp.data:
+        if isinstance(point, PollingPoint) is False:
+            continue
+        if point.address not in values:
+            continue
+        target_datapoints.add(
+            _datapoint(point, values[point.address], ip_target))
     return target_datapoints
+
+
+def _unmonitored(tpp, monitored):
+    """Get the polling points of a server that are not monitored.
+
+    Args:
+        tpp: TargetPollingPoints object
+        monitored: Set of addresses of monitored polling points
+
+    Returns:
+        result: TargetPollingPoints object
+
+    """
+    # Return
+    result = TargetPollingPoints(tpp.target)
+    result.add([
+        _ for _ in tpp.data
+        if isinstance(_, PollingPoint) is False or (
+            _.address not in monitored)])
+    return result
+
+
+def _datapoint(point, value, ip_target):
+    """Create a DataPoint from the value of a polling point.
+
+    Args:
+        point: PollingPoint object
+        value: OPCUAvalue object of the polling point
+        ip_target: OPC UA server
+
+    Returns:
+        datapoint: DataPoint object
+
+    """
+    # Initialize key variables
+    data_type = value.data_type
+    _value = value.value
+
+    # Apply the multiplier to numeric values
+    if data_type in [DATA_INT, DATA_FLOAT] and (
+            is_numeric(point.multiplier) is True) and (
+                point.multiplier != 1):
+        _value = _value * point.multiplier
+        if isinstance(_value, float) is True:
+            data_type = DATA_FLOAT
+
+    # Create datapoint
+    datapoint = DataPoint(
+        point.address, _value, data_type=data_type,
+        timestamp=value.timestamp)
+    datapoint.add(DataPointMetadata('OPCUA Server', ip_target))
+    return datapoint
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Classe to manage OPCUA agent configurations."""
 
+# Standard libraries
+import os
 
 # Import project libraries
-from pattoo_shared import configuration, files
+from pattoo_shared import configuration, files, log
 from pattoo_shared.configuration import Config
 from pattoo_shared.variables import TargetPollingPoints
-from .constants import PATTOO_AGENT_OPCUAD, OPCUAauth
+from pattoo_shared import data
+from .constants import (
+    PATTOO_AGENT_OPCUAD, OPCUAauth, OPCUAsubscription, OPCUA_AGGREGATES)
 
 
 class ConfigOPCUA(Config):
@@ -53,6 +57,91 @@ class ConfigOPCUA(Config):
             result = abs(int(intermediate))
         return result
 
+    def session_timeout(self):
+        """Get the timeout of OPC UA sessions.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OPCUAD
+        sub_key = 'session_timeout'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to an hour
+        if bool(intermediate) is False:
+            result = 3600
+        else:
+            result = abs(int(intermediate))
+        return result
+
+    def server_concurrent_requests(self):
+        """Get the maximum number of outstanding requests to each server.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OPCUAD
+        sub_key = 'server_concurrent_requests'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 1
+        if bool(intermediate) is False:
+            result = 1
+        else:
+            result = max(1, abs(int(intermediate)))
+        return result
+
+    def polling_processes(self):
+        """Get the number of processes among which servers are shared.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OPCUAD
+        sub_key = 'polling_processes'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 1
+        if bool(intermediate) is False:
+            result = 1
+        else:
+            result = max(1, abs(int(intermediate)))
+        return result
+
+    def nodeid_cache_file(self, shard=0):
+        """Get the file in which resolved browse paths are saved.
+
+        Args:
+            shard: Index of the shard of servers polled by the process
+
+        Returns:
+            result: result
+
+        """
+        # Return
+        result = os.path.join(
+            self.cache_directory(),
+            '{}_nodeids_{}.json'.format(PATTOO_AGENT_OPCUAD, shard))
+        return result
+
     def target_polling_points(self):
         """Get list polling target information in configuration file.
 
@@ -72,26 +161,162 @@ class ConfigOPCUA(Config):
         groups = configuration.search(
             key, sub_key, self._agent_config, die=True)
 
-        # Create snmp objects
+        # Create snmp objects. The nodes of polling groups that share a
+        # server are polled together using the server's single session.
+        merged = {}
         for group in groups:
             # Ignore bad values
             if isinstance(group, dict) is False:
                 continue
 
             # Process data
-            ip_target = group.get('ip_target')
-            ip_port = group.get('ip_port')
-            username = group.get('username')
-            password = group.get('password')
-            auth = OPCUAauth(
-                ip_target=ip_target,
-                ip_port=ip_port,
-                username=username,
-                password=password)
-            nodes = group.get('nodes')
+            auth = _auth(group)
+            nodes = _nodes(group.get('nodes'))
             poll_targets = configuration.get_polling_points(nodes)
-            dpt = TargetPollingPoints(auth)
-            dpt.add(poll_targets)
-            if dpt.valid is True:
-                result.append(dpt)
+            if auth not in merged:
+                merged[auth] = TargetPollingPoints(auth)
+            merged[auth].add(poll_targets)
+
+        # Return
+        result = [_ for _ in merged.values() if _.valid is True]
         return result
+
+    def subscriptions(self):
+        """Get the subscription settings of OPC UA servers.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of OPCUAsubscription objects keyed by OPCUAauth for
+                the servers in polling groups with subscriptions enabled
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Get configuration snippet
+        key = PATTOO_AGENT_OPCUAD
+        sub_key = 'polling_groups'
+        groups = configuration.search(
+            key, sub_key, self._agent_config, die=True)
+
+        # Process data
+        for group in groups:
+            # Ignore bad values
+            if isinstance(group, dict) is False:
+                continue
+            if group.get('subscribe') is not True:
+                continue
+
+            # Get the sampling interval in milliseconds. Default to 1000.
+            sampling_interval = group.get('sampling_interval')
+            if data.is_numeric(sampling_interval) is False or (
+                    isinstance(sampling_interval, bool) is True):
+                sampling_interval = 1000
+            sampling_interval = abs(float(sampling_interval))
+
+            # Get the way values are aggregated between polling intervals
+            aggregate = group.get('aggregate', 'latest')
+            if aggregate not in OPCUA_AGGREGATES:
+                aggregate = 'latest'
+
+            # Get the deadbands of the nodes
+            deadbands = {}
+            for node in _nodes(group.get('nodes')):
+                if isinstance(node, dict) is False or 'address' not in node:
+                    continue
+                value = _deadband(node.get('deadband', group.get('deadband')))
+                if value is not None:
+                    deadbands[node['address']] = value
+
+            # Polling groups that share a server also share its
+            # subscription, which uses the settings of the first group
+            auth = _auth(group)
+            if auth in result:
+                settings = result[auth]
+                if (settings.sampling_interval, settings.aggregate) != (
+                        sampling_interval, aggregate):
+                    log_message = ('''\
+Polling groups for OPC UA server {}:{} have different subscription settings. \
+Using the sampling_interval and aggregate of the first group.\
+'''.format(auth.ip_target, auth.ip_port))
+                    log.log2warning(51061, log_message)
+                deadbands.update(settings.deadbands)
+                sampling_interval = settings.sampling_interval
+                aggregate = settings.aggregate
+
+            # Update
+            result[auth] = OPCUAsubscription(
+                sampling_interval=sampling_interval,
+                aggregate=aggregate,
+                deadbands=deadbands)
+        return result
+
+
+def _auth(group):
+    """Get the OPC UA server authentication parameters of a polling group.
+
+    Args:
+        group: Polling group configuration dict
+
+    Returns:
+        result: OPCUAauth object
+
+    """
+    # Return
+    result = OPCUAauth(
+        ip_target=group.get('ip_target'),
+        ip_port=group.get('ip_port'),
+        username=group.get('username'),
+        password=group.get('password'))
+    return result
+
+
+def _nodes(nodes):
+    """Get the nodes of a polling group.
+
+    Nodes configured with a browse_path instead of an address are given the
+    browse path as their address, prefixed with a '/'.
+
+    Args:
+        nodes: List of node configuration dicts
+
+    Returns:
+        result: List of node configuration dicts
+
+    """
+    # Initialize key variables
+    result = []
+    if isinstance(nodes, list) is False:
+        return result
+
+    # Process data
+    for node in nodes:
+        if isinstance(node, dict) is True and 'address' not in node:
+            browse_path = node.get('browse_path')
+            if isinstance(browse_path, str) is True and bool(
+                    browse_path.strip('/')) is True:
+                node = dict(node)
+                node['address'] = '/{}'.format(browse_path.strip('/'))
+        result.append(node)
+    return result
+
+
+def _deadband(value):
+    """Get an absolute deadband for OPC UA monitored items.
+
+    Args:
+        value: Deadband in the configuration
+
+    Returns:
+        result: Deadband. None if no valid deadband is configured.
+
+    """
+    # Ignore invalid values
+    if isinstance(value, bool) is True or data.is_numeric(value) is False:
+        return None
+    result = abs(float(value))
+    if bool(result) is False:
+        result = None
+    return result
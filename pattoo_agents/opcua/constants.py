@@ -8,3 +8,17 @@ PATTOO_AGENT_OPCUAD = 'pattoo_agent_opcuad'
 # Define namedtuple type
 OPCUAauth = collections.namedtuple(
     'OPCUAauth', 'ip_target ip_port username password')
+
+OPCUAsubscription = collections.namedtuple(
+    'OPCUAsubscription', 'sampling_interval aggregate deadbands')
+
+# Ways of aggregating the values received from OPC UA subscriptions
+OPCUA_AGGREGATES = ['latest', 'average', 'minimum', 'maximum']
+
+# Number of nodes read in each request to servers that don't report a
+# MaxNodesPerRead operational limit
+OPCUA_MAX_NODES_PER_READ = 1000
+
+# Value, pattoo data type and timestamp in milliseconds of an OPC UA node
+OPCUAvalue = collections.namedtuple(
+    'OPCUAvalue', 'value data_type timestamp')
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Pattoo class that runs a long-lived asyncio event loop in a thread."""
+
+# Standard libraries
+import asyncio
+import threading
+
+
+class EventLoop():
+    """Run an asyncio event loop in a background thread.
+
+    OPC UA sessions and subscriptions belong to the event loop in which they
+    were created, and must outlive the polling cycles of the agent. The loop
+    keeps running between polling cycles so that subscription notifications
+    continue to be received while the agent sleeps.
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Start the loop
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name='opcua_event_loop', daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine, timeout=None):
+        """Run a coroutine in the event loop and wait for its result.
+
+        Args:
+            coroutine: Coroutine to run
+            timeout: Maximum number of seconds to wait for the result
+
+        Returns:
+            result: Result of the coroutine
+
+        """
+        # Return
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        result = future.result(timeout=timeout)
+        return result
+
+    def stop(self):
+        """Stop the event loop.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Stop
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self):
+        """Run the event loop until it is stopped.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Run
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Pattoo classes that resolve the addresses of OPC UA polling points."""
+
+# Standard libraries
+import sys
+
+# PIP libraries
+from asyncua import ua
+
+# Pattoo libraries
+from pattoo_shared import log
+from pattoo_agents import jsonfile
+from .constants import OPCUA_MAX_NODES_PER_READ
+
+
+class NodeResolver():
+    """Resolve polling point addresses to registered NodeIds.
+
+    Addresses are either NodeIds, or browse paths starting with a '/' such
+    as '/0:Objects/2:Boiler/2:Temperature'. Browse paths are resolved with
+    batched TranslateBrowsePathsToNodeIds requests. The results are saved
+    to a file so that they survive restarts, and are discarded when the
+    server's NamespaceArray changes. The NodeIds of each session are then
+    registered with the server using RegisterNodes to speed up reads.
+
+    """
+
+    def __init__(self, filename):
+        """Initialize the class.
+
+        Args:
+            filename: Name of the file in which resolved browse paths are
+                saved. They are only kept in memory if None.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._filename = filename
+
+        # Resolved browse paths and the NamespaceArray used to resolve them,
+        # keyed by server URL
+        self._paths = _load(filename)
+
+        # (client, dict of registered NodeIds keyed by address) keyed by
+        # OPCUAauth
+        self._registered = {}
+
+    async def nodeids(self, auth, client, addresses):
+        """Get the registered NodeIds of polling point addresses.
+
+        Args:
+            auth: OPCUAauth object
+            client: Connected asyncua Client object
+            addresses: List of polling point addresses
+
+        Returns:
+            result: Dict of NodeIds keyed by address. Addresses that can't
+                be resolved are excluded.
+
+        """
+        # Reuse the NodeIds registered with the current session
+        (_client, result) = self._registered.get(auth, (None, {}))
+        if _client is not client:
+            result = {}
+            await self._check_namespaces(auth, client)
+        missing = [_ for _ in addresses if _ not in result]
+        if bool(missing) is False:
+            return result
+
+        # Resolve
+        url = _url(auth)
+        nodeids = {}
+        paths = [_ for _ in missing if is_browse_path(_) is True]
+        nodeids.update(await self._translate(auth, client, paths))
+        for address in missing:
+            if is_browse_path(address) is True:
+                continue
+            try:
+                nodeids[address] = client.get_node(address).nodeid
+            except:
+                log_message = ('''\
+Invalid OPC UA node {} for server {}'''.format(address, url))
+                log.log2warning(51018, log_message)
+
+        # Register the NodeIds with the session
+        result.update(await _register(client, nodeids, url))
+        self._registered[auth] = (client, result)
+        return result
+
+    async def _check_namespaces(self, auth, client):
+        """Discard resolved browse paths if the server's namespaces changed.
+
+        Args:
+            auth: OPCUAauth object
+            client: Connected asyncua Client object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        url = _url(auth)
+        entry = self._paths.get(url)
+        try:
+            namespaces = list(await client.get_namespace_array())
+        except:
+            namespaces = None
+
+        # Update
+        if entry is None or entry['namespaces'] != namespaces:
+            self._paths[url] = {'namespaces': namespaces, 'nodeids': {}}
+
+    async def _translate(self, auth, client, paths):
+        """Get the NodeIds of browse paths, translating uncached paths.
+
+        Args:
+            auth: OPCUAauth object
+            client: Connected asyncua Client object
+            paths: List of browse paths
+
+        Returns:
+            result: Dict of NodeIds keyed by browse path
+
+        """
+        # Initialize key variables
+        result = {}
+        url = _url(auth)
+        entry = self._paths.setdefault(
+            url, {'namespaces': None, 'nodeids': {}})
+
+        # Get cached NodeIds
+        missing = []
+        for path in paths:
+            if path in entry['nodeids']:
+                result[path] = ua.NodeId.from_string(entry['nodeids'][path])
+            else:
+                missing.append(path)
+        if bool(missing) is False:
+            return result
+
+        # Translate uncached paths in batches
+        for index in range(0, len(missing), OPCUA_MAX_NODES_PER_READ):
+            batch = missing[index:index + OPCUA_MAX_NODES_PER_READ]
+            try:
+                results = await (
+                    client.uaclient.translate_browsepaths_to_nodeids(
+                        [_browse_path(_) for _ in batch]))
+            except:
+                log_message = ('''\
+Cannot translate OPC UA browse paths on server {}: [{}, {}]\
+'''.format(url, sys.exc_info()[0], sys.exc_info()[1]))
+                log.log2warning(51021, log_message)
+                continue
+
+            for path, item in zip(batch, results):
+                if item.StatusCode.is_good() is False or (
+                        bool(item.Targets) is False):
+                    log_message = ('''\
+OPC UA browse path {} not found on server {}: {}\
+'''.format(path, url, item.StatusCode))
+                    log.log2warning(51022, log_message)
+                    continue
+                nodeid = item.Targets[0].TargetId
+                result[path] = nodeid
+                entry['nodeids'][path] = nodeid.to_string()
+
+        # Save
+        if self._filename is not None:
+            _save(self._filename, self._paths)
+        return result
+
+
+def is_browse_path(address):
+    """Determine whether a polling point address is a browse path.
+
+    Args:
+        address: Polling point address
+
+    Returns:
+        result: True if the address is a browse path
+
+    """
+    # Return
+    result = isinstance(address, str) is True and address.startswith('/')
+    return result
+
+
+def _browse_path(path):
+    """Create a BrowsePath from the Root folder.
+
+    Args:
+        path: Browse path of qualified names such as
+            '/0:Objects/2:Boiler/2:Temperature'
+
+    Returns:
+        result: BrowsePath object
+
+    """
+    # Initialize key variables
+    relative_path = ua.RelativePath()
+
+    # Follow hierarchical references from the Root folder
+    for name in path.strip('/').split('/'):
+        element = ua.RelativePathElement()
+        element.ReferenceTypeId = ua.NodeId(
+            ua.ObjectIds.HierarchicalReferences)
+        element.IsInverse = False
+        element.IncludeSubtypes = True
+        element.TargetName = ua.QualifiedName.from_string(name)
+        relative_path.Elements.append(element)
+
+    # Return
+    result = ua.BrowsePath()
+    result.StartingNode = ua.NodeId(ua.ObjectIds.RootFolder)
+    result.RelativePath = relative_path
+    return result
+
+
+async def _register(client, nodeids, url):
+    """Register NodeIds with a session.
+
+    Args:
+        client: Connected asyncua Client object
+        nodeids: Dict of NodeIds keyed by address
+        url: Server URL
+
+    Returns:
+        result: Dict of registered NodeIds keyed by address. The original
+            NodeIds are returned if they can't be registered.
+
+    """
+    # Initialize key variables
+    result = dict(nodeids)
+    addresses = list(nodeids.keys())
+
+    # Register in batches
+    for index in range(0, len(addresses), OPCUA_MAX_NODES_PER_READ):
+        batch = addresses[index:index + OPCUA_MAX_NODES_PER_READ]
+        try:
+            registered = await client.uaclient.register_nodes(
+                [nodeids[_] for _ in batch])
+        except:
+            log_message = ('''\
+Cannot register OPC UA nodes on server {}. Using unregistered NodeIds: \
+[{}, {}]'''.format(url, sys.exc_info()[0], sys.exc_info()[1]))
+            log.log2info(51046, log_message)
+            break
+        result.update(zip(batch, registered))
+    return result
+
+
+def _url(auth):
+    """Get the URL of an OPC UA server.
+
+    Args:
+        auth: OPCUAauth object
+
+    Returns:
+        result: URL
+
+    """
+    # Return
+    result = 'opc.tcp://{}:{}'.format(auth.ip_target, auth.ip_port)
+    return result
+
+
+def _load(filename):
+    """Read the resolved browse paths file.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: Dict of resolved browse paths keyed by server URL
+
+    """
+    # Read the file
+    result = jsonfile.load(filename, 51047, 'OPC UA browse path cache')
+    if isinstance(result, dict) is False:
+        result = {}
+    return result
+
+
+def _save(filename, paths):
+    """Write the resolved browse paths file.
+
+    Args:
+        filename: Name of the file
+        paths: Dict of resolved browse paths keyed by server URL
+
+    Returns:
+        None
+
+    """
+    # Write
+    jsonfile.save(filename, paths, 51048, 'OPC UA browse path cache')
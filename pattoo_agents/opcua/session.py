@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Pattoo classes that keep OPC UA sessions open between polling cycles."""
+
+# Standard libraries
+import asyncio
+import sys
+
+# PIP libraries
+from asyncua import Client
+
+# Pattoo libraries
+from pattoo_shared import log
+
+
+class Sessions():
+    """Pool of OPC UA sessions that stay open between polling cycles.
+
+    Establishing a secure channel and activating a session take several
+    round trips and load the server's session manager, so each server's
+    session is reused for as long as it stays healthy. The asyncua client
+    keeps sessions alive between polling cycles. Sessions that fail their
+    connection check, or whose requests fail, are closed and reestablished
+    when they are next needed.
+
+    """
+
+    def __init__(self, loop, session_timeout=3600):
+        """Initialize the class.
+
+        Args:
+            loop: EventLoop object in which the sessions run
+            session_timeout: Requested session timeout in seconds
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.loop = loop
+        self._session_timeout = session_timeout
+
+        # Connected clients keyed by OPCUAauth. These are only accessed
+        # from coroutines running in the loop.
+        self._clients = {}
+
+        # asyncio.Lock objects that stop coroutines from connecting to the
+        # same server at the same time, keyed by OPCUAauth
+        self._locks = {}
+
+    async def client(self, auth):
+        """Get a connected client for a server.
+
+        Args:
+            auth: OPCUAauth object
+
+        Returns:
+            result: Connected asyncua Client object
+
+        """
+        # Only one coroutine connects to each server. The others wait for,
+        # and reuse, its session.
+        if auth not in self._locks:
+            self._locks[auth] = asyncio.Lock()
+        async with self._locks[auth]:
+            # Reuse healthy sessions
+            result = self._clients.get(auth)
+            if result is not None:
+                try:
+                    await result.check_connection()
+                    return result
+                except:
+                    log_message = ('''\
+OPC UA session to server {}:{} was lost. Reconnecting.\
+'''.format(auth.ip_target, auth.ip_port))
+                    log.log2info(51019, log_message)
+                    await self.invalidate(auth)
+
+            # Create a new session
+            result = await self._connect(auth)
+            self._clients[auth] = result
+            return result
+
+    async def _connect(self, auth):
+        """Create a session to a server.
+
+        Args:
+            auth: OPCUAauth object
+
+        Returns:
+            result: Connected asyncua Client object
+
+        """
+        # Connect
+        url = 'opc.tcp://{}:{}'.format(auth.ip_target, auth.ip_port)
+        result = Client(url=url)
+        result.set_user(auth.username)
+        result.set_password(auth.password)
+        result.session_timeout = self._session_timeout * 1000
+        await result.connect()
+        return result
+
+    def connected(self, auth, client):
+        """Determine whether a client still holds the session of a server.
+
+        Args:
+            auth: OPCUAauth object
+            client: asyncua Client object
+
+        Returns:
+            result: True if the client's session is the current one
+
+        """
+        # Return
+        result = self._clients.get(auth) is client
+        return result
+
+    async def invalidate(self, auth):
+        """Close the session of a server.
+
+        Args:
+            auth: OPCUAauth object
+
+        Returns:
+            None
+
+        """
+        # Disconnect, ignoring errors from sessions that are already closed
+        client = self._clients.pop(auth, None)
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except:
+            log_message = ('''\
+Error closing OPC UA session to server {}:{}: [{}, {}]\
+'''.format(auth.ip_target, auth.ip_port, sys.exc_info()[0],
+           sys.exc_info()[1]))
+            log.log2info(51020, log_message)
+
+    async def close(self):
+        """Close all sessions.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Disconnect
+        for auth in list(self._clients.keys()):
+            await self.invalidate(auth)
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""Pattoo classes that manage OPC UA subscriptions."""
+
+# Standard libraries
+import threading
+import sys
+
+# PIP libraries
+from asyncua import ua
+
+# Pattoo libraries
+from pattoo_shared.variables import PollingPoint
+from pattoo_shared.data import is_numeric
+from pattoo_shared import log
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT
+from .nodes import NodeResolver
+from .values import convert
+
+
+class Subscriptions():
+    """Manage OPC UA subscriptions and buffer their notifications.
+
+    Servers send notifications when the values of monitored items change
+    by more than their deadband. The values received between polling
+    intervals are aggregated in memory and reported every polling interval.
+    The latest value of a node is reported again if it hasn't changed.
+    Servers are subscribed to again when their sessions are reestablished.
+
+    """
+
+    def __init__(self, sessions, resolver=None):
+        """Initialize the class.
+
+        Args:
+            sessions: Sessions object with the sessions used for
+                subscriptions
+            resolver: NodeResolver object used to resolve browse paths and
+                register nodes
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.sessions = sessions
+        if resolver is None:
+            resolver = NodeResolver(None)
+        self._resolver = resolver
+        self._lock = threading.Lock()
+
+        # Clients holding the subscriptions, keyed by OPCUAauth
+        self._clients = {}
+
+        # Polling point addresses keyed by (OPCUAauth, NodeId)
+        self._addresses = {}
+
+        # Addresses of the monitored items of each OPCUAauth
+        self._monitored = {}
+
+        # Buffered values keyed by (OPCUAauth, address)
+        self._values = {}
+
+    async def subscribe(self, tpp, settings):
+        """Subscribe to the polling points of an OPC UA server.
+
+        This must run in the event loop of the sessions.
+
+        Args:
+            tpp: TargetPollingPoints object
+            settings: OPCUAsubscription object
+
+        Returns:
+            result: True if the server's subscription is active
+
+        """
+        # Subscribe
+        try:
+            await self._subscribe(tpp, settings)
+        except:
+            log_message = ('''\
+OPC UA subscription to server {}:{} failed. Polling the server instead: \
+[{}, {}, {}]'''.format(tpp.target.ip_target, tpp.target.ip_port,
+                       sys.exc_info()[0], sys.exc_info()[1],
+                       sys.exc_info()[2]))
+            log.log2warning(51016, log_message)
+            return False
+        return True
+
+    def active(self, auth):
+        """Determine whether the subscription to a server is active.
+
+        Args:
+            auth: OPCUAauth object
+
+        Returns:
+            result: True if active
+
+        """
+        # Return
+        with self._lock:
+            client = self._clients.get(auth)
+        result = client is not None and self.sessions.connected(
+            auth, client)
+        return result
+
+    def monitored(self, auth):
+        """Get the addresses of the monitored items of a server.
+
+        Args:
+            auth: OPCUAauth object
+
+        Returns:
+            result: Set of polling point addresses
+
+        """
+        # Return
+        with self._lock:
+            result = set(self._monitored.get(auth, []))
+        return result
+
+    def values(self, auth, aggregate='latest'):
+        """Get the values received since the last polling interval.
+
+        Args:
+            auth: OPCUAauth object
+            aggregate: Way of aggregating the values received between
+                polling intervals
+
+        Returns:
+            result: Dict of OPCUAvalue objects keyed by polling point address
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Get values and start a new polling interval
+        with self._lock:
+            for address in self._monitored.get(auth, []):
+                entry = self._values.get((auth, address))
+                if entry is None:
+                    continue
+                result[address] = _aggregate(entry, aggregate)
+                self._values[(auth, address)] = _entry(entry['latest'])
+        return result
+
+    def notification(self, auth, nodeid, value):
+        """Buffer the value received in a notification.
+
+        Args:
+            auth: OPCUAauth object
+            nodeid: NodeId of the monitored item
+            value: OPCUAvalue object
+
+        Returns:
+            None
+
+        """
+        # Update
+        with self._lock:
+            address = self._addresses.get((auth, nodeid))
+            if address is None:
+                return
+            key = (auth, address)
+            entry = self._values.get(key)
+            if entry is None or entry['count'] == 0:
+                self._values[key] = _entry(value, count=1)
+            else:
+                entry['latest'] = value
+                entry['count'] += 1
+                if _numeric(value) is True and is_numeric(
+                        entry['total']) is True:
+                    entry['total'] += value.value
+                    entry['minimum'] = min(entry['minimum'], value.value)
+                    entry['maximum'] = max(entry['maximum'], value.value)
+                else:
+                    entry['total'] = entry['minimum'] = entry[
+                        'maximum'] = None
+
+    async def _subscribe(self, tpp, settings):
+        """Subscribe to the polling points of an OPC UA server.
+
+        Args:
+            tpp: TargetPollingPoints object
+            settings: OPCUAsubscription object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        auth = tpp.target
+        url = 'opc.tcp://{}:{}'.format(auth.ip_target, auth.ip_port)
+        requests = []
+        addresses = []
+
+        # Don't subscribe twice using the same session
+        client = await self.sessions.client(auth)
+        with self._lock:
+            if self._clients.get(auth) is client:
+                return
+
+        # Create the subscription
+        subscription = await client.create_subscription(
+            settings.sampling_interval, _Handler(self, auth))
+
+        # Create monitored items
+        points = [_ for _ in tpp.data if isinstance(_, PollingPoint) is True]
+        nodeids = await self._resolver.nodeids(
+            auth, client, [_.address for _ in points])
+        for point in points:
+            if point.address not in nodeids:
+                continue
+            nodeid = nodeids[point.address]
+            requests.append(_request(
+                nodeid, len(requests) + 1, settings.sampling_interval,
+                settings.deadbands.get(point.address)))
+            addresses.append((nodeid, point.address))
+        results = await subscription.create_monitored_items(requests)
+
+        # Keep track of the monitored items that were created
+        monitored = []
+        with self._lock:
+            for (nodeid, address), result in zip(addresses, results):
+                if isinstance(result, ua.StatusCode) is True:
+                    log_message = ('''\
+Cannot monitor OPC UA node {} on server {}. Polling it instead: {}\
+'''.format(address, url, result))
+                    log.log2warning(51017, log_message)
+                    continue
+                self._addresses[(auth, nodeid)] = address
+                monitored.append(address)
+            self._monitored[auth] = monitored
+            self._clients[auth] = client
+
+
+class _Handler():
+    """Receive OPC UA subscription notifications."""
+
+    def __init__(self, subscriptions, auth):
+        """Initialize the class.
+
+        Args:
+            subscriptions: Subscriptions object
+            auth: OPCUAauth object of the server
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._subscriptions = subscriptions
+        self._auth = auth
+
+    def datachange_notification(self, node, val, data):
+        """Buffer the value of a data change notification.
+
+        Values with a Bad StatusCode and values that can't be reported are
+        ignored.
+
+        Args:
+            node: Node that changed
+            val: Value of the node
+            data: Notification data
+
+        Returns:
+            None
+
+        """
+        # Get the value with its type and timestamps
+        datavalue = data.monitored_item.Value
+        status = datavalue.StatusCode
+        if status.is_good() is False and status.is_uncertain() is False:
+            return
+        value = convert(datavalue)
+
+        # Update
+        if value is not None:
+            self._subscriptions.notification(self._auth, node.nodeid, value)
+
+
+def _request(nodeid, handle, sampling_interval, deadband=None):
+    """Create a request for an OPC UA monitored item.
+
+    Args:
+        nodeid: NodeId to monitor
+        handle: Client handle of the monitored item
+        sampling_interval: Sampling interval in milliseconds
+        deadband: Absolute deadband. Every change is reported if None.
+
+    Returns:
+        result: MonitoredItemCreateRequest object
+
+    """
+    # Monitor the value of the node
+    item = ua.ReadValueId()
+    item.NodeId = nodeid
+    item.AttributeId = ua.AttributeIds.Value
+
+    # Set the parameters
+    parameters = ua.MonitoringParameters()
+    parameters.ClientHandle = handle
+    parameters.SamplingInterval = sampling_interval
+    parameters.QueueSize = 1
+    parameters.DiscardOldest = True
+    if deadband is not None:
+        _filter = ua.DataChangeFilter()
+        _filter.Trigger = ua.DataChangeTrigger.StatusValue
+        _filter.DeadbandType = ua.DeadbandType.Absolute
+        _filter.DeadbandValue = deadband
+        parameters.Filter = _filter
+
+    # Return
+    result = ua.MonitoredItemCreateRequest()
+    result.ItemToMonitor = item
+    result.MonitoringMode = ua.MonitoringMode.Reporting
+    result.RequestedParameters = parameters
+    return result
+
+
+def _entry(value, count=0):
+    """Create a buffer entry for the values of a node.
+
+    Args:
+        value: Latest OPCUAvalue of the node
+        count: Number of values received in the polling interval
+
+    Returns:
+        result: Dict of the aggregates of the values
+
+    """
+    # Return
+    if _numeric(value) is True:
+        result = {'latest': value, 'count': count,
+                  'total': value.value * count,
+                  'minimum': value.value, 'maximum': value.value}
+    else:
+        result = {'latest': value, 'count': count, 'total': None,
+                  'minimum': None, 'maximum': None}
+    return result
+
+
+def _aggregate(entry, aggregate):
+    """Aggregate the values received in a polling interval.
+
+    Args:
+        entry: Buffer entry of a node
+        aggregate: Way of aggregating the values
+
+    Returns:
+        result: OPCUAvalue object with the aggregated value and the
+            timestamp of the latest value. The latest value if no values
+            were received in the polling interval, or if the values can't
+            be aggregated.
+
+    """
+    # Initialize key variables
+    result = entry['latest']
+    if entry['count'] == 0 or entry['total'] is None:
+        return result
+
+    # Aggregate
+    if aggregate == 'average':
+        result = result._replace(
+            value=entry['total'] / entry['count'], data_type=DATA_FLOAT)
+    elif aggregate == 'minimum':
+        result = result._replace(value=entry['minimum'])
+    elif aggregate == 'maximum':
+        result = result._replace(value=entry['maximum'])
+    return result
+
+
+def _numeric(value):
+    """Determine whether an OPCUAvalue can be aggregated.
+
+    Args:
+        value: OPCUAvalue object
+
+    Returns:
+        result: True if numeric
+
+    """
+    # Return
+    result = value.data_type in [DATA_INT, DATA_FLOAT] and is_numeric(
+        value.value) is True
+    return result
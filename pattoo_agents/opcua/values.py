@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Pattoo library that converts the values of OPC UA nodes."""
+
+# Standard libraries
+import datetime
+
+# PIP libraries
+from asyncua import ua
+
+# Pattoo libraries
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT, DATA_STRING
+from .constants import OPCUAvalue
+
+
+def _text(value):
+    """Convert a LocalizedText value to a string."""
+    return value.Text
+
+
+def _datetime(value):
+    """Convert a DateTime value to an ISO 8601 string."""
+    return value.isoformat()
+
+
+def _nodeid(value):
+    """Convert a NodeId value to a string."""
+    return value.to_string()
+
+
+# Pattoo data type and conversion function for each OPC UA variant type.
+# Values of other types, such as ByteStrings and ExtensionObjects, are not
+# reported.
+_DATA_TYPES = {
+    ua.VariantType.Boolean: (DATA_INT, int),
+    ua.VariantType.SByte: (DATA_INT, int),
+    ua.VariantType.Byte: (DATA_INT, int),
+    ua.VariantType.Int16: (DATA_INT, int),
+    ua.VariantType.UInt16: (DATA_INT, int),
+    ua.VariantType.Int32: (DATA_INT, int),
+    ua.VariantType.UInt32: (DATA_INT, int),
+    ua.VariantType.Int64: (DATA_INT, int),
+    ua.VariantType.UInt64: (DATA_INT, int),
+    ua.VariantType.Float: (DATA_FLOAT, float),
+    ua.VariantType.Double: (DATA_FLOAT, float),
+    ua.VariantType.String: (DATA_STRING, str),
+    ua.VariantType.LocalizedText: (DATA_STRING, _text),
+    ua.VariantType.DateTime: (DATA_STRING, _datetime),
+    ua.VariantType.Guid: (DATA_STRING, str),
+    ua.VariantType.NodeId: (DATA_STRING, _nodeid),
+    ua.VariantType.StatusCode: (DATA_STRING, str),
+    ua.VariantType.QualifiedName: (DATA_STRING, _nodeid),
+}
+
+
+def convert(datavalue):
+    """Convert the DataValue of a node.
+
+    Args:
+        datavalue: DataValue object with a good or uncertain StatusCode
+
+    Returns:
+        result: OPCUAvalue object. None if the value is empty, an array or
+            of a type that can't be reported.
+
+    """
+    # Initialize key variables
+    variant = datavalue.Value
+    if variant is None or variant.Value is None:
+        return None
+    if bool(variant.Dimensions) is True or isinstance(
+            variant.Value, (list, tuple)) is True:
+        return None
+    if variant.VariantType not in _DATA_TYPES:
+        return None
+
+    # Convert the value
+    (data_type, function) = _DATA_TYPES[variant.VariantType]
+    try:
+        value = function(variant.Value)
+    except:
+        return None
+
+    # Prefer the time at which the value was sampled by its source
+    timestamp = timestamp_ms(datavalue.SourceTimestamp)
+    if timestamp is None:
+        timestamp = timestamp_ms(datavalue.ServerTimestamp)
+
+    # Return
+    result = OPCUAvalue(value=value, data_type=data_type, timestamp=timestamp)
+    return result
+
+
+def timestamp_ms(value):
+    """Convert an OPC UA DateTime to a timestamp in milliseconds.
+
+    Args:
+        value: datetime object. OPC UA DateTimes are UTC.
+
+    Returns:
+        result: Timestamp in milliseconds. None if value isn't a datetime.
+
+    """
+    # Initialize key variables
+    if isinstance(value, datetime.datetime) is False:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    # Return
+    result = int(value.timestamp() * 1000)
+    return result
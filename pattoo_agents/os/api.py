@@ -1,19 +1,98 @@
 #!/usr/bin/env python3
 """This is a test of flask."""
 
+# Standard libraries
+import threading
+
 # Pip packages
-from flask import Flask, jsonify
+from flask import Flask, Response, request
 
 # Pattoo imports
 from pattoo_agents.os import collector
 from pattoo_shared import converter
 from .constants import (
     PATTOO_AGENT_OS_SPOKED_API_PREFIX, PATTOO_AGENT_OS_SPOKED)
+from .configuration import ConfigSpoked
+from .disk import DiskUsage
+from .metadata import HostMetadata
+from .processes import ProcessStats
+from .cgroups import CgroupStats
+from .snapshot import Snapshots
+from .payload import Payload, ENCODINGS
 
 
 # Define flask parameters
 API = Flask(__name__)
 
+# Objects shared between requests. They are created on the first request
+# so that importing the module neither reads the configuration nor starts
+# threads in the process that later forks the Gunicorn workers.
+_RESOURCES = None
+_LOCK = threading.Lock()
+
+
+class _Resources():
+    """Objects shared between requests."""
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Reuse the disk usage thread pool between requests so that stale
+        # mounts aren't read again while their reads are outstanding. Reuse
+        # the metadata of the host so that DNS isn't queried on every
+        # request.
+        config = ConfigSpoked()
+        self.disk_usage = DiskUsage(
+            workers=config.disk_usage_workers(),
+            timeout=config.disk_usage_timeout(),
+            filters=config.disk_filters())
+        self.host_metadata = HostMetadata(
+            refresh_interval=config.metadata_refresh_interval())
+
+        # Per process usage is calculated from the previous request's
+        # samples
+        self.process_stats = None
+        if bool(config.process_top()) is True:
+            self.process_stats = ProcessStats(top=config.process_top())
+
+        # Filters are compiled once
+        self.per_cpu = config.per_cpu()
+        self.nic_filter = config.nic_filter()
+        self.disk_io_filter = config.disk_io_filter()
+
+        # Cgroups are only listed again when the cgroup tree changes
+        self.cgroup_stats = None
+        if config.cgroup_stats() is True:
+            self.cgroup_stats = CgroupStats()
+
+        # Requests from several hubs share recently collected data
+        self.snapshots = Snapshots(ttl=config.snapshot_ttl())
+
+
+def _resources():
+    """Get the objects shared between requests, creating them if required.
+
+    Args:
+        None
+
+    Returns:
+        _RESOURCES: _Resources object
+
+    """
+    # Create once
+    global _RESOURCES
+    with _LOCK:
+        if _RESOURCES is None:
+            _RESOURCES = _Resources()
+    return _RESOURCES
+
 
 @API.route(
     '{}/<int:polling_interval>'.format(PATTOO_AGENT_OS_SPOKED_API_PREFIX))
@@ -24,11 +103,49 @@ def home(polling_interval):
         polling_interval: Polling interval of the requester
 
     Returns:
-        None
+        response: Response object
+
+    """
+    # Process
+    resources = _resources()
+    payload = resources.snapshots.get(
+        polling_interval, lambda: _poll(resources, polling_interval))
+
+    # Present. Nothing is sent if the requester already has the data, and
+    # the data is compressed if the requester accepts it.
+    if request.if_none_match.contains_weak(payload.etag) is True:
+        response = Response(status=304)
+    else:
+        encoding = request.accept_encodings.best_match(ENCODINGS)
+        response = Response(
+            payload.body(encoding), mimetype='application/json')
+        if encoding is not None:
+            response.content_encoding = encoding
+    response.set_etag(payload.etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _poll(resources, polling_interval):
+    """Collect the data of the host.
+
+    Args:
+        resources: _Resources object
+        polling_interval: Polling interval of the requester
+
+    Returns:
+        result: Payload object of the data to present
 
     """
-    # Process and present
-    agentdata = collector.poll(PATTOO_AGENT_OS_SPOKED, polling_interval)
+    # Process
+    agentdata = collector.poll(
+        PATTOO_AGENT_OS_SPOKED, polling_interval,
+        disk_usage=resources.disk_usage,
+        host_metadata=resources.host_metadata,
+        process_stats=resources.process_stats,
+        cgroup_stats=resources.cgroup_stats, per_cpu=resources.per_cpu,
+        nic_filter=resources.nic_filter,
+        disk_io_filter=resources.disk_io_filter)
     pdp = converter.agentdata_to_post(agentdata)
-    result = converter.posting_data_points(pdp)
-    return jsonify(result)
+    result = Payload(converter.posting_data_points(pdp))
+    return result
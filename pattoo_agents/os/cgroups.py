@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Pattoo classes that collect the resource usage of cgroup v2 groups."""
+
+# Standard libraries
+import os
+import re
+import threading
+import time
+
+# Pattoo libraries
+from pattoo_shared.variables import DataPoint, DataPointMetadata
+from pattoo_shared.constants import DATA_INT, DATA_COUNT64
+from pattoo_shared import log
+
+# Mountpoint of the cgroup v2 hierarchy
+CGROUP_ROOT = '/sys/fs/cgroup'
+
+# Regular expressions matching the names of the cgroups of systemd services
+# and containers
+CGROUP_PATTERNS = [r'\.service$', r'\.scope$']
+
+
+class CgroupStats():
+    """Collect the resource usage of systemd services and containers.
+
+    Walking the whole cgroup tree every polling interval is expensive on
+    hosts with many cgroups. Instead, the modification time of every
+    directory that was walked is checked, and only directories that changed
+    are listed again. Matching cgroups are not descended into. The whole
+    tree is walked again every rescan_interval seconds in case changes were
+    missed.
+
+    """
+
+    def __init__(self, root=CGROUP_ROOT, patterns=None, rescan_interval=3600):
+        """Initialize the class.
+
+        Args:
+            root: Mountpoint of the cgroup v2 hierarchy
+            patterns: List of regular expressions matching the names of
+                the cgroups to report
+            rescan_interval: Seconds after which the whole tree is walked
+                again
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if patterns is None:
+            patterns = CGROUP_PATTERNS
+        self._root = root
+        self._regexes = [re.compile(_) for _ in patterns]
+        self._rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self._timestamp = None
+
+        # Modification times of the walked directories, and the cgroups
+        # and other directories found in each of them, keyed by directory
+        self._mtimes = {}
+        self._cgroups = {}
+        self._children = {}
+
+        # Whether a cgroup v2 hierarchy is mounted on the root
+        self._mounted = os.path.isfile(
+            os.path.join(root, 'cgroup.controllers'))
+        if self._mounted is False:
+            log_message = ('''\
+No cgroup v2 hierarchy is mounted on {}. Cgroups will not be reported.\
+'''.format(root))
+            log.log2info(51053, log_message)
+
+    def cgroups(self, now=None):
+        """Get the cgroups whose usage is reported.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: Sorted list of cgroup directories
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time.time()
+
+        # Walk the tree again when it is due, otherwise only the changes
+        with self._lock:
+            if self._timestamp is None or (
+                    now - self._timestamp >= self._rescan_interval):
+                self._mtimes = {}
+                self._cgroups = {}
+                self._children = {}
+                self._timestamp = now
+            self._scan(self._root)
+            result = sorted(
+                cgroup for cgroups in self._cgroups.values()
+                for cgroup in cgroups)
+        return result
+
+    def datapoints(self, metadata=None, now=None):
+        """Get the DataPoints of the cgroups.
+
+        Args:
+            metadata: List of DataPointMetadata objects of the host
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: List of DataPoint objects
+
+        """
+        # Initialize key variables
+        result = []
+        if self._mounted is False:
+            return result
+
+        # Read the usage of each cgroup. Cgroups may be removed while they
+        # are being read.
+        for directory in self.cgroups(now=now):
+            meta = DataPointMetadata(
+                'cgroup', os.path.relpath(directory, self._root))
+            for key, value, data_type in usage(directory):
+                _dv = DataPoint(key, value, data_type=data_type)
+                _dv.add(meta)
+                _dv.add(metadata)
+                result.append(_dv)
+        return result
+
+    def _scan(self, directory):
+        """List directories that changed since they were last listed.
+
+        Args:
+            directory: Directory to check
+
+        Returns:
+            None
+
+        """
+        # Forget directories that were removed
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._forget(directory)
+            return
+
+        # List the directory if it changed
+        if self._mtimes.get(directory) != mtime:
+            cgroups = []
+            children = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) is False:
+                            continue
+                        if self._matches(entry.name) is True:
+                            cgroups.append(entry.path)
+                        else:
+                            children.append(entry.path)
+            except OSError:
+                self._forget(directory)
+                return
+            for child in set(self._children.get(directory, [])) - set(
+                    children):
+                self._forget(child)
+            self._mtimes[directory] = mtime
+            self._cgroups[directory] = cgroups
+            self._children[directory] = children
+
+        # Check the directories below
+        for child in self._children.get(directory, []):
+            self._scan(child)
+
+    def _forget(self, directory):
+        """Forget a directory and the directories below it.
+
+        Args:
+            directory: Directory
+
+        Returns:
+            None
+
+        """
+        # Forget
+        for child in self._children.pop(directory, []):
+            self._forget(child)
+        self._mtimes.pop(directory, None)
+        self._cgroups.pop(directory, None)
+
+    def _matches(self, name):
+        """Determine whether the usage of a cgroup is reported.
+
+        Args:
+            name: Name of the cgroup
+
+        Returns:
+            result: True if reported
+
+        """
+        # Return
+        result = any(
+            bool(regex.search(name)) is True for regex in self._regexes)
+        return result
+
+
+def usage(directory):
+    """Read the resource usage of a cgroup.
+
+    Args:
+        directory: Directory of the cgroup
+
+    Returns:
+        result: List of (key, value, data_type) tuples. Controllers that
+            aren't enabled for the cgroup are skipped.
+
+    """
+    # Initialize key variables
+    result = []
+
+    # CPU time in microseconds
+    for key, value in _read_keyed(os.path.join(directory, 'cpu.stat')):
+        result.append(('cgroup_cpu_{}'.format(key), value, DATA_COUNT64))
+
+    # Memory and number of processes
+    for filename, key in [
+            ('memory.current', 'cgroup_memory_current'),
+            ('pids.current', 'cgroup_pids_current')]:
+        value = _read_value(os.path.join(directory, filename))
+        if value is not None:
+            result.append((key, value, DATA_INT))
+
+    # I/O summed over all devices
+    totals = {}
+    for line in _read_lines(os.path.join(directory, 'io.stat')):
+        for field in line.split()[1:]:
+            (key, _, value) = field.partition('=')
+            if value.isdigit() is True:
+                totals[key] = totals.get(key, 0) + int(value)
+    for key in sorted(totals):
+        result.append(
+            ('cgroup_io_{}'.format(key), totals[key], DATA_COUNT64))
+    return result
+
+
+def _read_lines(filename):
+    """Read the lines of a cgroup file.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: List of lines. Empty if the file can't be read.
+
+    """
+    # Return
+    try:
+        with open(filename, 'r') as f_handle:
+            result = f_handle.read().splitlines()
+    except OSError:
+        result = []
+    return result
+
+
+def _read_keyed(filename):
+    """Read a cgroup file of "key value" lines.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: List of (key, value) tuples
+
+    """
+    # Return
+    result = []
+    for line in _read_lines(filename):
+        fields = line.split()
+        if len(fields) == 2 and fields[1].isdigit() is True:
+            result.append((fields[0], int(fields[1])))
+    return result
+
+
+def _read_value(filename):
+    """Read a cgroup file containing a single number.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: Number. None if the file can't be read or is "max".
+
+    """
+    # Return
+    lines = _read_lines(filename)
+    if bool(lines) is False or lines[0].strip().isdigit() is False:
+        return None
+    result = int(lines[0].strip())
+    return result
@@ -3,9 +3,6 @@
 
 # Standard libraries
 import os
-import re
-import platform
-import socket
 
 # pip3 libraries
 import psutil
@@ -15,9 +12,25 @@ from pattoo_shared.variables import (
     DataPoint, DataPointMetadata, TargetDataPoints, AgentPolledData)
 from pattoo_shared.constants import (
     DATA_INT, DATA_COUNT64, DATA_FLOAT)
+from pattoo_agents.os import proc
+from pattoo_agents.os.disk import DiskUsage
+from pattoo_agents.os.metadata import HOST_METADATA
+from pattoo_agents.os.filters import DeviceFilter
+from pattoo_agents.os.constants import DISK_IO_EXCLUDE
 
+# Default filters, compiled once
+NIC_FILTER = DeviceFilter()
+DISK_IO_FILTER = DeviceFilter(exclude=DISK_IO_EXCLUDE)
 
-def poll(agent_program, polling_interval):
+# Default DiskUsage object. It is shared between polls so that partitions
+# with outstanding reads are skipped.
+DISK_USAGE = DiskUsage()
+
+
+def poll(agent_program, polling_interval, disk_usage=DISK_USAGE,
+         host_metadata=HOST_METADATA, process_stats=None, cgroup_stats=None,
+         sampler=None, per_cpu=False, nic_filter=NIC_FILTER,
+         disk_io_filter=DISK_IO_FILTER):
     """Get all agent data.
 
     Performance data on linux server on which this application is installed.
@@ -25,13 +38,25 @@ def poll(agent_program, polling_interval):
     Args:
         agentdata: AgentPolledData object for all data gathered by the agent
         polling_interval: Polling interval in seconds
+        disk_usage: DiskUsage object used to get the usage of partitions
+        host_metadata: HostMetadata object with the cached metadata of the
+            host
+        process_stats: ProcessStats object used to get the usage of the top
+            processes. Processes are not reported if None.
+        cgroup_stats: CgroupStats object used to get the usage of services
+            and containers. Cgroups are not reported if None.
+        sampler: Sampler object with the samples taken since the previous
+            poll. Samples are not reported if None.
+        per_cpu: Report the times of each CPU if True
+        nic_filter: DeviceFilter object of the network interfaces to report
+        disk_io_filter: DeviceFilter object of the disks whose I/O to report
 
     Returns:
         None
 
     """
     # Initialize AgentPolledData
-    agent_hostname = socket.getfqdn()
+    agent_hostname = host_metadata.hostname()
     agentdata = AgentPolledData(agent_program, polling_interval)
 
     # Intialize data gathering
@@ -41,18 +66,30 @@ def poll(agent_program, polling_interval):
     # Get timeseries values
     #########################################################################
 
-    performance = Performance()
+    performance = Performance(host_metadata.metadata())
 
     # Update agent with system data
-    ddv.add(performance.stats_system())
+    ddv.add(performance.stats_system(per_cpu=per_cpu))
 
     # Update agent with disk data
     ddv.add(performance.stats_disk_swap())
-    ddv.add(performance.stats_disk_partitions())
-    ddv.add(performance.stats_disk_io())
+    ddv.add(performance.stats_disk_partitions(disk_usage))
+    ddv.add(performance.stats_disk_io(disk_io_filter))
 
     # Update agent with network data
-    ddv.add(performance.stats_network())
+    ddv.add(performance.stats_network(nic_filter))
+
+    # Update agent with process data
+    if process_stats is not None:
+        ddv.add(performance.stats_processes(process_stats))
+
+    # Update agent with service and container data
+    if cgroup_stats is not None:
+        ddv.add(performance.stats_cgroups(cgroup_stats))
+
+    # Update agent with the summary of samples
+    if sampler is not None:
+        ddv.add(performance.stats_samples(sampler))
 
     # Add results to the AgentPolledData object for posting
     agentdata.add(ddv)
@@ -62,12 +99,11 @@ def poll(agent_program, polling_interval):
 class Performance():
     """Operating system performance."""
 
-    def __init__(self):
+    def __init__(self, metadata):
         """Initialize the class.
 
         Args:
-            key: Metadata key
-            value: Metadata value
+            metadata: List of DataPointMetadata objects of the host
 
         Returns:
             None
@@ -76,85 +112,54 @@ class Performance():
         #######################################################################
         # Set non timeseries values
         #######################################################################
-        self.metadata = []
-
-        # OS release (kernel)
-        self.metadata.append(
-            DataPointMetadata(
-                'release', platform.release(), update_checksum=False))
-
-        # OS version
-        self.metadata.append(
-            DataPointMetadata(
-                'version', platform.version(), update_checksum=False))
-
-        # Operating sytem type (Linux / Windows)
-        self.metadata.append(
-            DataPointMetadata('processor', platform.processor()))
-
-        # Operating sytem type (Linux / Windows)
-        self.metadata.append(
-            DataPointMetadata('type', platform.system()))
-
-        # CPU count
-        self.metadata.append(
-            DataPointMetadata('cpus', psutil.cpu_count()))
+        self.metadata = metadata
 
-        # System name
-        self.metadata.append(
-            DataPointMetadata('hostname', socket.getfqdn()))
-
-    def stats_system(self):
+    def stats_system(self, per_cpu=False):
         """Update agent with system data.
 
         Args:
-            ddv: TargetDataPoints object
+            per_cpu: Report the times of each CPU if True
 
         Returns:
             result: List of DataPoint objects
 
         """
+        # Read each source of system data once
+        snapshot = proc.snapshot()
+        if snapshot is None:
+            snapshot = _psutil_snapshot()
+
         #######################################################################
         # Set timeseries values (Integers)
         #######################################################################
         result = []
 
-        result.append(
-            DataPoint(
-                'process_count',
-                len(psutil.pids()),
-                data_type=DATA_INT).add(self.metadata))
+        _dv = DataPoint(
+            'process_count', snapshot.process_count, data_type=DATA_INT)
+        _dv.add(self.metadata)
+        result.append(_dv)
 
         # Load averages
-        (la_01, la_05, la_15) = os.getloadavg()
-
-        result.append(
-            DataPoint(
-                'load_average_01min',
-                la_01,
-                data_type=DATA_INT).add(self.metadata))
-
-        result.append(
-            DataPoint(
-                'load_average_05min',
-                la_05,
-                data_type=DATA_INT).add(self.metadata))
-
-        result.append(
-            DataPoint(
-                'load_average_15min',
-                la_15,
-                data_type=DATA_INT).add(self.metadata))
+        (la_01, la_05, la_15) = snapshot.load_averages
+        for key, value in [
+                ('load_average_01min', la_01),
+                ('load_average_05min', la_05),
+                ('load_average_15min', la_15)]:
+            _dv = DataPoint(key, value, data_type=DATA_INT)
+            _dv.add(self.metadata)
+            result.append(_dv)
 
         #######################################################################
         # Set timeseries values (Floats)
         #######################################################################
 
-        result.append(
-            DataPoint(
-                'cpu_frequency',
-                psutil.cpu_freq().current,
-                data_type=DATA_FLOAT).add(self.metadata))
+        # The frequency isn't available on some virtual machines
+        frequency = psutil.cpu_freq()
+        if frequency is not None:
+            _dv = DataPoint(
+                'cpu_frequency', frequency.current, data_type=DATA_FLOAT)
+            _dv.add(self.metadata)
+            result.append(_dv)
 
         #######################################################################
         # Set timeseries values (Named Tuples)
@@ -162,32 +167,44 @@ class Performance():
 
         # Percentage CPU utilization
         result.extend(_named_tuple_to_dv(
-            psutil.cpu_times_percent(),
+            snapshot.cpu_times_percent,
             'cpu_times_percent',
             data_type=DATA_FLOAT,
             metadata=self.metadata))
 
         # Get CPU runtimes
         result.extend(_named_tuple_to_dv(
-            psutil.cpu_times(),
+            snapshot.cpu_times,
             'cpu_times',
             data_type=DATA_COUNT64,
             metadata=self.metadata))
 
         # Get CPU stats
         result.extend(_named_tuple_to_dv(
-            psutil.cpu_stats(),
+            snapshot.cpu_stats,
             'cpu_stats',
             data_type=DATA_COUNT64,
             metadata=self.metadata))
 
         # Get memory utilization
         result.extend(_named_tuple_to_dv(
-            psutil.virtual_memory(),
+            snapshot.memory,
             'memory',
             data_type=DATA_INT,
             metadata=self.metadata))
 
+        # Get the runtimes of each CPU
+        if per_cpu is True:
+            for cpu, cpu_times in snapshot.per_cpu_times:
+                meta = DataPointMetadata('cpu_core', cpu)
+                for _dv in _named_tuple_to_dv(
+                        cpu_times,
+                        'cpu_core_times',
+                        data_type=DATA_COUNT64,
+                        metadata=self.metadata):
+                    _dv.add(meta)
+                    result.append(_dv)
+
         # Return
         return result
 
@@ -222,11 +239,11 @@ class Performance():
         # Add the result to data
         return result
 
-    def stats_disk_partitions(self):
+    def stats_disk_partitions(self, disk_usage):
         """Update agent with disk partition data.
 
         Args:
-            ddv: TargetDataPoints object
+            disk_usage: DiskUsage object
 
         Returns:
             None
@@ -236,53 +253,66 @@ class Performance():
         result = []
 
         # Get filesystem partition utilization
-        items = psutil.disk_partitions()
+        items = disk_usage.partitions()
+        usages = disk_usage.usage(items)
         # "items" is a list of named tuples describing partitions
         for item in items:
             # "source" is the partition mount point
             mountpoint = item.mountpoint
-            if "docker" not in str(mountpoint):
-                # Add more metadata
-                meta = []
-                meta.append(DataPointMetadata(
-                    '{}_device'.format('disk_partition'),
-                    item.device))
-                meta.append(DataPointMetadata(
-                    '{}_mountpoint'.format('disk_partition'),
-                    item.mountpoint))
-                meta.append(DataPointMetadata(
-                    '{}_fstype'.format('disk_partition'),
-                    item.fstype))
-                meta.append(DataPointMetadata(
-                    '{}_opts'.format('disk_partition'),
-                    item.opts))
-
-                # Get the partition data
-                partition = psutil.disk_usage(mountpoint)._asdict()
-                for key, value in partition.items():
-                    _dv = DataPoint(
-                        '{}_disk_usage_{}'.format(
-                            'disk_partition', key),
-                        value, data_type=DATA_INT)
-                    _dv.add(meta)
-                    _dv.add(self.metadata)
-                    result.append(_dv)
+            if mountpoint not in usages:
+                continue
+
+            # Add more metadata
+            meta = []
+            meta.append(DataPointMetadata(
+                '{}_device'.format('disk_partition'),
+                item.device))
+            meta.append(DataPointMetadata(
+                '{}_mountpoint'.format('disk_partition'),
+                item.mountpoint))
+            meta.append(DataPointMetadata(
+                '{}_fstype'.format('disk_partition'),
+                item.fstype))
+            meta.append(DataPointMetadata(
+                '{}_opts'.format('disk_partition'),
+                item.opts))
+
+            # Mark partitions that didn't respond in time as stale
+            usage = usages[mountpoint]
+            _dv = DataPoint(
+                '{}_stale'.format('disk_partition'),
+                int(usage is None), data_type=DATA_INT)
+            _dv.add(meta)
+            _dv.add(self.metadata)
+            result.append(_dv)
+            if usage is None:
+                continue
+
+            # Get the partition data
+            partition = usage._asdict()
+            for key, value in partition.items():
+                _dv = DataPoint(
+                    '{}_disk_usage_{}'.format(
+                        'disk_partition', key),
+                    value, data_type=DATA_INT)
+                _dv.add(meta)
+                _dv.add(self.metadata)
+                result.append(_dv)
 
         # Add the result to data
         return result
 
-    def stats_disk_io(self):
+    def stats_disk_io(self, disk_io_filter=DISK_IO_FILTER):
         """Update agent with disk io data.
 
         Args:
-            ddv: TargetDataPoints object
+            disk_io_filter: DeviceFilter object of the disks to report
 
         Returns:
             None
 
         """
         # Initialize key variables
-        regex = re.compile(r'^ram\d+$')
         result = []
 
         # Get disk I/O usage
@@ -290,11 +320,8 @@ class Performance():
 
         # "source" is disk name
         for disk, disk_named_tuple in ioddv.items():
-            # No RAM pseudo disks. RAM disks OK.
-            if bool(regex.match(disk)) is True:
-                continue
-            # No loopbacks
-            if disk.startswith('loop') is True:
+            # No RAM pseudo disks or loopbacks by default
+            if disk_io_filter.included(disk) is False:
                 continue
 
             # Populate data
@@ -309,11 +336,11 @@ class Performance():
         # Add the result to data
         return result
 
-    def stats_network(self):
+    def stats_network(self, nic_filter=NIC_FILTER):
         """Update agent with network data.
 
         Args:
-            ddv: TargetDataPoints object
+            nic_filter: DeviceFilter object of the interfaces to report
 
         Returns:
             None
@@ -325,6 +352,8 @@ class Performance():
         # Get network utilization
         nicddv = psutil.net_io_counters(pernic=True)
         for nic, nic_named_tuple in nicddv.items():
+            if nic_filter.included(nic) is False:
+                continue
             nic_dict = nic_named_tuple._asdict()
             for key, value in nic_dict.items():
                 _dv = DataPoint(
@@ -340,6 +369,72 @@ class Performance():
         # Add the result to data
         return result
 
+    def stats_processes(self, process_stats):
+        """Update agent with the data of the top processes.
+
+        Args:
+            process_stats: ProcessStats object
+
+        Returns:
+            result: List of DataPoint objects
+
+        """
+        # Return
+        result = process_stats.datapoints(metadata=self.metadata)
+        return result
+
+    def stats_cgroups(self, cgroup_stats):
+        """Update agent with the data of services and containers.
+
+        Args:
+            cgroup_stats: CgroupStats object
+
+        Returns:
+            result: List of DataPoint objects
+
+        """
+        # Return
+        result = cgroup_stats.datapoints(metadata=self.metadata)
+        return result
+
+    def stats_samples(self, sampler):
+        """Update agent with the summary of samples taken between polls.
+
+        Args:
+            sampler: Sampler object
+
+        Returns:
+            result: List of DataPoint objects
+
+        """
+        # Return
+        result = sampler.datapoints(metadata=self.metadata)
+        return result
+
+
+def _psutil_snapshot():
+    """Get the statistics of the system using psutil.
+
+    This is used on systems without a readable /proc filesystem.
+
+    Args:
+        None
+
+    Returns:
+        result: proc.Snapshot object
+
+    """
+    # Return
+    result = proc.Snapshot(
+        load_averages=os.getloadavg(),
+        process_count=len(psutil.pids()),
+        cpu_times=psutil.cpu_times(),
+        cpu_times_percent=psutil.cpu_times_percent(),
+        cpu_stats=psutil.cpu_stats(),
+        memory=psutil.virtual_memory(),
+        per_cpu_times=list(enumerate(psutil.cpu_times(percpu=True))))
+    return result
+
 
 def _named_tuple_to_dv(
         values, parameter_label, data_type=DATA_INT, metadata=None):
@@ -6,23 +6,25 @@ from pattoo_shared import configuration
 from pattoo_shared.configuration import Config
 from pattoo_shared import files
 from .constants import (
-    PATTOO_AGENT_OS_SPOKED, PATTOO_AGENT_OS_HUBD, PATTOO_AGENT_OS_AUTONOMOUSD)
+    PATTOO_AGENT_OS_SPOKED, PATTOO_AGENT_OS_HUBD, PATTOO_AGENT_OS_AUTONOMOUSD,
+    DiskFilters, DISK_FILTERS, DISK_IO_EXCLUDE)
+from .filters import DeviceFilter
 
 
-class ConfigSpoked(Config):
-    """Class gathers all configuration information.
+class ConfigCollector(Config):
+    """Class for the configuration of the data collected by OS agents.
 
     Only processes the following YAML keys in the configuration file:
 
-        The value of the PATTOO_AGENT_OS_SPOKED constant
+        The value of the agent_program
 
     """
 
-    def __init__(self):
+    def __init__(self, agent_program):
         """Initialize the class.
 
         Args:
-            None
+            agent_program: Name of the agent program
 
         Returns:
             None
@@ -32,10 +34,238 @@ class ConfigSpoked(Config):
         Config.__init__(self)
 
         # Get the configuration
-        config_file = configuration.agent_config_filename(
-            PATTOO_AGENT_OS_SPOKED)
+        self._agent_program = agent_program
+        config_file = configuration.agent_config_filename(agent_program)
         self._agent_config = files.read_yaml_file(config_file)
 
+    def disk_usage_timeout(self):
+        """Get disk_usage_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'disk_usage_timeout'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 5
+        if bool(intermediate) is False:
+            result = 5
+        else:
+            result = abs(float(intermediate))
+        return result
+
+    def disk_usage_workers(self):
+        """Get disk_usage_workers.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'disk_usage_workers'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 4
+        if bool(intermediate) is False:
+            result = 4
+        else:
+            result = max(abs(int(intermediate)), 1)
+        return result
+
+    def metadata_refresh_interval(self):
+        """Get metadata_refresh_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'metadata_refresh_interval'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 3600
+        if bool(intermediate) is False:
+            result = 3600
+        else:
+            result = abs(int(intermediate))
+        return result
+
+    def process_top(self):
+        """Get process_top.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'process_top'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 0, which disables per process data
+        if bool(intermediate) is False:
+            result = 0
+        else:
+            result = abs(int(intermediate))
+        return result
+
+    def cgroup_stats(self):
+        """Get cgroup_stats.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'cgroup_stats'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to False
+        result = bool(intermediate)
+        return result
+
+    def per_cpu(self):
+        """Get per_cpu.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = self._agent_program
+        sub_key = 'per_cpu'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to False
+        result = bool(intermediate)
+        return result
+
+    def nic_filter(self):
+        """Get the filter of the network interfaces that are reported.
+
+        Args:
+            None
+
+        Returns:
+            result: DeviceFilter object
+
+        """
+        # Return
+        result = DeviceFilter(
+            include=self._list('include_nics', []),
+            exclude=self._list('exclude_nics', []))
+        return result
+
+    def disk_io_filter(self):
+        """Get the filter of the disks whose I/O is reported.
+
+        Args:
+            None
+
+        Returns:
+            result: DeviceFilter object
+
+        """
+        # Return
+        result = DeviceFilter(
+            include=self._list('include_disks', []),
+            exclude=self._list('exclude_disks', DISK_IO_EXCLUDE))
+        return result
+
+    def disk_filters(self):
+        """Get the filters of the partitions whose usage is collected.
+
+        Args:
+            None
+
+        Returns:
+            result: DiskFilters object
+
+        """
+        # Return
+        result = DiskFilters(**{
+            _: self._list(_, getattr(DISK_FILTERS, _))
+            for _ in DiskFilters._fields})
+        return result
+
+    def _list(self, sub_key, default):
+        """Get a list of strings.
+
+        Args:
+            sub_key: Configuration key
+            default: Default list
+
+        Returns:
+            result: List of strings
+
+        """
+        # Get result
+        key = self._agent_program
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Allow a single string
+        if intermediate is None:
+            result = default
+        elif isinstance(intermediate, list) is True:
+            result = [str(_) for _ in intermediate]
+        else:
+            result = [str(intermediate)]
+        return result
+
+
+class ConfigSpoked(ConfigCollector):
+    """Class gathers all configuration information.
+
+    Only processes the following YAML keys in the configuration file:
+
+        The value of the PATTOO_AGENT_OS_SPOKED constant
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Instantiate inheritance
+        ConfigCollector.__init__(self, PATTOO_AGENT_OS_SPOKED)
+
     def ip_listen_address(self):
         """Get ip_listen_address.
 
@@ -80,6 +310,29 @@ class ConfigSpoked(Config):
             result = int(intermediate)
         return result
 
+    def snapshot_ttl(self):
+        """Get snapshot_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OS_SPOKED
+        sub_key = 'snapshot_ttl'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 10
+        if intermediate is None:
+            result = 10
+        else:
+            result = abs(float(intermediate))
+        return result
+
 
 class ConfigHubd(Config):
     """Class for PATTOO_AGENT_OS_HUBD configuration information.
@@ -148,8 +401,77 @@ class ConfigHubd(Config):
             result = abs(int(intermediate))
         return result
 
+    def spoke_concurrency(self):
+        """Get spoke_concurrency.
 
-class ConfigAutonomousd(Config):
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OS_HUBD
+        sub_key = 'spoke_concurrency'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 100
+        if bool(intermediate) is False:
+            result = 100
+        else:
+            result = max(abs(int(intermediate)), 1)
+        return result
+
+    def spoke_timeout(self):
+        """Get spoke_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OS_HUBD
+        sub_key = 'spoke_timeout'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 10
+        if bool(intermediate) is False:
+            result = 10
+        else:
+            result = abs(float(intermediate))
+        return result
+
+    def post_workers(self):
+        """Get post_workers.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OS_HUBD
+        sub_key = 'post_workers'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 4
+        if bool(intermediate) is False:
+            result = 4
+        else:
+            result = max(abs(int(intermediate)), 1)
+        return result
+
+
+class ConfigAutonomousd(ConfigCollector):
     """Class for PATTOO_AGENT_OS_AUTONOMOUSD configuration information.
 
     Only processes the following YAML keys in the configuration file:
@@ -169,12 +491,7 @@ class ConfigAutonomousd(Config):
 
         """
         # Instantiate inheritance
-        Config.__init__(self)
-
-        # Get the configuration
-        config_file = configuration.agent_config_filename(
-            PATTOO_AGENT_OS_AUTONOMOUSD)
-        self._agent_config = files.read_yaml_file(config_file)
+        ConfigCollector.__init__(self, PATTOO_AGENT_OS_AUTONOMOUSD)
 
     def polling_interval(self):
         """Get targets.
@@ -198,3 +515,26 @@ class ConfigAutonomousd(Config):
         else:
             result = abs(int(intermediate))
         return result
+
+    def sampling_interval(self):
+        """Get sampling_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        key = PATTOO_AGENT_OS_AUTONOMOUSD
+        sub_key = 'sampling_interval'
+        intermediate = configuration.search(
+            key, sub_key, self._agent_config, die=False)
+
+        # Default to 0, which disables sampling
+        if bool(intermediate) is False:
+            result = 0
+        else:
+            result = abs(float(intermediate))
+        return result
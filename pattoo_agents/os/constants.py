@@ -1,8 +1,24 @@
 """Module that defines constants shared between agents."""
 
+import collections
+
 # pattoo-agent-os constants
 PATTOO_AGENT_OS_SPOKED_API_PREFIX = '/pattoo-agent-os'
 PATTOO_AGENT_OS_SPOKED = 'pattoo_agent_os_spoked'
 PATTOO_AGENT_OS_SPOKED_PROXY = '{}-gunicorn'.format(PATTOO_AGENT_OS_SPOKED)
 PATTOO_AGENT_OS_AUTONOMOUSD = 'pattoo_agent_os_autonomousd'
 PATTOO_AGENT_OS_HUBD = 'pattoo_agent_os_hubd'
+
+# Filters of the partitions whose usage is collected. Mountpoint filters are
+# regular expressions. Empty include lists include everything.
+DiskFilters = collections.namedtuple(
+    'DiskFilters',
+    'include_fstypes exclude_fstypes include_mountpoints exclude_mountpoints')
+
+DISK_FILTERS = DiskFilters(
+    include_fstypes=[], exclude_fstypes=[],
+    include_mountpoints=[], exclude_mountpoints=['docker'])
+
+# Regular expressions of the names of the disks whose I/O isn't reported by
+# default. These are RAM pseudo disks and loopback devices.
+DISK_IO_EXCLUDE = [r'^ram\d+$', r'^loop']
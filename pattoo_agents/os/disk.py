@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Pattoo classes that collect disk usage without blocking on hung mounts."""
+
+# Standard libraries
+import threading
+import time
+import concurrent.futures
+
+# pip3 libraries
+import psutil
+
+# Pattoo libraries
+from pattoo_shared import log
+from .constants import DISK_FILTERS
+from .filters import DeviceFilter
+
+
+class DiskUsage():
+    """Get the usage of mounted partitions without blocking on hung mounts.
+
+    A hung network filesystem blocks statvfs calls on its mountpoint
+    indefinitely. Each partition's usage is read in its own thread and
+    waited for until a timeout that starts when its read starts, with at
+    most workers reads in progress. Partitions whose reads time out are
+    marked stale, no longer count towards the workers, and are not read
+    again until their outstanding read completes. Hung mounts therefore
+    hold at most one thread each and never delay the other partitions.
+
+    """
+
+    def __init__(self, workers=4, timeout=5, filters=DISK_FILTERS):
+        """Initialize the class.
+
+        Args:
+            workers: Maximum number of concurrent reads
+            timeout: Seconds to wait for the usage of each partition
+            filters: DiskFilters object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._workers = max(1, workers)
+        self._timeout = timeout
+        self._filters = filters
+        self._mountpoints = mountpoint_filter(filters)
+        self._lock = threading.Lock()
+
+        # Outstanding reads keyed by mountpoint
+        self._pending = {}
+
+    def partitions(self):
+        """Get the partitions whose usage is collected.
+
+        Args:
+            None
+
+        Returns:
+            result: List of psutil partition named tuples
+
+        """
+        # Return
+        result = [
+            _ for _ in psutil.disk_partitions()
+            if included(_, self._filters, self._mountpoints) is True]
+        return result
+
+    def usage(self, partitions):
+        """Get the usage of partitions.
+
+        Args:
+            partitions: List of psutil partition named tuples
+
+        Returns:
+            result: Dict of psutil disk usage named tuples keyed by
+                mountpoint. The value is None for stale partitions.
+
+        """
+        # Initialize key variables
+        result = {}
+        queue = []
+
+        # Skip partitions with outstanding reads
+        with self._lock:
+            for partition in partitions:
+                mountpoint = partition.mountpoint
+                future = self._pending.get(mountpoint)
+                if future is not None and future.done() is False:
+                    result[mountpoint] = None
+                    continue
+                self._pending.pop(mountpoint, None)
+                queue.append(mountpoint)
+
+        # (future, deadline) of the reads in progress keyed by mountpoint
+        reading = {}
+        while bool(queue) is True or bool(reading) is True:
+            # Start reads
+            while bool(queue) is True and len(reading) < self._workers:
+                mountpoint = queue.pop(0)
+                reading[mountpoint] = (
+                    self._read(mountpoint), time.time() + self._timeout)
+
+            # Wait for a read to finish or time out
+            timeout = min(_[1] for _ in reading.values()) - time.time()
+            concurrent.futures.wait(
+                [_[0] for _ in reading.values()],
+                timeout=max(timeout, 0),
+                return_when=concurrent.futures.FIRST_COMPLETED)
+
+            # Get the results
+            now = time.time()
+            for mountpoint, (future, deadline) in list(reading.items()):
+                if future.done() is True:
+                    del reading[mountpoint]
+                    try:
+                        result[mountpoint] = future.result()
+                    except:
+                        log_message = ('''\
+Cannot get the disk usage of {}'''.format(mountpoint))
+                        log.log2info(51052, log_message)
+                elif deadline <= now:
+                    del reading[mountpoint]
+                    log_message = ('''\
+Timeout getting the disk usage of {}. Marking it stale.\
+'''.format(mountpoint))
+                    log.log2warning(51051, log_message)
+                    result[mountpoint] = None
+                    with self._lock:
+                        self._pending[mountpoint] = future
+        return result
+
+    def _read(self, mountpoint):
+        """Read the usage of a partition in a new thread.
+
+        Threads of hung reads can't be stopped. They are daemon threads so
+        that they don't stop the agent from exiting.
+
+        Args:
+            mountpoint: Mountpoint of the partition
+
+        Returns:
+            result: concurrent.futures.Future object of the psutil disk usage
+                named tuple
+
+        """
+        # Initialize key variables
+        result = concurrent.futures.Future()
+
+        def _run():
+            """Read the usage."""
+            try:
+                result.set_result(psutil.disk_usage(mountpoint))
+            except BaseException as exception:
+                result.set_exception(exception)
+
+        # Start
+        threading.Thread(target=_run, daemon=True).start()
+        return result
+
+
+def mountpoint_filter(filters):
+    """Get the filter of the mountpoints whose usage is collected.
+
+    Args:
+        filters: DiskFilters object
+
+    Returns:
+        result: DeviceFilter object
+
+    """
+    # Return
+    result = DeviceFilter(
+        include=filters.include_mountpoints,
+        exclude=filters.exclude_mountpoints)
+    return result
+
+
+def included(partition, filters, mountpoints=None):
+    """Determine whether the usage of a partition is collected.
+
+    Args:
+        partition: psutil partition named tuple
+        filters: DiskFilters object
+        mountpoints: DeviceFilter object of the mountpoints created with
+            mountpoint_filter(). It is created from filters if None.
+
+    Returns:
+        result: True if included
+
+    """
+    # Filter by filesystem type
+    if bool(filters.include_fstypes) is True and (
+            partition.fstype not in filters.include_fstypes):
+        return False
+    if partition.fstype in filters.exclude_fstypes:
+        return False
+
+    # Filter by mountpoint
+    if mountpoints is None:
+        mountpoints = mountpoint_filter(filters)
+    result = mountpoints.included(partition.mountpoint)
+    return result
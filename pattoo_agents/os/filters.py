@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Pattoo classes that filter the devices reported by the OS agents."""
+
+# Standard libraries
+import re
+
+
+class DeviceFilter():
+    """Include and exclude devices by name.
+
+    The regular expressions are compiled once, when the filter is created,
+    rather than every time a device is checked.
+
+    """
+
+    def __init__(self, include=None, exclude=None):
+        """Initialize the class.
+
+        Args:
+            include: List of regular expressions. Only matching devices are
+                included. All devices are included if empty.
+            exclude: List of regular expressions. Matching devices are
+                excluded.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._include = [re.compile(_) for _ in include or []]
+        self._exclude = [re.compile(_) for _ in exclude or []]
+
+    def included(self, name):
+        """Determine whether a device is included.
+
+        Args:
+            name: Name of the device
+
+        Returns:
+            result: True if included
+
+        """
+        # Filter
+        name = str(name)
+        if bool(self._include) is True and any(
+                bool(_.search(name)) is True
+                for _ in self._include) is False:
+            return False
+        result = any(
+            bool(_.search(name)) is True for _ in self._exclude) is False
+        return result
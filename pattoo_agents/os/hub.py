@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Pattoo classes that relay the data of OS spokes to the pattoo server."""
+
+# Standard libraries
+import asyncio
+import concurrent.futures
+import sys
+
+# PIP libraries
+import aiohttp
+
+# Pattoo libraries
+from pattoo_shared import log
+from pattoo_shared.phttp import Post
+from .constants import PATTOO_AGENT_OS_HUBD
+
+
+class Hub():
+    """Relay the data of spokes to the pattoo server.
+
+    All spokes are polled concurrently from a single asyncio event loop,
+    with at most concurrency requests in progress at any time. Connections
+    to spokes are kept alive between polls. The ETag of each spoke's data
+    is sent with the next request so that unchanged data isn't transferred
+    or posted again. Data is posted by a pool of threads while the remaining
+    spokes are polled. Each spoke's data is posted separately, as the pattoo
+    server only accepts the data of one agent per post. Data cached by
+    failed posts is posted once all the spokes have been polled.
+
+    """
+
+    def __init__(
+            self, agent_id, concurrency=100, timeout=10, post_workers=4,
+            keepalive=300):
+        """Initialize the class.
+
+        Args:
+            agent_id: Agent ID of the hub
+            concurrency: Maximum number of spokes polled at the same time
+            timeout: Seconds to wait for the data of each spoke
+            post_workers: Maximum number of posts to the pattoo server at
+                the same time
+            keepalive: Seconds for which idle connections to spokes are
+                kept open
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._agent_id = agent_id
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._keepalive = keepalive
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=post_workers)
+        self._session = None
+
+        # ETags of the data last received keyed by spoke URL
+        self._etags = {}
+
+    async def poll(self, urls):
+        """Poll spokes and post their data.
+
+        Args:
+            urls: List of spoke URLs
+
+        Returns:
+            result: Number of spokes whose data was posted
+
+        """
+        # The session pools connections and must be created in the event
+        # loop in which it is used
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._concurrency,
+                    keepalive_timeout=self._keepalive),
+                timeout=aiohttp.ClientTimeout(total=self._timeout))
+
+        # Poll
+        semaphore = asyncio.Semaphore(self._concurrency)
+        results = await asyncio.gather(
+            *[self._relay(url, semaphore) for url in urls])
+
+        # Forget spokes that are no longer polled
+        self._etags = {
+            url: etag for url, etag in self._etags.items() if url in urls}
+        result = sum(results)
+
+        # Post cached data from a single thread, as all the spokes' data is
+        # cached under the hub's agent ID
+        if result > 0:
+            loop = asyncio.get_event_loop()
+            try:
+                await loop.run_in_executor(self._executor, self._purge)
+            except:
+                log_message = ('''\
+Cannot post cached data to the pattoo server: [{}, {}]\
+'''.format(sys.exc_info()[0], sys.exc_info()[1]))
+                log.log2warning(51063, log_message)
+        return result
+
+    async def _relay(self, url, semaphore):
+        """Poll a spoke and post its data.
+
+        Args:
+            url: Spoke URL
+            semaphore: asyncio.Semaphore limiting requests to spokes
+
+        Returns:
+            result: True if the data was posted
+
+        """
+        # Poll. The timeout only starts once the request can be made.
+        async with semaphore:
+            data = await self.fetch(url)
+        if data is None:
+            return False
+
+        # Post without blocking the event loop. Failures must not stop the
+        # other spokes from being polled.
+        loop = asyncio.get_event_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._executor, self._post, url, data)
+        except:
+            log_message = ('''\
+Cannot post the data of spoke {}: [{}, {}]\
+'''.format(url, sys.exc_info()[0], sys.exc_info()[1]))
+            log.log2warning(51062, log_message)
+            result = False
+        return result is True
+
+    async def fetch(self, url):
+        """Get the data of a spoke.
+
+        Args:
+            url: Spoke URL
+
+        Returns:
+            data: Dict of data. None if the data can't be read, or hasn't
+                changed since it was last read.
+
+        """
+        # Initialize key variables
+        headers = {}
+        if url in self._etags:
+            headers['If-None-Match'] = self._etags[url]
+
+        # Poll
+        try:
+            async with self._session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return None
+                response.raise_for_status()
+                data = await response.json()
+                etag = response.headers.get('ETag')
+        except:
+            log_message = ('''\
+Cannot get data from spoke {}: [{}, {}]\
+'''.format(url, sys.exc_info()[0], sys.exc_info()[1]))
+            log.log2warning(51055, log_message)
+            self._etags.pop(url, None)
+            return None
+
+        # Check
+        if isinstance(data, dict) is False:
+            log_message = 'Invalid data from spoke {}'.format(url)
+            log.log2warning(51056, log_message)
+            return None
+        if etag is not None:
+            self._etags[url] = etag
+        return data
+
+    def _post(self, url, data):
+        """Post the data of a spoke to the pattoo server.
+
+        Data that can't be posted is cached by pattoo_shared.
+
+        Args:
+            url: Spoke URL
+            data: Dict of data
+
+        Returns:
+            success: True if successful
+
+        """
+        # Log message that ties the identifier to an agent_program
+        log_message = ('''\
+Agent program {} posting data of spoke {} as {}\
+'''.format(PATTOO_AGENT_OS_HUBD, url, self._agent_id))
+        log.log2debug(51065, log_message)
+
+        # Post
+        server = Post(self._agent_id, data)
+        success = server.post()
+        if success is False:
+            log_message = ('''\
+Cannot post the data of spoke {} to the pattoo server. It is cached until \
+the next successful post.'''.format(url))
+            log.log2warning(51066, log_message)
+        return success
+
+    def _purge(self):
+        """Post the data cached by failed posts to the pattoo server.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Purge
+        server = Post(self._agent_id, {})
+        server.purge()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Pattoo classes that cache the static metadata of the host."""
+
+# Standard libraries
+import platform
+import socket
+import threading
+import time
+
+# pip3 libraries
+import psutil
+
+# Pattoo libraries
+from pattoo_shared.variables import DataPointMetadata
+
+
+class HostMetadata():
+    """Cache the metadata of the host that rarely changes.
+
+    Getting the fully qualified domain name of the host requires DNS
+    lookups, which can take seconds with slow resolvers. The hostname and
+    the metadata added to every DataPoint are gathered once, and gathered
+    again every refresh_interval seconds.
+
+    """
+
+    def __init__(self, refresh_interval=3600):
+        """Initialize the class.
+
+        Args:
+            refresh_interval: Seconds after which the metadata is gathered
+                again
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._timestamp = None
+        self._hostname = None
+        self._metadata = []
+
+    def hostname(self, now=None):
+        """Get the fully qualified domain name of the host.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: Hostname
+
+        """
+        # Return
+        self._refresh(now=now)
+        result = self._hostname
+        return result
+
+    def metadata(self, now=None):
+        """Get the metadata of the host.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: List of DataPointMetadata objects. The list is shared
+                by all callers and must not be modified.
+
+        """
+        # Return
+        self._refresh(now=now)
+        result = self._metadata
+        return result
+
+    def _refresh(self, now=None):
+        """Gather the metadata if it has expired.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time.time()
+
+        # Gather
+        with self._lock:
+            if self._timestamp is not None and (
+                    now - self._timestamp < self._refresh_interval):
+                return
+            self._hostname = socket.getfqdn()
+            self._metadata = _metadata(self._hostname)
+            self._timestamp = now
+
+
+def _metadata(hostname):
+    """Gather the metadata of the host.
+
+    Args:
+        hostname: Fully qualified domain name of the host
+
+    Returns:
+        result: List of DataPointMetadata objects
+
+    """
+    # Initialize key variables
+    result = []
+
+    # OS release (kernel)
+    result.append(
+        DataPointMetadata(
+            'release', platform.release(), update_checksum=False))
+
+    # OS version
+    result.append(
+        DataPointMetadata(
+            'version', platform.version(), update_checksum=False))
+
+    # Operating sytem type (Linux / Windows)
+    result.append(
+        DataPointMetadata('processor', platform.processor()))
+
+    # Operating sytem type (Linux / Windows)
+    result.append(
+        DataPointMetadata('type', platform.system()))
+
+    # CPU count
+    result.append(
+        DataPointMetadata('cpus', psutil.cpu_count()))
+
+    # System name
+    result.append(
+        DataPointMetadata('hostname', hostname))
+    return result
+
+
+# Metadata shared by the callers of the collector in this process
+HOST_METADATA = HostMetadata()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Pattoo classes that encode the responses of the OS spoke API."""
+
+# Standard libraries
+import gzip
+import hashlib
+import json
+import threading
+import zlib
+
+# Content codings supported in order of preference
+ENCODINGS = ['gzip', 'deflate']
+
+
+class Payload():
+    """Serialized data of a response.
+
+    The data is serialized and hashed once. Each compressed version of it
+    is created by the first request that accepts it and then reused.
+
+    """
+
+    def __init__(self, data):
+        """Initialize the class.
+
+        Args:
+            data: Data to serialize as JSON
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._lock = threading.Lock()
+
+        # Keys are sorted so that unchanged data has an unchanged ETag.
+        # Timestamps change with every poll, so they aren't part of it.
+        body = json.dumps(
+            data, sort_keys=True, separators=(',', ':')).encode()
+        self.etag = hashlib.sha1(json.dumps(
+            _timeless(data), sort_keys=True,
+            separators=(',', ':')).encode()).hexdigest()
+        self._bodies = {None: body}
+
+    def body(self, encoding=None):
+        """Get the serialized data.
+
+        Args:
+            encoding: Content coding of ENCODINGS with which to compress the
+                data. The data isn't compressed if None.
+
+        Returns:
+            result: Bytes
+
+        """
+        # Compress once
+        with self._lock:
+            if encoding not in self._bodies:
+                self._bodies[encoding] = _compress(
+                    self._bodies[None], encoding)
+            result = self._bodies[encoding]
+        return result
+
+
+def _compress(body, encoding):
+    """Compress data.
+
+    Args:
+        body: Bytes
+        encoding: Content coding of ENCODINGS
+
+    Returns:
+        result: Compressed bytes
+
+    """
+    # The HTTP deflate coding is the zlib format
+    if encoding == 'gzip':
+        result = gzip.compress(body)
+    elif encoding == 'deflate':
+        result = zlib.compress(body)
+    else:
+        raise ValueError('Unsupported content coding {}'.format(encoding))
+    return result
+
+
+def _timeless(data):
+    """Remove the timestamps from data.
+
+    Args:
+        data: Data to serialize as JSON
+
+    Returns:
+        result: Data without timestamp keys, or the [key, value] pairs of
+            timestamps
+
+    """
+    # Remove timestamps at every level
+    if isinstance(data, dict) is True:
+        result = {
+            key: _timeless(value) for key, value in data.items()
+            if _timestamp(key) is False and _timestamp(value) is False}
+    elif isinstance(data, (list, tuple)) is True:
+        result = [_timeless(_) for _ in data if _timestamp(_) is False]
+    else:
+        result = data
+    return result
+
+
+def _timestamp(item):
+    """Determine whether an item is a timestamp key or its key, value pair.
+
+    Args:
+        item: Item of data
+
+    Returns:
+        result: True if the item is a pattoo timestamp
+
+    """
+    # Get the key of [key, value] pairs
+    if isinstance(item, (list, tuple)) is True and len(item) == 2:
+        item = item[0]
+
+    # Return
+    result = isinstance(item, str) is True and item.startswith(
+        'pattoo_') is True and item.endswith('timestamp') is True
+    return result
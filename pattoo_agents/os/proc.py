@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Pattoo library reading Linux system statistics from /proc."""
+
+# Standard libraries
+import collections
+import os
+import threading
+
+# Directory of the proc filesystem
+PROC = '/proc'
+
+# Statistics of the system read from /proc in a polling cycle.
+# per_cpu_times is a list of (CPU number, CPUTimes) tuples.
+Snapshot = collections.namedtuple(
+    'Snapshot',
+    'load_averages process_count cpu_times cpu_times_percent cpu_stats '
+    'memory per_cpu_times')
+
+# These have the same fields as their psutil equivalents on Linux
+CPUTimes = collections.namedtuple(
+    'CPUTimes',
+    'user nice system idle iowait irq softirq steal guest guest_nice')
+CPUStats = collections.namedtuple(
+    'CPUStats', 'ctx_switches interrupts soft_interrupts syscalls')
+Memory = collections.namedtuple(
+    'Memory',
+    'total available percent used free active inactive buffers cached '
+    'shared slab')
+
+# CPU times of the previous snapshot, used to calculate utilization
+_LOCK = threading.Lock()
+_LAST_CPU_TIMES = CPUTimes(*[0.0] * len(CPUTimes._fields))
+
+
+def snapshot(proc=PROC):
+    """Read the statistics of the system.
+
+    Each file is read once, instead of once for every statistic it contains.
+
+    Args:
+        proc: Directory of the proc filesystem
+
+    Returns:
+        result: Snapshot object. None if /proc can't be read.
+
+    """
+    # Read the files
+    try:
+        loadavg = _read(os.path.join(proc, 'loadavg'))
+        stat = _read(os.path.join(proc, 'stat'))
+        meminfo = _read(os.path.join(proc, 'meminfo'))
+        process_count = _process_count(proc)
+    except OSError:
+        return None
+
+    # Parse
+    try:
+        load_averages = _loadavg(loadavg)
+        (cpu_times, cpu_stats, per_cpu_times) = _stat(
+            stat, os.sysconf('SC_CLK_TCK'))
+        memory = _meminfo(meminfo)
+    except (ValueError, IndexError, KeyError):
+        return None
+
+    # Return
+    result = Snapshot(
+        load_averages=load_averages, process_count=process_count,
+        cpu_times=cpu_times, cpu_times_percent=cpu_times_percent(cpu_times),
+        cpu_stats=cpu_stats, memory=memory, per_cpu_times=per_cpu_times)
+    return result
+
+
+def cpu_times_percent(cpu_times):
+    """Get the CPU utilization since the previous call.
+
+    Utilization is calculated the same way as psutil.cpu_times_percent().
+    The utilization since boot is returned on the first call.
+
+    Args:
+        cpu_times: CPUTimes object
+
+    Returns:
+        result: CPUTimes object of percentages
+
+    """
+    # Get the time elapsed
+    global _LAST_CPU_TIMES
+    with _LOCK:
+        last = _LAST_CPU_TIMES
+        _LAST_CPU_TIMES = cpu_times
+
+    # Return
+    result = utilization(last, cpu_times)
+    return result
+
+
+def utilization(before, after):
+    """Get the CPU utilization between two readings of the CPU times.
+
+    Args:
+        before: CPUTimes object of the first reading
+        after: CPUTimes object of the second reading
+
+    Returns:
+        result: CPUTimes object of percentages
+
+    """
+    # Get the time elapsed
+    deltas = [max(now - then, 0) for now, then in zip(after, before)]
+
+    # Guest time is already included in user and nice time
+    elapsed = CPUTimes(*deltas)
+    total = sum(elapsed) - elapsed.guest - elapsed.guest_nice
+
+    # Return
+    if total <= 0:
+        percents = [0.0] * len(deltas)
+    else:
+        percents = [
+            round(min(max(100 * _ / total, 0.0), 100.0), 1) for _ in deltas]
+    result = CPUTimes(*percents)
+    return result
+
+
+def cpu_times(proc=PROC):
+    """Read the CPU times of the system.
+
+    Args:
+        proc: Directory of the proc filesystem
+
+    Returns:
+        result: CPUTimes object. None if /proc can't be read.
+
+    """
+    # Return
+    try:
+        (result, _, _) = _stat(
+            _read(os.path.join(proc, 'stat')), os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError, KeyError):
+        result = None
+    return result
+
+
+def memory(proc=PROC):
+    """Read the memory usage of the system.
+
+    Args:
+        proc: Directory of the proc filesystem
+
+    Returns:
+        result: Memory object. None if /proc can't be read.
+
+    """
+    # Return
+    try:
+        result = _meminfo(_read(os.path.join(proc, 'meminfo')))
+    except (OSError, ValueError, IndexError, KeyError):
+        result = None
+    return result
+
+
+def _read(filename):
+    """Read a file in the proc filesystem.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        result: Contents of the file
+
+    """
+    # Return
+    with open(filename, 'r') as f_handle:
+        result = f_handle.read()
+    return result
+
+
+def _loadavg(text):
+    """Parse the contents of /proc/loadavg.
+
+    Args:
+        text: Contents of the file
+
+    Returns:
+        result: Tuple of the 1, 5 and 15 minute load averages
+
+    """
+    # Format is "0.20 0.18 0.12 1/80 11206". The number of tasks after the
+    # "/" includes threads, so it isn't used as the number of processes.
+    fields = text.split()
+    result = tuple(float(_) for _ in fields[:3])
+    return result
+
+
+def _process_count(proc):
+    """Count the processes of the system.
+
+    Args:
+        proc: Directory of the proc filesystem
+
+    Returns:
+        result: Number of processes, the same as len(psutil.pids())
+
+    """
+    # Each process has a directory named after its PID
+    result = len([_ for _ in os.listdir(proc) if _.isdigit() is True])
+    return result
+
+
+def _stat(text, clock_ticks):
+    """Parse the contents of /proc/stat.
+
+    Args:
+        text: Contents of the file
+        clock_ticks: Number of clock ticks per second
+
+    Returns:
+        result: Tuple of (CPUTimes, CPUStats, list of (CPU number,
+            CPUTimes) tuples of each online CPU). CPU times are in seconds.
+            CPU numbers are kept as the CPUs of systems with offline CPUs
+            aren't numbered consecutively.
+
+    """
+    # Initialize key variables
+    lines = {}
+    per_cpu = []
+    for line in text.splitlines():
+        fields = line.split()
+        if bool(fields) is True:
+            lines[fields[0]] = fields[1:]
+            if fields[0].startswith('cpu') is True and (
+                    fields[0][3:].isdigit() is True):
+                per_cpu.append((int(fields[0][3:]), fields[1:]))
+
+    # Get CPU times
+    cpu_times = _cpu_times(lines['cpu'], clock_ticks)
+    per_cpu_times = [
+        (cpu, _cpu_times(fields, clock_ticks))
+        for cpu, fields in sorted(per_cpu)]
+
+    # The first number of the "intr" and "softirq" lines is the total
+    cpu_stats = CPUStats(
+        ctx_switches=int(lines['ctxt'][0]),
+        interrupts=int(lines['intr'][0]),
+        soft_interrupts=int(lines.get('softirq', [0])[0]),
+        syscalls=0)
+
+    # Return
+    result = (cpu_times, cpu_stats, per_cpu_times)
+    return result
+
+
+def _cpu_times(fields, clock_ticks):
+    """Convert the CPU times of a /proc/stat line to seconds.
+
+    Args:
+        fields: List of the CPU times in clock ticks
+        clock_ticks: Number of clock ticks per second
+
+    Returns:
+        result: CPUTimes object
+
+    """
+    # Older kernels report fewer CPU times
+    times = [int(_) / clock_ticks for _ in fields]
+    times.extend([0.0] * (len(CPUTimes._fields) - len(times)))
+    result = CPUTimes(*times[:len(CPUTimes._fields)])
+    return result
+
+
+def _meminfo(text):
+    """Parse the contents of /proc/meminfo.
+
+    Args:
+        text: Contents of the file
+
+    Returns:
+        result: Memory object. Values are calculated the same way as
+            psutil.virtual_memory().
+
+    """
+    # Get values in bytes
+    values = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) >= 2:
+            values[fields[0].rstrip(':')] = int(fields[1]) * 1024
+
+    # Calculate
+    total = values['MemTotal']
+    free = values['MemFree']
+    buffers = values.get('Buffers', 0)
+    cached = values.get('Cached', 0) + values.get('SReclaimable', 0)
+    available = values.get('MemAvailable', free + buffers + cached)
+    used = total - free - buffers - cached
+    if used < 0:
+        used = total - free
+    if bool(total) is True:
+        percent = round(100 * (total - available) / total, 1)
+    else:
+        percent = 0.0
+
+    # Return
+    result = Memory(
+        total=total, available=available, percent=percent, used=used,
+        free=free, active=values.get('Active', 0),
+        inactive=values.get('Inactive', 0), buffers=buffers, cached=cached,
+        shared=values.get('Shmem', 0), slab=values.get('Slab', 0))
+    return result
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Pattoo classes that collect the resource usage of the top processes."""
+
+# Standard libraries
+import collections
+import os
+import threading
+import time
+
+# Pattoo libraries
+from pattoo_shared.variables import DataPoint, DataPointMetadata
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT
+from .proc import PROC
+
+# Resource usage of a process read from /proc. CPU time is in seconds, and
+# memory and I/O are in bytes.
+Sample = collections.namedtuple(
+    'Sample', 'pid name cpu_time rss read_bytes write_bytes')
+
+# Resource usage of a process during a polling interval. Rates are per
+# second.
+Usage = collections.namedtuple(
+    'Usage', 'pid name cpu_percent rss read_rate write_rate')
+
+
+class ProcessStats():
+    """Collect the resource usage of the processes using the most resources.
+
+    Each process's /proc/[pid]/stat and /proc/[pid]/io files are read once
+    per polling interval, which is much cheaper than gathering many
+    attributes with psutil.process_iter(). CPU and I/O usage are calculated
+    from the difference with the previous polling interval. The top
+    consumers of CPU, memory and I/O are reported individually, and the
+    usage of the rest is summed up. File descriptors are only counted for
+    reported processes.
+
+    """
+
+    def __init__(self, top=10, proc=PROC):
+        """Initialize the class.
+
+        Args:
+            top: Number of top consumers of each resource to report
+            proc: Directory of the proc filesystem
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._top = top
+        self._proc = proc
+        self._lock = threading.Lock()
+        self._clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+        # Samples of the previous polling interval keyed by (pid, starttime)
+        self._samples = {}
+        self._timestamp = None
+
+    def datapoints(self, metadata=None, now=None):
+        """Get the DataPoints of the top processes.
+
+        Args:
+            metadata: List of DataPointMetadata objects of the host
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: List of DataPoint objects. Empty on the first call, as
+                the usage of the processes isn't known yet.
+
+        """
+        # Initialize key variables
+        result = []
+        usages = self.usage(now=now)
+        if usages is None:
+            return result
+
+        # Report the top processes
+        selected = top(usages, self._top)
+        for usage in selected:
+            meta = [
+                DataPointMetadata('process_name', usage.name),
+                DataPointMetadata(
+                    'process_pid', usage.pid, update_checksum=False)]
+            values = _values(usage)
+            values.append(
+                ('process_fds', self._fds(usage.pid), DATA_INT))
+            for key, value, data_type in values:
+                if value is None:
+                    continue
+                _dv = DataPoint(key, value, data_type=data_type)
+                _dv.add(meta)
+                _dv.add(metadata)
+                result.append(_dv)
+
+        # Sum up the rest
+        pids = set(_.pid for _ in selected)
+        rest = [_ for _ in usages if _.pid not in pids]
+        rollup = [
+            ('processes_other_count', len(rest), DATA_INT),
+            ('processes_other_cpu_percent',
+             round(sum(_.cpu_percent for _ in rest), 2), DATA_FLOAT),
+            ('processes_other_rss', sum(_.rss for _ in rest), DATA_INT),
+            ('processes_other_read_rate',
+             sum(_.read_rate for _ in rest), DATA_FLOAT),
+            ('processes_other_write_rate',
+             sum(_.write_rate for _ in rest), DATA_FLOAT)]
+        for key, value, data_type in rollup:
+            _dv = DataPoint(key, value, data_type=data_type)
+            _dv.add(metadata)
+            result.append(_dv)
+        return result
+
+    def usage(self, now=None):
+        """Get the resource usage of all processes since the previous call.
+
+        Args:
+            now: Current timestamp. Defaults to the current time.
+
+        Returns:
+            result: List of Usage objects. None on the first call.
+
+        """
+        # Initialize key variables
+        result = []
+        if now is None:
+            now = time.time()
+        samples = self._scan()
+
+        # Start a new polling interval
+        with self._lock:
+            previous = self._samples
+            elapsed = None
+            if self._timestamp is not None:
+                elapsed = now - self._timestamp
+            self._samples = samples
+            self._timestamp = now
+        if elapsed is None or elapsed <= 0:
+            return None
+
+        # Processes started during the interval used all their resources
+        # during the interval
+        for key, sample in samples.items():
+            before = previous.get(key)
+            if before is None:
+                before = Sample(sample.pid, sample.name, 0, 0, 0, 0)
+            result.append(Usage(
+                pid=sample.pid,
+                name=sample.name,
+                cpu_percent=round(100 * max(
+                    sample.cpu_time - before.cpu_time, 0) / elapsed, 2),
+                rss=sample.rss,
+                read_rate=max(
+                    sample.read_bytes - before.read_bytes, 0) / elapsed,
+                write_rate=max(
+                    sample.write_bytes - before.write_bytes, 0) / elapsed))
+        return result
+
+    def _scan(self):
+        """Read the resource usage of all processes.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of Sample objects keyed by (pid, starttime)
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Processes may exit while they are being read
+        with os.scandir(self._proc) as entries:
+            for entry in entries:
+                if entry.name.isdigit() is False:
+                    continue
+                try:
+                    (key, sample) = self._sample(int(entry.name))
+                except (OSError, ValueError, IndexError):
+                    continue
+                result[key] = sample
+        return result
+
+    def _sample(self, pid):
+        """Read the resource usage of a process.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            result: Tuple of ((pid, starttime), Sample)
+
+        """
+        # Read the stat file. The name may contain spaces and parentheses.
+        directory = os.path.join(self._proc, str(pid))
+        with open(os.path.join(directory, 'stat'), 'r') as f_handle:
+            text = f_handle.read()
+        name = text[text.index('(') + 1:text.rindex(')')]
+        fields = text[text.rindex(')') + 2:].split()
+        cpu_time = (int(fields[11]) + int(fields[12])) / self._clock_ticks
+        starttime = int(fields[19])
+        rss = int(fields[21]) * self._page_size
+
+        # The io file can only be read by the owner of the process
+        (read_bytes, write_bytes) = (0, 0)
+        try:
+            with open(os.path.join(directory, 'io'), 'r') as f_handle:
+                for line in f_handle:
+                    (key, _, value) = line.partition(':')
+                    if key == 'read_bytes':
+                        read_bytes = int(value)
+                    elif key == 'write_bytes':
+                        write_bytes = int(value)
+        except OSError:
+            pass
+
+        # Return
+        result = ((pid, starttime), Sample(
+            pid=pid, name=name, cpu_time=cpu_time, rss=rss,
+            read_bytes=read_bytes, write_bytes=write_bytes))
+        return result
+
+    def _fds(self, pid):
+        """Count the open file descriptors of a process.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            result: Number of file descriptors. None if they can't be read.
+
+        """
+        # Return
+        try:
+            result = len(os.listdir(os.path.join(self._proc, str(pid), 'fd')))
+        except OSError:
+            result = None
+        return result
+
+
+def top(usages, count):
+    """Get the processes that use the most CPU, memory or I/O.
+
+    Args:
+        usages: List of Usage objects
+        count: Number of top consumers of each resource
+
+    Returns:
+        result: List of Usage objects of the top consumers, ordered by pid
+
+    """
+    # Initialize key variables
+    selected = {}
+
+    # Get the top consumers of each resource
+    for function in [
+            lambda _: _.cpu_percent,
+            lambda _: _.rss,
+            lambda _: _.read_rate + _.write_rate]:
+        ranked = sorted(usages, key=function, reverse=True)
+        for usage in ranked[:count]:
+            if function(usage) > 0:
+                selected[usage.pid] = usage
+
+    # Return
+    result = [selected[_] for _ in sorted(selected)]
+    return result
+
+
+def _values(usage):
+    """Get the values reported for the usage of a process.
+
+    Args:
+        usage: Usage object
+
+    Returns:
+        result: List of (key, value, data_type) tuples
+
+    """
+    # Return
+    result = [
+        ('process_cpu_percent', usage.cpu_percent, DATA_FLOAT),
+        ('process_rss', usage.rss, DATA_INT),
+        ('process_read_rate', usage.read_rate, DATA_FLOAT),
+        ('process_write_rate', usage.write_rate, DATA_FLOAT)]
+    return result
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Pattoo classes that sample system usage between polling intervals."""
+
+# Standard libraries
+import collections
+import math
+import threading
+
+# Pattoo libraries
+from pattoo_shared.variables import DataPoint
+from pattoo_shared.constants import DATA_FLOAT
+from pattoo_shared import log
+from . import proc
+
+
+class Sampler():
+    """Sample system usage several times per polling interval.
+
+    A polling interval of several minutes hides short spikes in CPU usage.
+    Cheap counters are read from /proc every sampling_interval seconds in a
+    background thread, and kept in fixed size ring buffers. The minimum,
+    maximum, average and 95th percentile of the samples are reported every
+    polling interval, instead of every sample.
+
+    """
+
+    def __init__(self, sampling_interval, polling_interval,
+                 proc_dir=proc.PROC):
+        """Initialize the class.
+
+        Args:
+            sampling_interval: Seconds between samples
+            polling_interval: Seconds between reports
+            proc_dir: Directory of the proc filesystem
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._sampling_interval = sampling_interval
+        self._proc = proc_dir
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._cpu_times = proc.cpu_times(proc=self._proc)
+
+        # Ring buffers of samples keyed by DataPoint key. Samples are
+        # dropped, oldest first, if reports are delayed.
+        size = max(math.ceil(polling_interval / sampling_interval), 1)
+        self._samples = {
+            _: collections.deque(maxlen=size) for _ in [
+                'cpu_busy_percent', 'cpu_iowait_percent', 'memory_percent']}
+
+    def start(self):
+        """Start sampling in a background thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Start
+        self._thread = threading.Thread(
+            target=self._run, name='os_sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Stop
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample(self):
+        """Read the counters and add them to the ring buffers.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Read
+        cpu_times = proc.cpu_times(proc=self._proc)
+        memory = proc.memory(proc=self._proc)
+
+        # Update
+        with self._lock:
+            if cpu_times is not None and self._cpu_times is not None:
+                percents = proc.utilization(self._cpu_times, cpu_times)
+                self._samples['cpu_busy_percent'].append(
+                    round(100 - percents.idle - percents.iowait, 1))
+                self._samples['cpu_iowait_percent'].append(percents.iowait)
+            self._cpu_times = cpu_times
+            if memory is not None:
+                self._samples['memory_percent'].append(memory.percent)
+
+    def datapoints(self, metadata=None):
+        """Get the DataPoints of the samples since the previous call.
+
+        Args:
+            metadata: List of DataPointMetadata objects of the host
+
+        Returns:
+            result: List of DataPoint objects
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Get the samples and empty the buffers
+        with self._lock:
+            samples = {
+                key: list(values) for key, values in self._samples.items()}
+            for values in self._samples.values():
+                values.clear()
+
+        # Summarize
+        for key, values in sorted(samples.items()):
+            for suffix, value in summary(values):
+                _dv = DataPoint(
+                    '{}_{}'.format(key, suffix), value, data_type=DATA_FLOAT)
+                _dv.add(metadata)
+                result.append(_dv)
+        return result
+
+    def _run(self):
+        """Sample until stopped.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Sample
+        while self._stop.wait(self._sampling_interval) is False:
+            try:
+                self.sample()
+            except:
+                log_message = 'OS usage sampling failed'
+                log.log2info(51054, log_message)
+
+
+def summary(values):
+    """Summarize samples.
+
+    Args:
+        values: List of samples
+
+    Returns:
+        result: List of (suffix, value) tuples of the minimum, maximum,
+            average and 95th percentile. Empty if there are no samples.
+
+    """
+    # Initialize key variables
+    if bool(values) is False:
+        return []
+    ordered = sorted(values)
+
+    # Use the nearest rank percentile
+    p95 = ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+
+    # Return
+    result = [
+        ('min', ordered[0]),
+        ('max', ordered[-1]),
+        ('avg', round(sum(ordered) / len(ordered), 2)),
+        ('p95', p95)]
+    return result
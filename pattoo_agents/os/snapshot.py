@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Pattoo classes that share collected data between API requests."""
+
+# Standard libraries
+import threading
+import time
+
+
+class Snapshots():
+    """Cache collected data for a short time.
+
+    Each hub polling a spoke would otherwise trigger a full collection.
+    Data is kept for up to ttl seconds, and for no more than half of the
+    requester's polling interval so that each poll still gets data newer
+    than its previous one. Only one collection runs at a time for each
+    polling interval. Requests that arrive while it runs wait for, and
+    share, its result.
+
+    """
+
+    def __init__(self, ttl=10):
+        """Initialize the class.
+
+        Args:
+            ttl: Maximum number of seconds for which collected data is
+                reused
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+        # (timestamp, data) keyed by polling interval
+        self._snapshots = {}
+
+        # threading.Event objects of running collections keyed by polling
+        # interval
+        self._collecting = {}
+
+    def get(self, polling_interval, function):
+        """Get collected data, collecting it again if it has expired.
+
+        Args:
+            polling_interval: Polling interval of the requester
+            function: Function that collects the data. It is called without
+                arguments.
+
+        Returns:
+            result: Data returned by the function
+
+        """
+        # Initialize key variables
+        ttl = self.ttl(polling_interval)
+
+        while True:
+            # Reuse unexpired data, or wait for a running collection
+            with self._lock:
+                entry = self._snapshots.get(polling_interval)
+                if entry is not None and time.time() - entry[0] < ttl:
+                    return entry[1]
+                event = self._collecting.get(polling_interval)
+                if event is None:
+                    event = threading.Event()
+                    self._collecting[polling_interval] = event
+                    break
+
+            # The collection may have failed, in which case the next waiting
+            # request collects the data
+            event.wait()
+
+        # Collect
+        try:
+            result = function()
+            with self._lock:
+                self._snapshots[polling_interval] = (time.time(), result)
+        finally:
+            with self._lock:
+                self._collecting.pop(polling_interval, None)
+            event.set()
+        return result
+
+    def ttl(self, polling_interval):
+        """Get the number of seconds for which collected data is reused.
+
+        Args:
+            polling_interval: Polling interval of the requester
+
+        Returns:
+            result: Seconds
+
+        """
+        # Return
+        result = min(self._ttl, polling_interval / 2)
+        return result
@@ -61,13 +61,22 @@ class UnittestConfig():
             'pattoo_agent_bacnetipd': {
                 'polling_interval': 893,
                 'agent_ip_address': '127.0.0.50',
+                'max_apdu_length': 480,
+                'object_name_ttl': 7200,
+                'max_concurrent_requests': 24,
+                'target_concurrent_requests': 2,
+                'cov_lifetime': 1800,
+                'discovery_ttl': 86400,
                 'polling_groups': [
                     {
                         'group_name': 'TEST',
                         'ip_targets': ['127.0.0.60'],
+                        'cov': True,
+                        'discover': True,
+                        'heartbeat': 3600,
                         'points': [
                             {'address': 123},
-                            {'address': 345}
+                            {'address': 345, 'deadband': 2}
                         ]
                     }
                 ],
@@ -130,35 +139,57 @@ class UnittestConfig():
             },
             'pattoo_agent_modbustcpd': {
                 'polling_interval': 457,
+                'gateway_connections': 4,
+                'bus_request_delay': 0.05,
                 'polling_groups': [
                     {
                         'group_name': 'TEST',
                         'ip_targets': ['unittest.modbus.tcp.target.net'],
                         'unit': 3,
+                        'bus': 2,
                         'input_registers': [
                             {'address': 30388, 'multiplier': 7},
                             {'address': 30389, 'multiplier': 7}],
                         'holding_registers': [
                             {'address': 40124, 'multiplier': 9},
-                            {'address': 40457, 'multiplier': 9}]
+                            {'address': 40457, 'multiplier': 9,
+                             'deadband_percent': 5}]
                     }
                 ],
             },
             'pattoo_agent_os_autonomousd': {
-                'polling_interval': 80
+                'polling_interval': 80,
+                'sampling_interval': 10
                 },
             'pattoo_agent_os_spoked': {
                 'ip_listen_address': '127.0.0.1',
-                'ip_bind_port': 5000
+                'ip_bind_port': 5000,
+                'snapshot_ttl': 5,
+                'disk_usage_timeout': 2,
+                'disk_usage_workers': 3,
+                'exclude_fstypes': ['nfs', 'cifs'],
+                'exclude_mountpoints': '^/mnt/',
+                'metadata_refresh_interval': 600,
+                'process_top': 5,
+                'cgroup_stats': True,
+                'per_cpu': True,
+                'exclude_nics': ['^veth', '^docker'],
+                'include_disks': '^sd'
                 },
             'pattoo_agent_os_hubd': {
                 'polling_interval': 98,
+                'spoke_concurrency': 50,
+                'spoke_timeout': 5,
+                'post_workers': 2,
                 'ip_targets': [
                     {'ip_address': '127.0.0.1',
                      'ip_bind_port': 5000}]
                 },
             'pattoo_agent_opcuad': {
                 'polling_interval': 102,
+                'session_timeout': 600,
+                'server_concurrent_requests': 3,
+                'polling_processes': 2,
                 'polling_groups': [
                     {
                         'group_name': 'TEST OPCUA',
@@ -166,9 +197,13 @@ class UnittestConfig():
                         'ip_port': 7844,
                         'username': 'nTbJazc6q3MaMazT',
                         'password': 'eQ6KnJcCk3qLkB73',
+                        'subscribe': True,
+                        'sampling_interval': 500,
+                        'aggregate': 'average',
+                        'deadband': 0.5,
                         'nodes': [
                             {'address': 1, 'multiplier': 2},
-                            {'address': 3, 'multiplier': 4}]
+                            {'address': 3, 'multiplier': 4, 'deadband': 2}]
                     }
                 ]
             }
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test the BACnetIP cache module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+            os.path.abspath(os.path.join(
+                os.path.abspath(os.path.join(
+                        EXEC_DIR,
+                        os.pardir)), os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = ('''\
+{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}bacnet{0}ip'''.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_agents.bacnet.ip.cache import ObjectNameCache
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestObjectNameCache(unittest.TestCase):
+    """Checks all ObjectNameCache methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        pass
+
+    def test_get(self):
+        """Testing method / function get."""
+        # Initialize key variables
+        cache = ObjectNameCache(ttl=100)
+        self.assertIsNone(cache.get('target', 1, now=0))
+
+        # Test expiry
+        cache.set('target', 1, 'name', now=0)
+        self.assertEqual(cache.get('target', 1, now=99), 'name')
+        self.assertIsNone(cache.get('target', 1, now=100))
+        self.assertIsNone(cache.get('target', 1, now=0))
+
+        # Nothing is cached with a zero ttl
+        cache = ObjectNameCache(ttl=0)
+        cache.set('target', 1, 'name', now=0)
+        self.assertIsNone(cache.get('target', 1, now=0))
+
+    def test_set(self):
+        """Testing method / function set."""
+        # Initialize key variables
+        cache = ObjectNameCache(ttl=100)
+
+        # Failed reads are not cached
+        cache.set('target', 1, None, now=0)
+        self.assertIsNone(cache.get('target', 1, now=0))
+
+        # Test
+        cache.set('target', 1, 'name', now=0)
+        cache.set('target', 1, 'new', now=0)
+        self.assertEqual(cache.get('target', 1, now=0), 'new')
+
+    def test_invalidate(self):
+        """Testing method / function invalidate."""
+        # Initialize key variables
+        cache = ObjectNameCache(ttl=100)
+        cache.set('target', 1, 'one', now=0)
+        cache.set('target', 2, 'two', now=0)
+        cache.set('other', 1, 'three', now=0)
+
+        # Test
+        cache.invalidate('target')
+        self.assertIsNone(cache.get('target', 1, now=0))
+        self.assertIsNone(cache.get('target', 2, now=0))
+        self.assertEqual(cache.get('other', 1, now=0), 'three')
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
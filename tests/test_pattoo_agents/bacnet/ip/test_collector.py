@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Test the BACnetIP collector module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+            os.path.abspath(os.path.join(
+                os.path.abspath(os.path.join(
+                        EXEC_DIR,
+                        os.pardir)), os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = ('''\
+{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}bacnet{0}ip'''.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# PIP imports
+from BAC0.core.io.IOExceptions import NoResponseFromController
+
+# Pattoo imports
+from pattoo_agents.bacnet.ip import collector
+from tests.libraries.configuration import UnittestConfig
+
+_VALUES = {
+    ('analogValue', 1, 'presentValue'): 1.5,
+    ('analogValue', 1, 'objectName'): 'one',
+    ('analogValue', 2, 'presentValue'): 2.5,
+    ('binaryInput', 3, 'presentValue'): 'active'
+}
+
+
+class _BACnet():
+    """Respond to read requests made to a BAC0 object."""
+
+    def __init__(self, missing=None, error=None):
+        """Initialize the class."""
+        self.requests = []
+        self._missing = missing or []
+        self._error = error
+
+    def readMultiple(self, args):
+        """Respond to a ReadPropertyMultiple request."""
+        # Points are requested as 'object_type address property ...'
+        self.requests.append(('readMultiple', args))
+        if self._error is not None:
+            raise self._error
+        result = []
+        tokens = args.split()[1:]
+        for token in tokens:
+            if token in ['analogValue', 'binaryInput']:
+                object_type = token
+                address = None
+            elif address is None:
+                address = int(token)
+            elif (object_type, address, token) not in self._missing:
+                result.append(_VALUES[(object_type, address, token)])
+        return result
+
+    def read(self, args):
+        """Respond to a ReadProperty request."""
+        self.requests.append(('read', args))
+        if isinstance(self._error, NoResponseFromController) is True:
+            raise self._error
+        (_, object_type, address, property_name) = args.split()
+        return _VALUES[(object_type, int(address), property_name)]
+
+
+class TestPollBACnetIP(unittest.TestCase):
+    """Checks all _PollBACnetIP methods."""
+
+    ##########################################################################
+    # General object setup
+    ##########################################################################
+
+    points = sorted(_VALUES.keys())
+
+    def test__read_batch(self):
+        """Testing method / function _read_batch."""
+        # Test
+        bacnet = _BACnet()
+        poller = collector._PollBACnetIP(bacnet)
+        (values, multiple) = poller._read_batch('127.0.0.60', self.points)
+        self.assertEqual(values, _VALUES)
+        self.assertTrue(multiple)
+        self.assertEqual(len(bacnet.requests), 1)
+
+    def test__read_batch_mismatch(self):
+        """Testing method / function _read_batch with missing values."""
+        # Points of a response with missing values are read individually
+        bacnet = _BACnet(missing=[('analogValue', 2, 'presentValue')])
+        poller = collector._PollBACnetIP(bacnet)
+        (values, multiple) = poller._read_batch('127.0.0.60', self.points)
+        self.assertEqual(values, _VALUES)
+        self.assertTrue(multiple)
+        self.assertEqual(
+            [_[0] for _ in bacnet.requests],
+            ['readMultiple'] + ['read'] * len(self.points))
+
+    def test__read_batch_unsupported(self):
+        """Testing method / function _read_batch without RPM support."""
+        # Points are read individually if ReadPropertyMultiple fails
+        bacnet = _BACnet(error=ValueError('Unrecognized service'))
+        poller = collector._PollBACnetIP(bacnet)
+        (values, multiple) = poller._read_batch('127.0.0.60', self.points)
+        self.assertEqual(values, _VALUES)
+        self.assertFalse(multiple)
+        self.assertEqual(
+            [_[0] for _ in bacnet.requests],
+            ['readMultiple'] + ['read'] * len(self.points))
+
+        # ReadPropertyMultiple isn't used once it's known to fail
+        bacnet.requests = []
+        (values, multiple) = poller._read_batch(
+            '127.0.0.60', self.points, multiple=False)
+        self.assertEqual(values, _VALUES)
+        self.assertEqual(
+            [_[0] for _ in bacnet.requests], ['read'] * len(self.points))
+
+    def test__read_batch_no_response(self):
+        """Testing method / function _read_batch without a response."""
+        # Points aren't read individually if the target doesn't respond
+        bacnet = _BACnet(error=NoResponseFromController())
+        poller = collector._PollBACnetIP(bacnet)
+        (values, multiple) = poller._read_batch('127.0.0.60', self.points)
+        self.assertEqual(values, {})
+        self.assertTrue(multiple)
+        self.assertEqual(len(bacnet.requests), 1)
+
+    def test__read_points(self):
+        """Testing method / function _read_points."""
+        # Points are read in several batches
+        bacnet = _BACnet()
+        poller = collector._PollBACnetIP(bacnet)
+        poller._max_apdu_length = 36
+        result = poller._read_points('127.0.0.60', self.points)
+        self.assertEqual(result, _VALUES)
+        self.assertEqual(len(bacnet.requests), len(self.points))
+
+        # Only the first batch is read if the target doesn't respond
+        bacnet = _BACnet(error=NoResponseFromController())
+        poller = collector._PollBACnetIP(bacnet)
+        poller._max_apdu_length = 36
+        result = poller._read_points('127.0.0.60', self.points)
+        self.assertEqual(result, {})
+        self.assertEqual(len(bacnet.requests), 1)
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__batches(self):
+        """Testing function _batches."""
+        # Initialize key variables
+        points = [
+            ('analogValue', 1, 'objectName'),
+            ('analogValue', 1, 'presentValue'),
+            ('analogValue', 2, 'presentValue'),
+            ('analogValue', 3, 'presentValue')]
+
+        # Everything fits in a single request
+        self.assertEqual(collector._batches(480, points), [points])
+        self.assertEqual(collector._batches(480, []), [])
+
+        # Header 5, object 7 and objectName 70 fill the first request.
+        # Properties of the same object don't repeat the object size.
+        self.assertEqual(
+            collector._batches(82, points), [points[:1], points[1:]])
+        self.assertEqual(
+            collector._batches(53, points), [points[:1], points[1:]])
+        self.assertEqual(
+            collector._batches(52, points),
+            [points[:1], points[1:3], points[3:]])
+        self.assertEqual(
+            collector._batches(36, points),
+            [points[:1], points[1:2], points[2:3], points[3:]])
+
+        # Points too large for a request are requested on their own
+        self.assertEqual(
+            collector._batches(1, points[:2]), [points[:1], points[1:2]])
+
+    def test_poll_target_addresses(self):
+        """Testing function poll_target_addresses."""
+        # Initialize key variables
+        points = sorted(_VALUES.keys())
+
+        # Test
+        result = collector.poll_target_addresses(
+            '127.0.0.60', points, _BACnet())
+        self.assertEqual(result, [_VALUES[_] for _ in points])
+
+        # Failed requests and missing responses
+        result = collector.poll_target_addresses(
+            '127.0.0.60', points, _BACnet(error=ValueError()))
+        self.assertIsNone(result)
+        result = collector.poll_target_addresses(
+            '127.0.0.60', points, _BACnet(error=NoResponseFromController()))
+        self.assertEqual(result, [])
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -27,6 +27,10 @@ else:
 # Pattoo imports
 from pattoo_shared.variables import PollingPoint, IPTargetPollingPoints
 from pattoo_agents.bacnet.ip import configuration
+from pattoo_agents.bacnet.ip.constants import PATTOO_AGENT_BACNETIPD
+from pattoo_agents.bacnet.variables import (
+    BACnetVariable, TargetBACnetVariables)
+from pattoo_agents.deadband import Deadband
 from tests.libraries.configuration import UnittestConfig
 
 
@@ -57,6 +61,42 @@ class TestConfigBACnetIP(unittest.TestCase):
         result = self.config.agent_ip_address()
         self.assertEqual(result, '127.0.0.50')
 
+    def test_cov_targets(self):
+        """Testing method / function cov_targets."""
+        # Test
+        result = self.config.cov_targets()
+        self.assertEqual(result, {'127.0.0.60'})
+
+    def test_cov_lifetime(self):
+        """Testing method / function cov_lifetime."""
+        # Test
+        result = self.config.cov_lifetime()
+        self.assertEqual(result, 1800)
+
+    def test_max_apdu_length(self):
+        """Testing method / function max_apdu_length."""
+        # Test
+        result = self.config.max_apdu_length()
+        self.assertEqual(result, 480)
+
+    def test_max_concurrent_requests(self):
+        """Testing method / function max_concurrent_requests."""
+        # Test
+        result = self.config.max_concurrent_requests()
+        self.assertEqual(result, 24)
+
+    def test_target_concurrent_requests(self):
+        """Testing method / function target_concurrent_requests."""
+        # Test
+        result = self.config.target_concurrent_requests()
+        self.assertEqual(result, 2)
+
+    def test_object_name_ttl(self):
+        """Testing method / function object_name_ttl."""
+        # Test
+        result = self.config.object_name_ttl()
+        self.assertEqual(result, 7200)
+
     def test_target_polling_points(self):
         """Testing function pointvariables."""
         # Initialize key variables.
@@ -75,6 +115,98 @@ class TestConfigBACnetIP(unittest.TestCase):
             self.assertEqual(isinstance(value, PollingPoint), True)
             self.assertEqual(value.address, points[index])
 
+    def test_target_variables(self):
+        """Testing method / function target_variables."""
+        # Initialize key variables.
+        result = self.config.target_variables()
+        expected = [
+            (123, Deadband(absolute=None, percent=None, heartbeat=3600)),
+            (345, Deadband(absolute=2, percent=None, heartbeat=3600))
+        ]
+
+        # Test
+        self.assertEqual(isinstance(result, list), True)
+        self.assertEqual(len(result), 1)
+
+        # Test each variable
+        item = result[0]
+        self.assertEqual(isinstance(item, TargetBACnetVariables), True)
+        self.assertEqual(item.target, '127.0.0.60')
+        self.assertEqual(len(item.data), len(expected))
+        for index, value in enumerate(item.data):
+            self.assertEqual(isinstance(value, BACnetVariable), True)
+            self.assertEqual(value.address, expected[index][0])
+            self.assertEqual(value.object_type, 'analogValue')
+            self.assertEqual(value.property_name, 'presentValue')
+            self.assertEqual(value.deadband, expected[index][1])
+
+        # Test with discovered objects. Configured objects and objects of
+        # types that can't be polled must be ignored.
+        objects = {
+            '127.0.0.60': [
+                ('analogValue', 123), ('binaryInput', 4), ('device', 1)],
+            '127.0.0.61': [('analogValue', 5)]
+        }
+        result = self.config.target_variables(objects=objects)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            result[0].points(),
+            [('analogValue', 123, 'presentValue'),
+             ('analogValue', 345, 'presentValue'),
+             ('binaryInput', 4, 'presentValue')])
+
+    def test_target_variables_merged(self):
+        """Testing method / function target_variables with shared targets."""
+        # Initialize key variables
+        config = configuration.ConfigBACnetIP()
+        config._agent_config = {
+            PATTOO_AGENT_BACNETIPD: {
+                'polling_groups': [
+                    {'ip_targets': ['127.0.0.60', '127.0.0.61'],
+                     'points': [{'address': 1}]},
+                    {'ip_targets': ['127.0.0.60'],
+                     'object_type': 'binaryInput',
+                     'discover': True,
+                     'points': [{'address': 2}]}
+                ]
+            }
+        }
+        objects = {'127.0.0.60': [('binaryInput', 2), ('binaryInput', 3)]}
+
+        # The points of all the groups of a target are polled together
+        result = config.target_variables(objects=objects)
+        self.assertEqual(
+            [_.target for _ in result], ['127.0.0.60', '127.0.0.61'])
+        self.assertEqual(
+            result[0].points(),
+            [('analogValue', 1, 'presentValue'),
+             ('binaryInput', 2, 'presentValue'),
+             ('binaryInput', 3, 'presentValue')])
+        self.assertEqual(
+            result[1].points(), [('analogValue', 1, 'presentValue')])
+
+    def test_ip_targets(self):
+        """Testing method / function ip_targets."""
+        # Test
+        result = self.config.ip_targets()
+        self.assertEqual(result, ['127.0.0.60'])
+
+    def test_device_cache_file(self):
+        """Testing method / function device_cache_file."""
+        # Initialize key variables
+        expected = '{1}{0}pattoo_agent_bacnetipd_devices.json'.format(
+            os.sep, self.config.cache_directory())
+
+        # Test
+        result = self.config.device_cache_file()
+        self.assertEqual(result, expected)
+
+    def test_discovery_ttl(self):
+        """Testing method / function discovery_ttl."""
+        # Test
+        result = self.config.discovery_ttl()
+        self.assertEqual(result, 86400)
+
     def test_language(self):
         """Test pattoo_shared.Config inherited method language."""
         # Initialize key values
@@ -206,6 +338,31 @@ class TestConfigBACnetIP(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__create_variable(self):
+        """Testing function _create_variable."""
+        # Test addresses
+        result = configuration._create_variable(12)
+        self.assertEqual(result.point, ('analogValue', 12, 'presentValue'))
+        self.assertIsNone(result.deadband)
+
+        # Test object types and properties
+        default = Deadband(absolute=None, percent=None, heartbeat=60)
+        result = configuration._create_variable(
+            {'address': 7, 'property': 'statusFlags', 'multiplier': 2},
+            object_type='binaryInput', default=default)
+        self.assertEqual(result.point, ('binaryInput', 7, 'statusFlags'))
+        self.assertEqual(result.multiplier, 2)
+        self.assertEqual(result.deadband, default)
+
+        result = configuration._create_variable(
+            {'address': 7, 'object_type': 'multiStateValue'},
+            object_type='binaryInput')
+        self.assertEqual(result.objectid, ('multiStateValue', 7))
+
+
 if __name__ == '__main__':
     # Make sure the environment is OK to run unittests
     UnittestConfig().create()
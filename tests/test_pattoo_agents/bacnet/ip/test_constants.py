@@ -27,7 +27,8 @@ else:
 
 # Pattoo imports
 from tests.libraries.configuration import UnittestConfig
-from pattoo_agents.bacnet.ip.constants import PATTOO_AGENT_BACNETIPD
+from pattoo_agents.bacnet.ip.constants import (
+    PATTOO_AGENT_BACNETIPD, BACNET_MAX_APDU_LENGTH, BACNET_MIN_APDU_LENGTH)
 
 
 class TestConstants(unittest.TestCase):
@@ -42,6 +43,8 @@ class TestConstants(unittest.TestCase):
         # Test agent constants
         self.assertEqual(
             PATTOO_AGENT_BACNETIPD, 'pattoo_agent_bacnetipd')
+        self.assertEqual(BACNET_MAX_APDU_LENGTH, 1476)
+        self.assertEqual(BACNET_MIN_APDU_LENGTH, 50)
 
 
 if __name__ == '__main__':
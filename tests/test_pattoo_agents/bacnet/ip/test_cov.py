@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test the BACnetIP COV module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+            os.path.abspath(os.path.join(
+                os.path.abspath(os.path.join(
+                        EXEC_DIR,
+                        os.pardir)), os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = ('''\
+{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}bacnet{0}ip'''.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# PIP imports
+from BAC0.core.io.IOExceptions import (
+    NoResponseFromController, UnrecognizedService)
+
+# Pattoo imports
+from pattoo_agents.bacnet.ip.cov import COVSubscriptions
+from tests.libraries.configuration import UnittestConfig
+
+_OBJECTIDS = [('analogValue', 1), ('binaryInput', 2)]
+
+
+class _BACnet():
+    """Record COV subscription requests made to a BAC0 object."""
+
+    def __init__(self, error=None, limit=None):
+        """Initialize the class."""
+        self.requests = []
+        self.callbacks = {}
+        self.error = error
+        self._limit = limit
+
+    def cov(self, address, objectID, lifetime=None, callback=None):
+        """Record a COV subscription request."""
+        if self.error is not None:
+            raise self.error
+        if self._limit is not None and self._limit.active is False:
+            raise RuntimeError('Request made outside the request limit')
+        self.requests.append((address, objectID, lifetime))
+        self.callbacks[objectID] = callback
+
+
+class _Requests():
+    """Count the requests made within a request limit."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.count = 0
+        self.active = False
+
+    def __enter__(self):
+        """Start a request."""
+        self.count += 1
+        self.active = True
+
+    def __exit__(self, *args):
+        """Finish a request."""
+        self.active = False
+
+
+class TestCOVSubscriptions(unittest.TestCase):
+    """Checks all COVSubscriptions methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        pass
+
+    def test_subscribe(self):
+        """Testing method / function subscribe."""
+        # Initialize key variables
+        bacnet = _BACnet()
+        cov = COVSubscriptions(bacnet, lifetime=100, renewal=20)
+
+        # Test
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=0)
+        self.assertEqual(
+            bacnet.requests,
+            [('127.0.0.1', ('analogValue', 1), 100),
+             ('127.0.0.1', ('binaryInput', 2), 100)])
+        self.assertTrue(cov.supported('target'))
+
+        # Subscriptions are only renewed when they are about to expire
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=79)
+        self.assertEqual(len(bacnet.requests), 2)
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=80)
+        self.assertEqual(len(bacnet.requests), 4)
+
+        # Subscription requests are made within the request limit
+        requests = _Requests()
+        cov = COVSubscriptions(_BACnet(limit=requests))
+        cov.subscribe(
+            'target', '127.0.0.1', _OBJECTIDS, requests=requests, now=0)
+        self.assertEqual(requests.count, 2)
+        self.assertTrue(cov.supported('target'))
+
+        # Targets that reject subscriptions are polled instead
+        cov = COVSubscriptions(_BACnet(error=UnrecognizedService()))
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=0)
+        self.assertFalse(cov.supported('target'))
+        self.assertTrue(cov.supported('other'))
+
+        # Subscriptions that fail for other reasons are tried again
+        bacnet = _BACnet(error=NoResponseFromController())
+        cov = COVSubscriptions(bacnet, lifetime=100, renewal=20)
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=0)
+        self.assertTrue(cov.supported('target'))
+        self.assertEqual(cov.values('target', _OBJECTIDS, now=1), {})
+        bacnet.error = None
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=1)
+        self.assertEqual(len(bacnet.requests), 2)
+
+    def test_values(self):
+        """Testing method / function values."""
+        # Initialize key variables
+        bacnet = _BACnet()
+        cov = COVSubscriptions(bacnet, lifetime=100, renewal=20)
+        cov.subscribe('target', '127.0.0.1', _OBJECTIDS, now=0)
+        self.assertEqual(cov.values('target', _OBJECTIDS, now=1), {})
+
+        # Test notifications
+        bacnet.callbacks[('analogValue', 1)](
+            elements={'properties': {'presentValue': 23.5}})
+        bacnet.callbacks[('binaryInput', 2)](
+            {'properties': {'statusFlags': [0, 0, 0, 0]}})
+        self.assertEqual(
+            cov.values('target', _OBJECTIDS, now=1),
+            {('analogValue', 1): 23.5})
+
+        # Expired subscriptions have no values
+        self.assertEqual(cov.values('target', _OBJECTIDS, now=100), {})
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
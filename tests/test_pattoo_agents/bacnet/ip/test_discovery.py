@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Test the BACnetIP discovery module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+            os.path.abspath(os.path.join(
+                os.path.abspath(os.path.join(
+                        EXEC_DIR,
+                        os.pardir)), os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = ('''\
+{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}bacnet{0}ip'''.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents.bacnet.ip.discovery import Device, DeviceCache
+from pattoo_agents.bacnet.ip import discovery
+from tests.libraries.configuration import UnittestConfig
+
+_DEVICE = Device(
+    device_id=5, max_apdu_length=480, segmentation='noSegmentation',
+    rpm=True, objects=[('analogValue', 1), ('binaryInput', 2)])
+
+
+class _BACnet():
+    """Respond to discovery requests made to a BAC0 object."""
+
+    def __init__(self, rpm=True, segmented=True, iam=True):
+        """Initialize the class."""
+        self._rpm = rpm
+        self._iam = iam
+        self._segmented = segmented
+        self._properties = {
+            'maxApduLengthAccepted': 480,
+            'segmentationSupported': 'noSegmentation',
+            'objectList': [('device', 5), ('analogValue', 1)]
+        }
+
+    def whois(self, address):
+        """Respond to a Who-Is request."""
+        if self._iam is False:
+            return [('127.0.0.2', 4)]
+        return [('127.0.0.2', 4), (address, 5)]
+
+    def readMultiple(self, args):
+        """Respond to a ReadPropertyMultiple request."""
+        if self._rpm is False:
+            raise ValueError('ReadPropertyMultiple not supported')
+        return [self._properties[_] for _ in args.split()[3:]]
+
+    def read(self, args, arr_index=None):
+        """Respond to a ReadProperty request."""
+        value = self._properties[args.split()[3]]
+        if arr_index is None:
+            if self._segmented is False and isinstance(value, list):
+                raise ValueError('Segmentation not supported')
+            return value
+        if arr_index == 0:
+            return len(value)
+        return value[arr_index - 1]
+
+
+class TestDeviceCache(unittest.TestCase):
+    """Checks all DeviceCache methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        # Test with a missing file
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename)
+            self.assertIsNone(devices.get('target'))
+
+            # Test with a corrupted file
+            with open(filename, 'w') as f_handle:
+                f_handle.write('{')
+            devices = DeviceCache(filename)
+            self.assertIsNone(devices.get('target'))
+
+    def test_get(self):
+        """Testing method / function get."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100)
+            devices.set('target', _DEVICE, now=0)
+
+            # Test
+            self.assertEqual(devices.get('target', now=99), _DEVICE)
+            self.assertIsNone(devices.get('target', now=100))
+            self.assertIsNone(devices.get('other', now=0))
+
+    def test_set(self):
+        """Testing method / function set."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100)
+            devices.set('target', _DEVICE, now=0)
+
+            # Test. The cache must be read from the file on restarts.
+            devices = DeviceCache(filename, ttl=100)
+            self.assertEqual(devices.get('target', now=1), _DEVICE)
+
+    def test_objects(self):
+        """Testing method / function objects."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100)
+            devices.set('target', _DEVICE, now=0)
+
+            # Test
+            self.assertEqual(
+                devices.objects(now=1), {'target': _DEVICE.objects})
+            self.assertEqual(devices.objects(now=100), {})
+
+    def test_due(self):
+        """Testing method / function due."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100, retry=10)
+
+            # Test
+            self.assertTrue(devices.due('target', now=0))
+            devices.set('target', _DEVICE, now=0)
+            self.assertFalse(devices.due('target', now=99))
+            self.assertTrue(devices.due('target', now=100))
+
+    def test_fail(self):
+        """Testing method / function fail."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100, retry=10)
+
+            # Test. The delay doubles with each failure up to the ttl.
+            devices.fail('target', now=0)
+            self.assertFalse(devices.due('target', now=9))
+            self.assertTrue(devices.due('target', now=10))
+            devices.fail('target', now=10)
+            self.assertFalse(devices.due('target', now=29))
+            self.assertTrue(devices.due('target', now=30))
+            for _ in range(5):
+                devices.fail('target', now=30)
+            self.assertFalse(devices.due('target', now=129))
+            self.assertTrue(devices.due('target', now=130))
+
+            # Test. Discovering the target resets the delay.
+            devices.set('target', _DEVICE, now=130)
+            devices.fail('target', now=230)
+            self.assertTrue(devices.due('target', now=240))
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_discover(self):
+        """Testing function discover."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100)
+
+            # Test
+            discovery.discover(
+                _BACnet(), devices, ['127.0.0.1', '127.0.0.3'], workers=2,
+                now=0)
+            self.assertEqual(devices.get('127.0.0.1', now=1).device_id, 5)
+            self.assertEqual(devices.get('127.0.0.3', now=1).device_id, 5)
+
+    def test_discover_failure(self):
+        """Testing function discover with targets that don't respond."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'devices.json')
+            devices = DeviceCache(filename, ttl=100, retry=10)
+
+            # Test. Failed targets aren't tried again until the delay ends.
+            discovery.discover(
+                _BACnet(iam=False), devices, ['127.0.0.1'], now=0)
+            self.assertIsNone(devices.get('127.0.0.1', now=1))
+            self.assertFalse(devices.due('127.0.0.1', now=5))
+            discovery.discover(_BACnet(), devices, ['127.0.0.1'], now=5)
+            self.assertIsNone(devices.get('127.0.0.1', now=6))
+            discovery.discover(_BACnet(), devices, ['127.0.0.1'], now=10)
+            self.assertEqual(devices.get('127.0.0.1', now=11).device_id, 5)
+
+    def test_discover_device(self):
+        """Testing function discover_device."""
+        # Initialize key variables
+        expected = Device(
+            device_id=5, max_apdu_length=480, segmentation='noSegmentation',
+            rpm=True, objects=[('analogValue', 1), ('device', 5)])
+
+        # Test
+        result = discovery.discover_device(_BACnet(), '127.0.0.1')
+        self.assertEqual(result, expected)
+
+        # Test devices without ReadPropertyMultiple or segmentation support
+        result = discovery.discover_device(
+            _BACnet(rpm=False, segmented=False), '127.0.0.1')
+        self.assertEqual(result, expected._replace(rpm=False))
+
+        # Test devices that don't respond to Who-Is
+        result = discovery.discover_device(_BACnet(iam=False), '127.0.0.1')
+        self.assertIsNone(result)
+
+    def test_max_apdu_length(self):
+        """Testing function max_apdu_length."""
+        # Test
+        self.assertEqual(discovery.max_apdu_length(None, 1476), 1476)
+        self.assertEqual(discovery.max_apdu_length(_DEVICE, 1476), 480)
+        self.assertEqual(discovery.max_apdu_length(_DEVICE, 240), 240)
+        self.assertEqual(
+            discovery.max_apdu_length(
+                _DEVICE._replace(segmentation='segmentedBoth'), 1476),
+            1476)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Test module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}bacnet'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_agents.bacnet.variables import (
+    BACnetVariable, TargetBACnetVariables)
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestBACnetVariable(unittest.TestCase):
+    """Checks all BACnetVariable methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        # Test defaults
+        variable = BACnetVariable(address=12)
+        self.assertTrue(variable.valid)
+        self.assertEqual(variable.object_type, 'analogValue')
+        self.assertEqual(variable.property_name, 'presentValue')
+        self.assertEqual(variable.multiplier, 1)
+        self.assertIsNone(variable.deadband)
+        self.assertEqual(variable.objectid, ('analogValue', 12))
+        self.assertEqual(
+            variable.point, ('analogValue', 12, 'presentValue'))
+        self.assertEqual(variable.key, 'analog_value_point_12')
+
+        # Test other object types and properties
+        variable = BACnetVariable(
+            address=3, object_type='multiStateInput',
+            property_name='outOfService', multiplier='2')
+        self.assertTrue(variable.valid)
+        self.assertEqual(variable.multiplier, 2)
+        self.assertEqual(
+            variable.key, 'multi_state_input_point_3_out_of_service')
+
+        # Test invalid values
+        for address in [None, True, False, 'test', -1, 4194304]:
+            variable = BACnetVariable(address=address)
+            self.assertFalse(variable.valid)
+            self.assertIsNone(variable.key)
+        for object_type in [None, 'test', 1]:
+            variable = BACnetVariable(address=1, object_type=object_type)
+            self.assertFalse(variable.valid)
+        for property_name in [None, '', 1]:
+            variable = BACnetVariable(address=1, property_name=property_name)
+            self.assertFalse(variable.valid)
+
+
+class TestTargetBACnetVariables(unittest.TestCase):
+    """Checks all TargetBACnetVariables methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        # Test
+        tbv = TargetBACnetVariables('localhost')
+        self.assertEqual(tbv.target, 'localhost')
+        self.assertEqual(tbv.data, [])
+        self.assertFalse(tbv.valid)
+
+    def test_add(self):
+        """Testing method / function add."""
+        # Test. Invalid variables must be ignored.
+        tbv = TargetBACnetVariables('localhost')
+        tbv.add([BACnetVariable(address=1), BACnetVariable(), 'test'])
+        self.assertTrue(tbv.valid)
+        self.assertEqual(len(tbv.data), 1)
+
+        tbv.add(BACnetVariable(address=2))
+        self.assertEqual(len(tbv.data), 2)
+
+    def test_points(self):
+        """Testing method / function points."""
+        # Initialize key variables
+        tbv = TargetBACnetVariables('localhost')
+        tbv.add([
+            BACnetVariable(address=2, object_type='binaryInput'),
+            BACnetVariable(address=1),
+            BACnetVariable(address=1, multiplier=10),
+            BACnetVariable(address=1, property_name='statusFlags')])
+
+        # Test. Duplicate points are only read once.
+        self.assertEqual(
+            tbv.points(),
+            [('analogValue', 1, 'presentValue'),
+             ('analogValue', 1, 'statusFlags'),
+             ('binaryInput', 2, 'presentValue')])
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test the Modbus TCP collector module."""
+
+# Standard imports
+import unittest
+from unittest import mock
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+            os.path.abspath(os.path.join(
+                os.path.abspath(os.path.join(
+                        EXEC_DIR,
+                        os.pardir)), os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = ('''\
+{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}modbus{0}tcp'''.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# PIP imports
+from pymodbus.register_read_message import (
+    ReadInputRegistersResponse, ReadHoldingRegistersResponse)
+
+# Pattoo imports
+from tests.libraries.configuration import UnittestConfig
+from pattoo_agents.modbus.tcp import collector
+from pattoo_agents.modbus.variables import (
+    InputRegisterVariable, HoldingRegisterVariable)
+
+
+class _Client():
+    """Fake ModbusTcpClient object that records its requests."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the class."""
+        self.requests = []
+        self.closed = False
+
+    def read_input_registers(self, address, count=1, unit=0):
+        """Read input registers."""
+        self.requests.append(('input', address, count, unit))
+        return ReadInputRegistersResponse(
+            list(range(1, count + 1)), unit=unit)
+
+    def read_holding_registers(self, address, count=1, unit=0):
+        """Read holding registers."""
+        self.requests.append(('holding', address, count, unit))
+        return ReadHoldingRegistersResponse(
+            list(range(1, count + 1)), unit=unit)
+
+    def close(self):
+        """Close the connection."""
+        self.closed = True
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__read_registers(self):
+        """Testing function _read_registers."""
+        # Initialize key variables
+        client = _Client()
+        variables = [
+            InputRegisterVariable(register=30003, count=4, unit=2),
+            HoldingRegisterVariable(register=40011, count=3, unit=5)]
+
+        # Test. Both functions are given the address, count and unit.
+        for variable in variables:
+            response = collector._read_registers(
+                client, 'localhost', variable)
+            self.assertEqual(response.registers, list(
+                range(1, variable.count + 1)))
+        self.assertEqual(
+            client.requests, [('input', 2, 4, 2), ('holding', 10, 3, 5)])
+
+    def test__bus_poller(self):
+        """Testing function _bus_poller."""
+        # Initialize key variables
+        client = _Client()
+        variables = [
+            HoldingRegisterVariable(
+                register=40011, count=2, unit=5, multiplier=10)]
+
+        # Test
+        with mock.patch.object(
+                collector, 'ModbusTcpClient', return_value=client):
+            (datapoints, _) = collector._bus_poller('localhost', variables)
+        self.assertEqual(client.requests, [('holding', 10, 2, 5)])
+        self.assertTrue(client.closed)
+        self.assertEqual(
+            [(_.key, _.value) for _ in datapoints],
+            [('holding_register_40011', 10), ('holding_register_40012', 20)])
+        for datapoint in datapoints:
+            self.assertEqual(datapoint.metadata['unit'], '005')
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
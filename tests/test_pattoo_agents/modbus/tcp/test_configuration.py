@@ -29,6 +29,7 @@ from pattoo_agents.modbus.tcp import configuration
 from pattoo_agents.modbus.variables import (
     InputRegisterVariable, HoldingRegisterVariable, RegisterVariable,
     TargetRegisterVariables)
+from pattoo_agents.deadband import Deadband
 from tests.libraries.configuration import UnittestConfig
 
 
@@ -53,6 +54,24 @@ class TestConfigModbusTCP(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_gateway_connections(self):
+        """Testing method / function gateway_connections."""
+        # Initialize key values
+        expected = 4
+
+        # Test
+        result = self.config.gateway_connections()
+        self.assertEqual(result, expected)
+
+    def test_bus_request_delay(self):
+        """Testing method / function bus_request_delay."""
+        # Initialize key values
+        expected = 0.05
+
+        # Test
+        result = self.config.bus_request_delay()
+        self.assertEqual(result, expected)
+
     def test_registervariables(self):
         """Testing method / function registervariables."""
         # Initialize variables
@@ -70,6 +89,7 @@ class TestConfigModbusTCP(unittest.TestCase):
             for _rv in drv.data:
                 self.assertTrue(isinstance(_rv, RegisterVariable))
                 self.assertTrue(_rv.valid)
+                self.assertEqual(_rv.bus, 2)
             register_variables.extend(drv.data)
 
         # Evaluate each RegisterVariable
@@ -80,18 +100,23 @@ class TestConfigModbusTCP(unittest.TestCase):
                 self.assertEqual(_rv.count, 2)
                 self.assertEqual(_rv.multiplier, 7)
                 self.assertEqual(_rv.unit, 3)
+                self.assertIsNone(_rv.deadband)
                 self.assertTrue(isinstance(_rv, InputRegisterVariable))
             elif index == 1:
                 self.assertEqual(_rv.address, 123)
                 self.assertEqual(_rv.count, 1)
                 self.assertEqual(_rv.multiplier, 9)
                 self.assertEqual(_rv.unit, 3)
+                self.assertIsNone(_rv.deadband)
                 self.assertTrue(isinstance(_rv, HoldingRegisterVariable))
             else:
                 self.assertEqual(_rv.address, 456)
                 self.assertEqual(_rv.count, 1)
                 self.assertEqual(_rv.multiplier, 9)
                 self.assertEqual(_rv.unit, 3)
+                self.assertEqual(
+                    _rv.deadband,
+                    Deadband(absolute=None, percent=5, heartbeat=None))
                 self.assertTrue(isinstance(_rv, HoldingRegisterVariable))
 
     def test_language(self):
@@ -237,6 +262,28 @@ class TestBasicFunctions(unittest.TestCase):
         # Tested by test_registervariables
         pass
 
+    def test__get_bus(self):
+        """Testing method / function _get_bus."""
+        # Test valid values
+        self.assertEqual(configuration._get_bus({'bus': 3}), 3)
+        self.assertEqual(configuration._get_bus({'bus': 3.6}), 3)
+
+        # Test invalid and missing values
+        for value in [None, True, False, 'test', [1]]:
+            self.assertEqual(configuration._get_bus({'bus': value}), 0)
+        self.assertEqual(configuration._get_bus({}), 0)
+        self.assertEqual(configuration._get_bus(None), 0)
+
+    def test__create_register_counts(self):
+        """Testing method / function _create_register_counts."""
+        # Test contiguous and non contiguous registers
+        result = configuration._create_register_counts([5, 1, 2, 3, 9, 2])
+        self.assertEqual(result, [(1, 3), (5, 1), (9, 1)])
+
+        # Test ranges larger than a single Modbus request
+        result = configuration._create_register_counts(list(range(300)))
+        self.assertEqual(result, [(0, 125), (125, 125), (250, 50)])
+
 
 if __name__ == '__main__':
     # Make sure the environment is OK to run unittests
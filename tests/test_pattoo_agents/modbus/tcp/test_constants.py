@@ -27,7 +27,8 @@ else:
 
 # Pattoo imports
 from tests.libraries.configuration import UnittestConfig
-from pattoo_agents.modbus.tcp.constants import PATTOO_AGENT_MODBUSTCPD
+from pattoo_agents.modbus.tcp.constants import (
+    PATTOO_AGENT_MODBUSTCPD, MODBUS_MAX_REGISTER_COUNT)
 
 
 class TestConstants(unittest.TestCase):
@@ -42,6 +43,7 @@ class TestConstants(unittest.TestCase):
         # Test
         self.assertEqual(
             PATTOO_AGENT_MODBUSTCPD, 'pattoo_agent_modbustcpd')
+        self.assertEqual(MODBUS_MAX_REGISTER_COUNT, 125)
 
 
 if __name__ == '__main__':
@@ -45,6 +45,12 @@ class TestRegisterVariable(unittest.TestCase):
         self.assertEqual(_rv.address, None)
         self.assertEqual(_rv.count, 2)
         self.assertEqual(_rv.unit, 3)
+        self.assertEqual(_rv.bus, 0)
+        self.assertTrue(_rv.valid)
+
+        # Test with a gateway bus
+        _rv = RegisterVariable(register=1, count=2, unit=3, bus=4)
+        self.assertEqual(_rv.bus, 4)
         self.assertTrue(_rv.valid)
 
         # Test with no arguments
@@ -328,6 +334,29 @@ class TestTargetRegisterVariables(unittest.TestCase):
         self.assertEqual(_variable.count, count)
         self.assertEqual(_variable.unit, unit)
 
+    def test_buses(self):
+        """Testing method / function buses."""
+        # Initialize TargetRegisterVariables
+        drv = TargetRegisterVariables('teddy_bear')
+        self.assertEqual(drv.buses(), {})
+
+        # Add variables for different buses and units
+        drv.add([
+            HoldingRegisterVariable(register=40060, count=2, unit=3, bus=1),
+            InputRegisterVariable(register=30050, count=1, unit=1, bus=1),
+            HoldingRegisterVariable(register=40050, count=4, unit=3, bus=1),
+            HoldingRegisterVariable(register=40050, count=4, unit=7),
+            HoldingRegisterVariable(register=40050, count=4, unit=5000)])
+
+        # Test. Invalid variables must be ignored.
+        result = drv.buses()
+        self.assertEqual(sorted(result.keys()), [0, 1])
+        self.assertEqual(len(result[0]), 1)
+        self.assertEqual(result[0][0].unit, 7)
+        self.assertEqual(
+            [(_rv.unit, _rv.register) for _rv in result[1]],
+            [(1, 30050), (3, 40050), (3, 40060)])
+
 
 if __name__ == '__main__':
     # Make sure the environment is OK to run unittests
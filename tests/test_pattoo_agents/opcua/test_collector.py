@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Test the OPC UA collector module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}opcua'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import asyncio
+
+# PIP imports
+from asyncua import ua
+
+# Pattoo imports
+from pattoo_shared.variables import PollingPoint, TargetPollingPoints
+from pattoo_shared.constants import DATA_INT
+from pattoo_agents.opcua import collector
+from pattoo_agents.opcua.loop import EventLoop
+from pattoo_agents.opcua.constants import (
+    OPCUAauth, OPCUAsubscription, OPCUAvalue)
+from tests.libraries.configuration import UnittestConfig
+
+_AUTH = OPCUAauth(
+    ip_target='localhost', ip_port=4840, username=None, password=None)
+
+_MAX_NODES_PER_READ = (
+    ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRead)
+
+
+class _Node():
+    """Node returned by a fake asyncua Client object."""
+
+    def __init__(self, client, nodeid):
+        """Initialize the class."""
+        self.nodeid = nodeid
+        self._client = client
+
+    async def read_value(self):
+        """Read the value of the node."""
+        self._client.limit_reads += 1
+        return self._client.limit
+
+
+class _UAClient():
+    """Respond to the requests made by a fake asyncua Client object."""
+
+    def __init__(self, bad=None, error=False):
+        """Initialize the class."""
+        self.batches = []
+        self._bad = bad or {}
+        self._error = error
+
+    async def register_nodes(self, nodeids):
+        """Register nodes."""
+        return nodeids
+
+    async def read_attributes(self, nodeids, attribute):
+        """Read the values of nodes."""
+        self.batches.append(list(nodeids))
+        if self._error is True:
+            raise ConnectionError('Server unavailable')
+        result = []
+        for nodeid in nodeids:
+            result.append(ua.DataValue(
+                ua.Variant(int(nodeid.split('=')[-1]), ua.VariantType.Int32),
+                ua.StatusCode(self._bad.get(nodeid, ua.StatusCodes.Good))))
+        return result
+
+
+class _Client():
+    """Fake asyncua Client object."""
+
+    def __init__(self, limit=0, bad=None, error=False):
+        """Initialize the class."""
+        self.uaclient = _UAClient(bad=bad, error=error)
+        self.limit = limit
+        self.limit_reads = 0
+
+    def get_node(self, address):
+        """Get a node."""
+        return _Node(self, address)
+
+    async def get_namespace_array(self):
+        """Get the NamespaceArray."""
+        return ['http://opcfoundation.org/UA/']
+
+
+class _Sessions():
+    """Fake Sessions object."""
+
+    def __init__(self, client):
+        """Initialize the class."""
+        self._client = client
+        self.invalidated = []
+
+    async def client(self, auth):
+        """Get a connected client."""
+        return self._client
+
+    async def invalidate(self, auth):
+        """Close a session."""
+        self.invalidated.append(auth)
+
+
+class _Subscriptions():
+    """Fake Subscriptions object with one monitored node per server."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.subscribing = 0
+        self.concurrent = 0
+
+    async def subscribe(self, tpp, settings):
+        """Subscribe to a server, yielding to other coroutines."""
+        self.subscribing += 1
+        self.concurrent = max(self.concurrent, self.subscribing)
+        await asyncio.sleep(0.01)
+        self.subscribing -= 1
+        return True
+
+    def monitored(self, auth):
+        """Get the addresses of the monitored items of a server."""
+        return {'ns=2;i=1'}
+
+    def values(self, auth, aggregate='latest'):
+        """Get the values received since the last polling interval."""
+        return {'ns=2;i=1': OPCUAvalue(
+            value=10, data_type=DATA_INT, timestamp=None)}
+
+
+def _tpp(count, auth=_AUTH):
+    """Create a TargetPollingPoints object with count polling points."""
+    result = TargetPollingPoints(auth)
+    result.add([
+        PollingPoint(address='ns=2;i={}'.format(_), multiplier=1)
+        for _ in range(1, count + 1)])
+    return result
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Start the event loop."""
+        self.loop = EventLoop()
+
+    def tearDown(self):
+        """Stop the event loop."""
+        self.loop.stop()
+
+    def test__poll_target_async(self):
+        """Testing function _poll_target_async."""
+        # Initialize key variables
+        client = _Client(limit=2)
+        sessions = _Sessions(client)
+
+        # Test. Nodes are read in batches of up to MaxNodesPerRead nodes.
+        result = self.loop.run(
+            collector._poll_target_async(_tpp(5), sessions, limit=2))
+        self.assertEqual(
+            [len(_) for _ in client.uaclient.batches], [2, 2, 1])
+        self.assertEqual(
+            [_.value for _ in result.data], [1, 2, 3, 4, 5])
+        self.assertEqual(sessions.invalidated, [])
+
+    def test__poll_target_async_bad(self):
+        """Testing function _poll_target_async with bad values."""
+        # Initialize key variables
+        client = _Client(bad={
+            'ns=2;i=2': ua.StatusCodes.BadNodeIdUnknown,
+            'ns=2;i=3': ua.StatusCodes.BadNotReadable,
+            'ns=2;i=4': ua.StatusCodes.UncertainLastUsableValue})
+        sessions = _Sessions(client)
+
+        # Test. Only bad values are dropped, and the session is kept.
+        result = self.loop.run(
+            collector._poll_target_async(_tpp(4), sessions))
+        self.assertEqual([_.value for _ in result.data], [1, 4])
+        self.assertEqual(sessions.invalidated, [])
+
+    def test__poll_target_async_error(self):
+        """Testing function _poll_target_async with failed requests."""
+        # Initialize key variables
+        client = _Client(error=True)
+        sessions = _Sessions(client)
+
+        # Test. The session is closed.
+        result = self.loop.run(
+            collector._poll_target_async(_tpp(2), sessions))
+        self.assertEqual(result.data, [])
+        self.assertEqual(sessions.invalidated, [_AUTH])
+
+    def test__poll_async(self):
+        """Testing function _poll_async with subscriptions."""
+        # Initialize key variables
+        client = _Client()
+        sessions = _Sessions(client)
+        subscriptions = _Subscriptions()
+        auths = [_AUTH, _AUTH._replace(ip_port=4841)]
+        settings = {
+            _: OPCUAsubscription(
+                sampling_interval=1000, aggregate='latest', deadbands={})
+            for _ in auths}
+
+        # Test. Servers are subscribed to at the same time, and nodes that
+        # aren't monitored are polled.
+        result = self.loop.run(collector._poll_async(
+            [_tpp(2, auth=_) for _ in auths], sessions,
+            subscriptions=subscriptions, settings=settings))
+        self.assertEqual(subscriptions.concurrent, 2)
+        self.assertEqual(
+            [[_.value for _ in items.data] for items in result],
+            [[10], [2], [10], [2]])
+        self.assertEqual(client.uaclient.batches, [['ns=2;i=2']] * 2)
+
+        # Test. Servers without subscriptions are polled.
+        result = self.loop.run(collector._poll_async(
+            [_tpp(2)], sessions, subscriptions=subscriptions))
+        self.assertEqual([[_.value for _ in result[0].data]], [[1, 2]])
+
+    def test__max_nodes_per_read(self):
+        """Testing function _max_nodes_per_read."""
+        # Test
+        client = _Client(limit=50)
+        self.assertEqual(
+            self.loop.run(collector._max_nodes_per_read(client)), 50)
+
+        # Test. The limit is only read once for each session.
+        client.limit = 10
+        self.assertEqual(
+            self.loop.run(collector._max_nodes_per_read(client)), 50)
+        self.assertEqual(client.limit_reads, 1)
+
+        # Test. Zero means that there is no limit.
+        self.assertEqual(
+            self.loop.run(collector._max_nodes_per_read(_Client(limit=0))),
+            collector.OPCUA_MAX_NODES_PER_READ)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -25,7 +25,7 @@ else:
 # Pattoo imports
 from pattoo_shared.variables import PollingPoint, TargetPollingPoints
 from pattoo_agents.opcua import configuration
-from pattoo_agents.opcua.constants import OPCUAauth
+from pattoo_agents.opcua.constants import OPCUAauth, OPCUAsubscription
 from tests.libraries.configuration import UnittestConfig
 
 
@@ -50,6 +50,31 @@ class TestConfigOPCUA(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_session_timeout(self):
+        """Testing function session_timeout."""
+        # Test
+        result = self.config.session_timeout()
+        self.assertEqual(result, 600)
+
+    def test_server_concurrent_requests(self):
+        """Testing function server_concurrent_requests."""
+        # Test
+        result = self.config.server_concurrent_requests()
+        self.assertEqual(result, 3)
+
+    def test_polling_processes(self):
+        """Testing function polling_processes."""
+        # Test
+        result = self.config.polling_processes()
+        self.assertEqual(result, 2)
+
+    def test_nodeid_cache_file(self):
+        """Testing function nodeid_cache_file."""
+        # Test
+        expected = '{}{}pattoo_agent_opcuad_nodeids_1.json'.format(
+            self.config.cache_directory(), os.sep)
+        self.assertEqual(self.config.nodeid_cache_file(shard=1), expected)
+
     def test_target_polling_points(self):
         """Testing function target_polling_points."""
         # Initialize key variables.
@@ -78,6 +103,59 @@ class TestConfigOPCUA(unittest.TestCase):
             self.assertEqual(result.address, expected[index].address)
             self.assertEqual(result.multiplier, expected[index].multiplier)
 
+    def test_subscriptions(self):
+        """Testing function subscriptions."""
+        # Initialize key variables.
+        auth = OPCUAauth(
+            ip_target='unittest.opcua.tcp.target.net',
+            ip_port=7844,
+            username='nTbJazc6q3MaMazT',
+            password='eQ6KnJcCk3qLkB73')
+        expected = {
+            auth: OPCUAsubscription(
+                sampling_interval=500,
+                aggregate='average',
+                deadbands={1: 0.5, 3: 2})
+        }
+
+        # Test
+        result = self.config.subscriptions()
+        self.assertEqual(result, expected)
+
+    def test_polling_groups_merged(self):
+        """Testing polling groups that share a server."""
+        # Initialize key variables
+        config = configuration.ConfigOPCUA()
+        group = {'ip_target': 'localhost', 'ip_port': 4840}
+        config._agent_config = {
+            'pattoo_agent_opcuad': {
+                'polling_groups': [
+                    dict(group, subscribe=True, deadband=1, nodes=[
+                        {'address': 1}]),
+                    dict(group, subscribe=True, sampling_interval=100,
+                         nodes=[{'address': 2, 'deadband': 3}]),
+                    {'ip_target': 'other', 'ip_port': 4840,
+                     'nodes': [{'address': 4}]}
+                ]
+            }
+        }
+        auth = OPCUAauth(
+            ip_target='localhost', ip_port=4840, username=None,
+            password=None)
+
+        # The nodes of all the groups of a server are polled together
+        result = config.target_polling_points()
+        self.assertEqual(
+            [_.target.ip_target for _ in result], ['localhost', 'other'])
+        self.assertEqual([_.address for _ in result[0].data], [1, 2])
+
+        # The server has one subscription with the first group's settings
+        result = config.subscriptions()
+        self.assertEqual(
+            result, {auth: OPCUAsubscription(
+                sampling_interval=1000, aggregate='latest',
+                deadbands={1: 1, 2: 3})})
+
     def test_language(self):
         """Test pattoo_shared.Config inherited method language."""
         # Initialize key values
@@ -209,6 +287,34 @@ class TestConfigOPCUA(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__nodes(self):
+        """Testing function _nodes."""
+        # Test
+        nodes = [
+            {'address': 'ns=2;i=3', 'multiplier': 2},
+            {'browse_path': '0:Objects/2:Boiler/2:Temperature/'},
+            {'browse_path': '/'}]
+        expected = [
+            {'address': 'ns=2;i=3', 'multiplier': 2},
+            {'browse_path': '0:Objects/2:Boiler/2:Temperature/',
+             'address': '/0:Objects/2:Boiler/2:Temperature'},
+            {'browse_path': '/'}]
+        self.assertEqual(configuration._nodes(nodes), expected)
+        self.assertEqual(configuration._nodes(None), [])
+
+    def test__deadband(self):
+        """Testing function _deadband."""
+        # Test
+        self.assertEqual(configuration._deadband(2), 2)
+        self.assertEqual(configuration._deadband('-0.5'), 0.5)
+        for value in [None, True, False, 0, 'test']:
+            self.assertIsNone(configuration._deadband(value))
+
+
 if __name__ == '__main__':
     # Make sure the environment is OK to run unittests
     UnittestConfig().create()
@@ -28,6 +28,8 @@ from tests.libraries.configuration import UnittestConfig
 
 from pattoo_agents.opcua.constants import PATTOO_AGENT_OPCUAD
 from pattoo_agents.opcua.constants import OPCUAauth
+from pattoo_agents.opcua.constants import OPCUA_MAX_NODES_PER_READ
+from pattoo_agents.opcua.constants import OPCUAvalue
 
 
 class TestConstants(unittest.TestCase):
@@ -47,6 +49,11 @@ class TestConstants(unittest.TestCase):
         _ = OPCUAauth(
             ip_target='a', ip_port='b', username='c', password='d')
 
+        _ = OPCUAvalue(value=1, data_type=99, timestamp=None)
+
+        # Test read limits
+        self.assertEqual(OPCUA_MAX_NODES_PER_READ, 1000)
+
 
 
 if __name__ == '__main__':
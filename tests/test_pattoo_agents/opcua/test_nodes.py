@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Test the OPC UA nodes module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}opcua'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents.opcua.nodes import NodeResolver
+from pattoo_agents.opcua import nodes
+from pattoo_agents.opcua.loop import EventLoop
+from pattoo_agents.opcua.constants import OPCUAauth
+from tests.libraries.configuration import UnittestConfig
+
+_AUTH = OPCUAauth(
+    ip_target='localhost', ip_port=4840, username=None, password=None)
+
+
+class _Node():
+    """Node returned by a fake asyncua Client object."""
+
+    def __init__(self, nodeid):
+        """Initialize the class."""
+        self.nodeid = nodeid
+
+
+class _UAClient():
+    """Record the requests made by a fake asyncua Client object."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.registered = []
+
+    async def register_nodes(self, nodeids):
+        """Register nodes."""
+        self.registered.extend(nodeids)
+        return ['registered_{}'.format(_) for _ in nodeids]
+
+
+class _Client():
+    """Fake asyncua Client object."""
+
+    def __init__(self, namespaces=None):
+        """Initialize the class."""
+        self.uaclient = _UAClient()
+        self.namespaces = namespaces or ['http://opcfoundation.org/UA/']
+
+    def get_node(self, address):
+        """Get a node."""
+        if address == 'invalid':
+            raise ValueError(address)
+        return _Node(address)
+
+    async def get_namespace_array(self):
+        """Get the NamespaceArray."""
+        return self.namespaces
+
+
+class TestNodeResolver(unittest.TestCase):
+    """Checks all NodeResolver methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Start the event loop."""
+        self.loop = EventLoop()
+
+    def tearDown(self):
+        """Stop the event loop."""
+        self.loop.stop()
+
+    def test_nodeids(self):
+        """Testing method / function nodeids."""
+        # Initialize key variables
+        resolver = NodeResolver(None)
+        client = _Client()
+
+        # Test. Invalid addresses are excluded.
+        result = self.loop.run(resolver.nodeids(
+            _AUTH, client, ['ns=2;i=1', 'invalid']))
+        self.assertEqual(result, {'ns=2;i=1': 'registered_ns=2;i=1'})
+
+        # Nodes are only registered once per session
+        result = self.loop.run(resolver.nodeids(
+            _AUTH, client, ['ns=2;i=1', 'ns=2;i=2']))
+        self.assertEqual(result, {'ns=2;i=1': 'registered_ns=2;i=1',
+                                  'ns=2;i=2': 'registered_ns=2;i=2'})
+        self.assertEqual(client.uaclient.registered, ['ns=2;i=1', 'ns=2;i=2'])
+
+        # Nodes are registered again with new sessions
+        client = _Client()
+        self.loop.run(resolver.nodeids(_AUTH, client, ['ns=2;i=1']))
+        self.assertEqual(client.uaclient.registered, ['ns=2;i=1'])
+
+    def test__check_namespaces(self):
+        """Testing method / function _check_namespaces."""
+        # Initialize key variables
+        resolver = NodeResolver(None)
+        url = 'opc.tcp://localhost:4840'
+        resolver._paths[url] = {
+            'namespaces': ['http://opcfoundation.org/UA/'],
+            'nodeids': {'/0:Objects/2:Boiler': 'ns=2;i=1'}}
+
+        # Test. Resolved browse paths are kept if namespaces are unchanged.
+        self.loop.run(resolver._check_namespaces(_AUTH, _Client()))
+        self.assertEqual(
+            resolver._paths[url]['nodeids'],
+            {'/0:Objects/2:Boiler': 'ns=2;i=1'})
+
+        # Resolved browse paths are discarded if namespaces changed
+        client = _Client(
+            namespaces=['http://opcfoundation.org/UA/', 'urn:boiler'])
+        self.loop.run(resolver._check_namespaces(_AUTH, client))
+        self.assertEqual(resolver._paths[url], {
+            'namespaces': ['http://opcfoundation.org/UA/', 'urn:boiler'],
+            'nodeids': {}})
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_is_browse_path(self):
+        """Testing function is_browse_path."""
+        # Test
+        self.assertTrue(nodes.is_browse_path('/0:Objects/2:Boiler'))
+        for address in ['ns=2;i=1', 'i=2253', 1, None]:
+            self.assertFalse(nodes.is_browse_path(address))
+
+    def test__url(self):
+        """Testing function _url."""
+        # Test
+        self.assertEqual(nodes._url(_AUTH), 'opc.tcp://localhost:4840')
+
+    def test__load(self):
+        """Testing function _load."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'nodeids.json')
+            self.assertEqual(nodes._load(filename), {})
+            self.assertEqual(nodes._load(None), {})
+
+            # Unreadable files are ignored
+            with open(filename, 'w') as f_handle:
+                f_handle.write('test')
+            self.assertEqual(nodes._load(filename), {})
+
+    def test__save(self):
+        """Testing function _save."""
+        # Initialize key variables
+        paths = {'opc.tcp://localhost:4840': {
+            'namespaces': ['http://opcfoundation.org/UA/'],
+            'nodeids': {'/0:Objects/2:Boiler': 'ns=2;i=1'}}}
+
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'nodeids.json')
+            nodes._save(filename, paths)
+            self.assertEqual(nodes._load(filename), paths)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test the OPC UA session module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}opcua'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import asyncio
+
+# Pattoo imports
+from pattoo_agents.opcua.session import Sessions
+from pattoo_agents.opcua.loop import EventLoop
+from pattoo_agents.opcua.constants import OPCUAauth
+from tests.libraries.configuration import UnittestConfig
+
+_AUTH = OPCUAauth(
+    ip_target='localhost', ip_port=4840, username=None, password=None)
+
+
+class _Client():
+    """Record the calls made to an asyncua Client object."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.disconnected = False
+
+    async def check_connection(self):
+        """Check the connection."""
+        return
+
+    async def disconnect(self):
+        """Disconnect."""
+        self.disconnected = True
+
+
+class _Sessions(Sessions):
+    """Sessions object that counts new sessions."""
+
+    def __init__(self, loop):
+        """Initialize the class."""
+        Sessions.__init__(self, loop)
+        self.connections = 0
+
+    async def _connect(self, auth):
+        """Create a session, yielding to other coroutines."""
+        self.connections += 1
+        await asyncio.sleep(0.01)
+        return _Client()
+
+
+class TestSessions(unittest.TestCase):
+    """Checks all Sessions methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Start the event loop."""
+        self.loop = EventLoop()
+
+    def tearDown(self):
+        """Stop the event loop."""
+        self.loop.stop()
+
+    def test_client(self):
+        """Testing method / function client."""
+        # Initialize key variables
+        sessions = Sessions(self.loop)
+        client = _Client()
+        sessions._clients[_AUTH] = client
+
+        # Test. Healthy sessions must be reused.
+        result = self.loop.run(sessions.client(_AUTH))
+        self.assertIs(result, client)
+
+    def test_client_concurrent(self):
+        """Testing method / function client with concurrent callers."""
+        # Initialize key variables
+        sessions = _Sessions(self.loop)
+
+        async def clients():
+            """Get clients for the same server at the same time."""
+            return await asyncio.gather(
+                sessions.client(_AUTH), sessions.client(_AUTH))
+
+        # Test. Only one session must be created.
+        result = self.loop.run(clients())
+        self.assertIs(result[0], result[1])
+        self.assertEqual(sessions.connections, 1)
+        self.assertTrue(sessions.connected(_AUTH, result[0]))
+
+    def test_connected(self):
+        """Testing method / function connected."""
+        # Initialize key variables
+        sessions = Sessions(self.loop)
+        client = _Client()
+
+        # Test
+        self.assertFalse(sessions.connected(_AUTH, client))
+        sessions._clients[_AUTH] = client
+        self.assertTrue(sessions.connected(_AUTH, client))
+        self.assertFalse(sessions.connected(_AUTH, _Client()))
+
+    def test_invalidate(self):
+        """Testing method / function invalidate."""
+        # Initialize key variables
+        sessions = Sessions(self.loop)
+        client = _Client()
+        sessions._clients[_AUTH] = client
+
+        # Test
+        self.loop.run(sessions.invalidate(_AUTH))
+        self.assertTrue(client.disconnected)
+        self.assertFalse(sessions.connected(_AUTH, client))
+
+        # Invalidating closed sessions must not fail
+        self.loop.run(sessions.invalidate(_AUTH))
+
+    def test_close(self):
+        """Testing method / function close."""
+        # Initialize key variables
+        sessions = Sessions(self.loop)
+        clients = [_Client(), _Client()]
+        sessions._clients[_AUTH] = clients[0]
+        sessions._clients[_AUTH._replace(ip_port=4841)] = clients[1]
+
+        # Test
+        self.loop.run(sessions.close())
+        self.assertTrue(clients[0].disconnected)
+        self.assertTrue(clients[1].disconnected)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test the OPC UA subscription module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}opcua'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_agents.opcua.subscription import Subscriptions
+from pattoo_agents.opcua import subscription
+from pattoo_agents.opcua.constants import OPCUAauth, OPCUAvalue
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT, DATA_STRING
+from tests.libraries.configuration import UnittestConfig
+
+_AUTH = OPCUAauth(
+    ip_target='localhost', ip_port=4840, username=None, password=None)
+
+
+def _value(value):
+    """Create an OPCUAvalue sampled at the time given by its value."""
+    return OPCUAvalue(
+        value=value, data_type=DATA_INT, timestamp=value * 1000)
+
+
+class TestSubscriptions(unittest.TestCase):
+    """Checks all Subscriptions methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        # Test
+        subscriptions = Subscriptions(None)
+        self.assertFalse(subscriptions.active(_AUTH))
+        self.assertEqual(subscriptions.monitored(_AUTH), set())
+        self.assertEqual(subscriptions.values(_AUTH), {})
+
+    def test_notification(self):
+        """Testing method / function notification."""
+        # Initialize key variables
+        subscriptions = Subscriptions(None)
+        subscriptions._addresses[(_AUTH, 'nodeid')] = 'address'
+        subscriptions._monitored[_AUTH] = ['address']
+
+        # Test. Unknown nodes must be ignored.
+        subscriptions.notification(_AUTH, 'other', _value(1))
+        self.assertEqual(subscriptions.values(_AUTH), {})
+        for value in [4, 2, 6]:
+            subscriptions.notification(_AUTH, 'nodeid', _value(value))
+        self.assertEqual(
+            subscriptions.values(_AUTH, aggregate='average'),
+            {'address': OPCUAvalue(
+                value=4, data_type=DATA_FLOAT, timestamp=6000)})
+
+        # The latest value is reported when nothing changes
+        self.assertEqual(
+            subscriptions.values(_AUTH, aggregate='average'),
+            {'address': _value(6)})
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__aggregate(self):
+        """Testing function _aggregate."""
+        # Initialize key variables
+        entry = {'latest': _value(6), 'count': 3, 'total': 12,
+                 'minimum': 2, 'maximum': 6}
+
+        # Test
+        self.assertEqual(
+            subscription._aggregate(entry, 'latest'), _value(6))
+        self.assertEqual(
+            subscription._aggregate(entry, 'average'),
+            OPCUAvalue(value=4, data_type=DATA_FLOAT, timestamp=6000))
+        self.assertEqual(
+            subscription._aggregate(entry, 'minimum').value, 2)
+        self.assertEqual(
+            subscription._aggregate(entry, 'maximum').value, 6)
+
+        # Non numeric values are not aggregated
+        value = OPCUAvalue(value='test', data_type=DATA_STRING, timestamp=1)
+        entry = subscription._entry(value, count=2)
+        self.assertEqual(subscription._aggregate(entry, 'average'), value)
+
+    def test__entry(self):
+        """Testing function _entry."""
+        # Test
+        result = subscription._entry(_value(3), count=1)
+        self.assertEqual(
+            result, {'latest': _value(3), 'count': 1, 'total': 3,
+                     'minimum': 3, 'maximum': 3})
+        result = subscription._entry(_value(3))
+        self.assertEqual(result['total'], 0)
+
+    def test__numeric(self):
+        """Testing function _numeric."""
+        # Test
+        self.assertTrue(subscription._numeric(_value(3)))
+        self.assertFalse(subscription._numeric(OPCUAvalue(
+            value='3', data_type=DATA_STRING, timestamp=None)))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
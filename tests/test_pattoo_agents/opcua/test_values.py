@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test the OPC UA values module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}opcua'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import datetime
+
+# PIP imports
+from asyncua import ua
+
+# Pattoo imports
+from pattoo_shared.constants import DATA_INT, DATA_FLOAT, DATA_STRING
+from pattoo_agents.opcua import values
+from pattoo_agents.opcua.constants import OPCUAvalue
+from tests.libraries.configuration import UnittestConfig
+
+_SOURCE = datetime.datetime(2020, 1, 1, 0, 0, 1)
+_SERVER = datetime.datetime(2020, 1, 1, 0, 0, 2)
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_convert(self):
+        """Testing function convert."""
+        # Test types
+        items = [
+            (ua.Variant(True, ua.VariantType.Boolean), 1, DATA_INT),
+            (ua.Variant(-3, ua.VariantType.Int16), -3, DATA_INT),
+            (ua.Variant(3, ua.VariantType.UInt64), 3, DATA_INT),
+            (ua.Variant(0.5, ua.VariantType.Double), 0.5, DATA_FLOAT),
+            (ua.Variant('test', ua.VariantType.String), 'test', DATA_STRING),
+            (ua.Variant(ua.LocalizedText('text'),
+                        ua.VariantType.LocalizedText), 'text', DATA_STRING),
+            (ua.Variant(_SOURCE, ua.VariantType.DateTime),
+             '2020-01-01T00:00:01', DATA_STRING)]
+        for variant, value, data_type in items:
+            result = values.convert(
+                ua.DataValue(variant, SourceTimestamp=_SOURCE))
+            self.assertEqual(
+                result, OPCUAvalue(
+                    value=value, data_type=data_type,
+                    timestamp=1577836801000))
+
+        # Server timestamps are used if there is no source timestamp
+        result = values.convert(ua.DataValue(
+            ua.Variant(3, ua.VariantType.Int32), ServerTimestamp=_SERVER))
+        self.assertEqual(result.timestamp, 1577836802000)
+        result = values.convert(
+            ua.DataValue(ua.Variant(3, ua.VariantType.Int32)))
+        self.assertIsNone(result.timestamp)
+
+        # Empty values, arrays and unsupported types are not converted
+        for variant in [
+                ua.Variant(),
+                ua.Variant([1, 2], ua.VariantType.Int32),
+                ua.Variant(b'test', ua.VariantType.ByteString)]:
+            self.assertIsNone(values.convert(ua.DataValue(variant)))
+
+    def test_timestamp_ms(self):
+        """Testing function timestamp_ms."""
+        # Test
+        self.assertEqual(values.timestamp_ms(_SOURCE), 1577836801000)
+        self.assertEqual(
+            values.timestamp_ms(
+                _SOURCE.replace(tzinfo=datetime.timezone.utc)),
+            1577836801000)
+        self.assertIsNone(values.timestamp_ms(None))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Test the cgroups module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import shutil
+import tempfile
+
+# Pattoo imports
+from pattoo_shared.constants import DATA_INT, DATA_COUNT64
+from pattoo_agents.os.cgroups import CgroupStats
+from pattoo_agents.os import cgroups
+from tests.libraries.configuration import UnittestConfig
+
+
+def _cgroup(directory, files=None):
+    """Create a cgroup directory with its files."""
+    os.makedirs(directory, exist_ok=True)
+    for filename, text in (files or {}).items():
+        with open(os.path.join(directory, filename), 'w') as f_handle:
+            f_handle.write(text)
+
+
+class TestCgroupStats(unittest.TestCase):
+    """Checks all CgroupStats methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_cgroups(self):
+        """Testing method / function cgroups."""
+        with tempfile.TemporaryDirectory() as root:
+            # Initialize key variables
+            _cgroup(root, {'cgroup.controllers': 'cpu io memory pids'})
+            system = os.path.join(root, 'system.slice')
+            nginx = os.path.join(system, 'nginx.service')
+            _cgroup(os.path.join(nginx, 'child'))
+            cgroup_stats = CgroupStats(root=root)
+
+            # Test. Matching cgroups are not descended into.
+            self.assertEqual(cgroup_stats.cgroups(now=0), [nginx])
+
+            # Changes are found
+            sshd = os.path.join(system, 'sshd.service')
+            _cgroup(sshd)
+            os.utime(system, ns=(1, 1))
+            self.assertEqual(cgroup_stats.cgroups(now=1), [nginx, sshd])
+            shutil.rmtree(system)
+            self.assertEqual(cgroup_stats.cgroups(now=2), [])
+
+    def test_datapoints(self):
+        """Testing method / function datapoints."""
+        with tempfile.TemporaryDirectory() as root:
+            # Test. Nothing is reported without a cgroup v2 hierarchy.
+            _cgroup(os.path.join(root, 'docker-1.scope'))
+            self.assertEqual(CgroupStats(root=root).datapoints(), [])
+
+            # Test
+            _cgroup(root, {'cgroup.controllers': 'memory'})
+            _cgroup(
+                os.path.join(root, 'docker-1.scope'),
+                {'memory.current': '1024\n'})
+            result = CgroupStats(root=root).datapoints()
+            self.assertEqual(len(result), 1)
+            self.assertEqual(result[0].key, 'cgroup_memory_current')
+            self.assertEqual(result[0].value, 1024)
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_usage(self):
+        """Testing function usage."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Initialize key variables
+            _cgroup(directory, {
+                'cpu.stat': 'usage_usec 100\nuser_usec 60\nsystem_usec 40\n',
+                'memory.current': '4096\n',
+                'pids.current': '3\n',
+                'io.stat': '''\
+8:0 rbytes=10 wbytes=20 rios=1 wios=2 dbytes=0 dios=0
+8:16 rbytes=5 wbytes=5 rios=1 wios=1 dbytes=0 dios=0
+'''})
+
+            # Test
+            result = cgroups.usage(directory)
+        self.assertEqual(result, [
+            ('cgroup_cpu_usage_usec', 100, DATA_COUNT64),
+            ('cgroup_cpu_user_usec', 60, DATA_COUNT64),
+            ('cgroup_cpu_system_usec', 40, DATA_COUNT64),
+            ('cgroup_memory_current', 4096, DATA_INT),
+            ('cgroup_pids_current', 3, DATA_INT),
+            ('cgroup_io_dbytes', 0, DATA_COUNT64),
+            ('cgroup_io_dios', 0, DATA_COUNT64),
+            ('cgroup_io_rbytes', 15, DATA_COUNT64),
+            ('cgroup_io_rios', 2, DATA_COUNT64),
+            ('cgroup_io_wbytes', 25, DATA_COUNT64),
+            ('cgroup_io_wios', 3, DATA_COUNT64)])
+
+    def test__read_value(self):
+        """Testing function _read_value."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Test. "max" isn't a number.
+            filename = os.path.join(directory, 'pids.max')
+            self.assertIsNone(cgroups._read_value(filename))
+            _cgroup(directory, {'pids.max': 'max\n'})
+            self.assertIsNone(cgroups._read_value(filename))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
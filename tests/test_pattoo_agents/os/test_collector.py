@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test the OS collector module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_shared.variables import DataPoint, DataPointMetadata
+from pattoo_agents.os.collector import Performance
+from pattoo_agents.os import proc
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestPerformance(unittest.TestCase):
+    """Checks all Performance methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    metadata = [DataPointMetadata('hostname', 'localhost')]
+
+    def test_stats_system(self):
+        """Testing method / function stats_system."""
+        # Initialize key variables
+        performance = Performance(self.metadata)
+
+        # Test
+        result = performance.stats_system()
+        for item in result:
+            self.assertIsInstance(item, DataPoint)
+            self.assertEqual(
+                item.metadata.get('hostname'), 'localhost')
+        keys = [_.key for _ in result]
+        for key in [
+                'process_count', 'load_average_01min', 'load_average_05min',
+                'load_average_15min', 'memory_total']:
+            self.assertIn(key, keys)
+
+        # The times of each CPU are only reported if requested
+        self.assertNotIn('cpu_core_times_user', keys)
+
+    def test_stats_system_per_cpu(self):
+        """Testing method / function stats_system with per_cpu."""
+        # Initialize key variables
+        performance = Performance(self.metadata)
+
+        # Test
+        result = performance.stats_system(per_cpu=True)
+        cores = [_ for _ in result if _.key.startswith('cpu_core_times_')]
+        self.assertIn('cpu_core_times_user', [_.key for _ in cores])
+        self.assertEqual(
+            sorted(set(str(_.metadata.get('cpu_core')) for _ in cores)),
+            sorted(str(_[0]) for _ in proc.snapshot().per_cpu_times))
+        for item in cores:
+            self.assertIn('cpu_core', item.metadata)
+            self.assertEqual(
+                item.metadata.get('hostname'), 'localhost')
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -24,6 +24,7 @@ else:
 
 # Pattoo imports
 from pattoo_agents.os import configuration
+from pattoo_agents.os.constants import DiskFilters, DISK_FILTERS
 from tests.libraries.configuration import UnittestConfig
 
 
@@ -57,6 +58,87 @@ class TestConfigSpoked(unittest.TestCase):
         result = self.config.ip_bind_port()
         self.assertEqual(result, expected)
 
+    def test_snapshot_ttl(self):
+        """Testing function snapshot_ttl."""
+        # Test
+        result = self.config.snapshot_ttl()
+        self.assertEqual(result, 5)
+
+    def test_disk_usage_timeout(self):
+        """Testing function disk_usage_timeout."""
+        # Initialize key values
+        expected = 2
+
+        # Test
+        result = self.config.disk_usage_timeout()
+        self.assertEqual(result, expected)
+
+    def test_disk_usage_workers(self):
+        """Testing function disk_usage_workers."""
+        # Initialize key values
+        expected = 3
+
+        # Test
+        result = self.config.disk_usage_workers()
+        self.assertEqual(result, expected)
+
+    def test_metadata_refresh_interval(self):
+        """Testing function metadata_refresh_interval."""
+        # Initialize key values
+        expected = 600
+
+        # Test
+        result = self.config.metadata_refresh_interval()
+        self.assertEqual(result, expected)
+
+    def test_process_top(self):
+        """Testing function process_top."""
+        # Initialize key values
+        expected = 5
+
+        # Test
+        result = self.config.process_top()
+        self.assertEqual(result, expected)
+
+    def test_cgroup_stats(self):
+        """Testing function cgroup_stats."""
+        # Test
+        result = self.config.cgroup_stats()
+        self.assertTrue(result)
+
+    def test_per_cpu(self):
+        """Testing function per_cpu."""
+        # Test
+        result = self.config.per_cpu()
+        self.assertTrue(result)
+
+    def test_nic_filter(self):
+        """Testing function nic_filter."""
+        # Test
+        result = self.config.nic_filter()
+        self.assertTrue(result.included('eth0'))
+        self.assertFalse(result.included('veth1234'))
+        self.assertFalse(result.included('docker0'))
+
+    def test_disk_io_filter(self):
+        """Testing function disk_io_filter."""
+        # Test
+        result = self.config.disk_io_filter()
+        self.assertTrue(result.included('sda'))
+        self.assertFalse(result.included('nvme0n1'))
+        self.assertFalse(result.included('loop0'))
+
+    def test_disk_filters(self):
+        """Testing function disk_filters."""
+        # Initialize key values
+        expected = DiskFilters(
+            include_fstypes=[], exclude_fstypes=['nfs', 'cifs'],
+            include_mountpoints=[], exclude_mountpoints=['^/mnt/'])
+
+        # Test
+        result = self.config.disk_filters()
+        self.assertEqual(result, expected)
+
     def test_language(self):
         """Test pattoo_shared.Config inherited method language."""
         # Initialize key values
@@ -223,6 +305,24 @@ class TestConfigHubd(unittest.TestCase):
             self.assertEqual(item['ip_address'], '127.0.0.1')
             self.assertEqual(item['ip_bind_port'], 5000)
 
+    def test_spoke_concurrency(self):
+        """Testing function spoke_concurrency."""
+        # Test
+        result = self.config.spoke_concurrency()
+        self.assertEqual(result, 50)
+
+    def test_spoke_timeout(self):
+        """Testing function spoke_timeout."""
+        # Test
+        result = self.config.spoke_timeout()
+        self.assertEqual(result, 5)
+
+    def test_post_workers(self):
+        """Testing function post_workers."""
+        # Test
+        result = self.config.post_workers()
+        self.assertEqual(result, 2)
+
     def test_language(self):
         """Test pattoo_shared.Config inherited method language."""
         # Initialize key values
@@ -375,6 +475,59 @@ class TestConfigAutonomousd(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_disk_usage_timeout(self):
+        """Testing function disk_usage_timeout."""
+        # Test
+        self.assertEqual(self.config.disk_usage_timeout(), 5)
+
+    def test_disk_usage_workers(self):
+        """Testing function disk_usage_workers."""
+        # Test
+        self.assertEqual(self.config.disk_usage_workers(), 4)
+
+    def test_metadata_refresh_interval(self):
+        """Testing function metadata_refresh_interval."""
+        # Test
+        self.assertEqual(self.config.metadata_refresh_interval(), 3600)
+
+    def test_sampling_interval(self):
+        """Testing function sampling_interval."""
+        # Test
+        self.assertEqual(self.config.sampling_interval(), 10)
+
+    def test_process_top(self):
+        """Testing function process_top."""
+        # Test
+        self.assertEqual(self.config.process_top(), 0)
+
+    def test_cgroup_stats(self):
+        """Testing function cgroup_stats."""
+        # Test
+        self.assertFalse(self.config.cgroup_stats())
+
+    def test_per_cpu(self):
+        """Testing function per_cpu."""
+        # Test
+        self.assertFalse(self.config.per_cpu())
+
+    def test_nic_filter(self):
+        """Testing function nic_filter."""
+        # Test
+        self.assertTrue(self.config.nic_filter().included('veth1234'))
+
+    def test_disk_io_filter(self):
+        """Testing function disk_io_filter."""
+        # Test
+        result = self.config.disk_io_filter()
+        self.assertTrue(result.included('nvme0n1'))
+        self.assertFalse(result.included('ram0'))
+        self.assertFalse(result.included('loop0'))
+
+    def test_disk_filters(self):
+        """Testing function disk_filters."""
+        # Test
+        self.assertEqual(self.config.disk_filters(), DISK_FILTERS)
+
     def test_language(self):
         """Test pattoo_shared.Config inherited method language."""
         # Initialize key values
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Test the disk module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import collections
+import concurrent.futures
+
+# Pattoo imports
+from pattoo_agents.os.disk import DiskUsage
+from pattoo_agents.os import disk
+from pattoo_agents.os.constants import DiskFilters, DISK_FILTERS
+from tests.libraries.configuration import UnittestConfig
+
+_Partition = collections.namedtuple(
+    '_Partition', 'device mountpoint fstype opts')
+
+
+class _DiskUsage(DiskUsage):
+    """DiskUsage object whose reads of /hung mountpoints never finish."""
+
+    def __init__(self, **kwargs):
+        """Initialize the class."""
+        DiskUsage.__init__(self, **kwargs)
+        self.reads = []
+
+    def _read(self, mountpoint):
+        """Read the usage of a partition."""
+        self.reads.append(mountpoint)
+        result = concurrent.futures.Future()
+        if mountpoint.startswith('/hung') is False:
+            result.set_result(mountpoint)
+        return result
+
+
+class TestDiskUsage(unittest.TestCase):
+    """Checks all DiskUsage methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_usage(self):
+        """Testing method / function usage."""
+        # Initialize key variables
+        disk_usage = DiskUsage(workers=1, timeout=5)
+        partition = _Partition('/dev/sda1', os.sep, 'ext4', 'rw')
+
+        # Test
+        result = disk_usage.usage([partition])
+        self.assertIsNotNone(result[os.sep])
+        self.assertTrue(result[os.sep].total > 0)
+
+        # Partitions that can't be read are excluded
+        partition = _Partition('/dev/sda1', '/nonexistent_mount', 'ext4', 'rw')
+        self.assertEqual(disk_usage.usage([partition]), {})
+
+    def test_usage_hung(self):
+        """Testing method / function usage with hung mountpoints."""
+        # Initialize key variables
+        disk_usage = _DiskUsage(workers=2, timeout=0.1)
+        partitions = [
+            _Partition('server:/', _, 'nfs', 'rw')
+            for _ in ['/hung1', '/hung2', '/hung3', '/', '/home']]
+
+        # Test. Hung mountpoints don't stop the others from being read.
+        result = disk_usage.usage(partitions)
+        self.assertEqual(
+            result, {'/hung1': None, '/hung2': None, '/hung3': None,
+                     '/': '/', '/home': '/home'})
+
+        # Test. Hung mountpoints aren't read again.
+        disk_usage.reads = []
+        result = disk_usage.usage(partitions)
+        self.assertEqual(disk_usage.reads, ['/', '/home'])
+        self.assertIsNone(result['/hung1'])
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_included(self):
+        """Testing function included."""
+        # Initialize key variables
+        filters = DiskFilters(
+            include_fstypes=['ext4', 'nfs'], exclude_fstypes=['nfs'],
+            include_mountpoints=[], exclude_mountpoints=['^/mnt/'])
+
+        # Test
+        self.assertTrue(disk.included(
+            _Partition('/dev/sda1', '/', 'ext4', 'rw'), filters))
+        self.assertFalse(disk.included(
+            _Partition('/dev/sda1', '/', 'xfs', 'rw'), filters))
+        self.assertFalse(disk.included(
+            _Partition('server:/', '/home', 'nfs', 'rw'), filters))
+        self.assertFalse(disk.included(
+            _Partition('/dev/sdb1', '/mnt/backup', 'ext4', 'rw'), filters))
+
+        # Docker mountpoints are excluded by default
+        self.assertTrue(disk.included(
+            _Partition('/dev/sda1', '/', 'ext4', 'rw'), DISK_FILTERS))
+        self.assertFalse(disk.included(
+            _Partition('overlay', '/var/lib/docker/overlay2', 'overlay',
+                       'rw'), DISK_FILTERS))
+
+        # Only matching mountpoints are included
+        filters = DISK_FILTERS._replace(include_mountpoints=['^/$'])
+        self.assertTrue(disk.included(
+            _Partition('/dev/sda1', '/', 'ext4', 'rw'), filters))
+        self.assertFalse(disk.included(
+            _Partition('/dev/sda2', '/home', 'ext4', 'rw'), filters))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
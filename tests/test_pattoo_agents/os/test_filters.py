@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Test the filters module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_agents.os.filters import DeviceFilter
+from pattoo_agents.os.constants import DISK_IO_EXCLUDE
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestDeviceFilter(unittest.TestCase):
+    """Checks all DeviceFilter methods."""
+
+    ##########################################################################
+    # General object setup
+    ##########################################################################
+
+    def test_included(self):
+        """Testing method / function included."""
+        # Everything is included by default
+        _filter = DeviceFilter()
+        self.assertTrue(_filter.included('eth0'))
+        self.assertTrue(_filter.included(0))
+
+        # Exclusions
+        _filter = DeviceFilter(exclude=DISK_IO_EXCLUDE)
+        self.assertTrue(_filter.included('sda'))
+        self.assertTrue(_filter.included('nvme0n1'))
+        self.assertFalse(_filter.included('ram0'))
+        self.assertFalse(_filter.included('loop12'))
+
+        # Inclusions
+        _filter = DeviceFilter(include=['^eth', '^ens'])
+        self.assertTrue(_filter.included('eth0'))
+        self.assertTrue(_filter.included('ens3'))
+        self.assertFalse(_filter.included('lo'))
+
+        # Exclusions win over inclusions
+        _filter = DeviceFilter(include=['^eth'], exclude=['^eth1$'])
+        self.assertTrue(_filter.included('eth0'))
+        self.assertFalse(_filter.included('eth1'))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
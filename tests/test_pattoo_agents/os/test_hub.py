@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Test the hub module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import asyncio
+from unittest import mock
+
+# PIP imports
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Pattoo imports
+from pattoo_agents.os.hub import Hub
+from pattoo_agents.os import hub as hub_module
+from tests.libraries.configuration import UnittestConfig
+
+
+class _Hub(Hub):
+    """Hub that records posts instead of making them."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the class."""
+        Hub.__init__(self, *args, **kwargs)
+        self.posted = []
+        self.purges = 0
+
+    def _post(self, url, data):
+        """Post the data of a spoke."""
+        if data['pattoo_agent_id'] == 'error':
+            raise ConnectionError('Server unavailable')
+        self.posted.append(data['pattoo_agent_id'])
+        return True
+
+    def _purge(self):
+        """Post cached data."""
+        self.purges += 1
+
+
+class TestHub(unittest.TestCase):
+    """Checks all Hub methods."""
+
+    ##########################################################################
+    # General object setup
+    ##########################################################################
+
+    def test_fetch(self):
+        """Testing method / function fetch."""
+        # Initialize key variables
+        data = {'pattoo_agent_id': 'abc'}
+
+        async def spoke(request):
+            if request.headers.get('If-None-Match') == '"abc"':
+                return web.Response(status=304)
+            return web.json_response(data, headers={'ETag': '"abc"'})
+
+        async def invalid(request):
+            return web.json_response([1, 2])
+
+        async def fetch():
+            app = web.Application()
+            app.router.add_get('/spoke', spoke)
+            app.router.add_get('/invalid', invalid)
+            server = TestServer(app)
+            await server.start_server()
+
+            # Create the session
+            hub = Hub('hub', timeout=5)
+            await hub.poll([])
+
+            # Unchanged data is only received once
+            url = str(server.make_url('/spoke'))
+            results = [await hub.fetch(url), await hub.fetch(url)]
+
+            # Invalid and missing data
+            results.append(await hub.fetch(str(server.make_url('/invalid'))))
+            results.append(await hub.fetch(str(server.make_url('/missing'))))
+
+            await hub._session.close()
+            await server.close()
+            return results
+
+        # Test
+        loop = asyncio.new_event_loop()
+        results = loop.run_until_complete(fetch())
+        loop.close()
+        self.assertEqual(results, [data, None, None, None])
+
+    def test_poll(self):
+        """Testing method / function poll."""
+        # Initialize key variables
+        hub = _Hub('hub', timeout=5, post_workers=2)
+
+        async def spoke(request):
+            return web.json_response(
+                {'pattoo_agent_id': request.match_info['agent_id']})
+
+        async def poll():
+            app = web.Application()
+            app.router.add_get('/{agent_id}', spoke)
+            server = TestServer(app)
+            await server.start_server()
+
+            # Posts that fail don't stop the other spokes from being posted
+            result = await hub.poll([
+                str(server.make_url('/{}'.format(_)))
+                for _ in ['spoke1', 'error', 'spoke2']])
+
+            await hub._session.close()
+            await server.close()
+            return result
+
+        # Test. Cached data is only posted once.
+        loop = asyncio.new_event_loop()
+        result = loop.run_until_complete(poll())
+        loop.close()
+        self.assertEqual(result, 2)
+        self.assertEqual(sorted(hub.posted), ['spoke1', 'spoke2'])
+        self.assertEqual(hub.purges, 1)
+
+    def test__post(self):
+        """Testing method / function _post."""
+        # Initialize key variables
+        hub = Hub('hub')
+        server = mock.Mock()
+        server.post.return_value = False
+
+        # Test. Failed posts are logged.
+        with mock.patch.object(
+                hub_module, 'Post', return_value=server) as post, \
+                mock.patch.object(hub_module.log, 'log2warning') as warning:
+            result = hub._post('http://spoke', {'pattoo_agent_id': 'abc'})
+        self.assertFalse(result)
+        post.assert_called_once_with('hub', {'pattoo_agent_id': 'abc'})
+        self.assertEqual(warning.call_args[0][0], 51066)
+        self.assertIn('http://spoke', warning.call_args[0][1])
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
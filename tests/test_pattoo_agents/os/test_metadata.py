@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test the metadata module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_agents.os.metadata import HostMetadata
+from pattoo_agents.os import metadata
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestHostMetadata(unittest.TestCase):
+    """Checks all HostMetadata methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_hostname(self):
+        """Testing method / function hostname."""
+        # Test
+        host_metadata = HostMetadata()
+        self.assertTrue(bool(host_metadata.hostname(now=0)))
+
+    def test_metadata(self):
+        """Testing method / function metadata."""
+        # Initialize key variables
+        host_metadata = HostMetadata(refresh_interval=60)
+
+        # Test. The metadata is shared until it is refreshed.
+        result = host_metadata.metadata(now=0)
+        self.assertEqual(len(result), 6)
+        self.assertIs(host_metadata.metadata(now=59), result)
+        self.assertIsNot(host_metadata.metadata(now=60), result)
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__metadata(self):
+        """Testing function _metadata."""
+        # Test
+        result = metadata._metadata('test.example.org')
+        self.assertEqual(
+            [_.key for _ in result],
+            ['release', 'version', 'processor', 'type', 'cpus', 'hostname'])
+        self.assertEqual(result[-1].value, 'test.example.org')
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test the payload module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import gzip
+import json
+import zlib
+
+# Pattoo imports
+from pattoo_agents.os import payload
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestPayload(unittest.TestCase):
+    """Checks all Payload methods."""
+
+    ##########################################################################
+    # General object setup
+    ##########################################################################
+
+    data = {'pattoo_agent_id': 'abc', 'pattoo_datapoints': [1, 2, 3]}
+
+    def test___init__(self):
+        """Testing method / function __init__."""
+        # Unchanged data has an unchanged ETag
+        result = payload.Payload(self.data)
+        self.assertEqual(
+            result.etag, payload.Payload(dict(self.data)).etag)
+        self.assertNotEqual(
+            result.etag, payload.Payload({'pattoo_agent_id': 'abc'}).etag)
+
+        # Timestamps don't change the ETag
+        self.assertEqual(
+            result.etag,
+            payload.Payload(dict(self.data, pattoo_agent_timestamp=1)).etag)
+
+    def test_body(self):
+        """Testing method / function body."""
+        # Test
+        result = payload.Payload(self.data)
+        self.assertEqual(json.loads(result.body().decode()), self.data)
+        self.assertEqual(
+            json.loads(gzip.decompress(result.body('gzip')).decode()),
+            self.data)
+        self.assertEqual(
+            json.loads(zlib.decompress(result.body('deflate')).decode()),
+            self.data)
+
+        # Compressed data is reused
+        self.assertIs(result.body('gzip'), result.body('gzip'))
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test__timeless(self):
+        """Testing function _timeless."""
+        # Initialize key variables
+        data = {
+            'pattoo_agent_id': 'abc',
+            'pattoo_agent_timestamp': 1,
+            'pattoo_datapoints': {
+                'key_value_pairs': {
+                    0: ['pattoo_key', 'cpu'],
+                    1: ['pattoo_timestamp', 2]},
+                'datapoint_pairs': [[0, 1]]}}
+        expected = {
+            'pattoo_agent_id': 'abc',
+            'pattoo_datapoints': {
+                'key_value_pairs': {0: ['pattoo_key', 'cpu']},
+                'datapoint_pairs': [[0, 1]]}}
+
+        # Test
+        self.assertEqual(payload._timeless(data), expected)
+
+    def test__compress(self):
+        """Testing function _compress."""
+        # Test
+        with self.assertRaises(ValueError):
+            payload._compress(b'abc', 'br')
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Test the proc module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents.os import proc
+from tests.libraries.configuration import UnittestConfig
+
+_LOADAVG = '0.20 0.18 0.12 1/80 11206\n'
+_STAT = '''\
+cpu  4705 356 584 3699 23 23 0 0 0 0
+cpu0 4705 356 584 3699 23 23 0 0 0 0
+intr 1462898 2 0 0 0
+ctxt 115315
+btime 769041601
+processes 86031
+procs_running 2
+procs_blocked 0
+softirq 229245 0 105 16 0
+'''
+_MEMINFO = '''\
+MemTotal:        1000 kB
+MemFree:          200 kB
+MemAvailable:     600 kB
+Buffers:           50 kB
+Cached:           250 kB
+Active:           400 kB
+Inactive:         100 kB
+Shmem:             10 kB
+Slab:              40 kB
+SReclaimable:      30 kB
+'''
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_snapshot(self):
+        """Testing function snapshot."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(proc.snapshot(proc=directory))
+            for filename, text in [
+                    ('loadavg', _LOADAVG), ('stat', _STAT),
+                    ('meminfo', _MEMINFO)]:
+                with open(os.path.join(directory, filename), 'w') as f_handle:
+                    f_handle.write(text)
+            for pid in ['1', '2', '3']:
+                os.mkdir(os.path.join(directory, pid))
+            result = proc.snapshot(proc=directory)
+        self.assertEqual(result.load_averages, (0.20, 0.18, 0.12))
+        self.assertEqual(result.process_count, 3)
+        self.assertEqual(result.cpu_stats.ctx_switches, 115315)
+        self.assertEqual(result.memory.total, 1024000)
+
+    def test_cpu_times_percent(self):
+        """Testing function cpu_times_percent."""
+        # Initialize key variables
+        before = proc.CPUTimes(10, 0, 10, 70, 10, 0, 0, 0, 5, 0)
+        after = proc.CPUTimes(30, 0, 20, 130, 20, 0, 0, 0, 15, 0)
+
+        # Test. Guest time is not counted twice.
+        proc.cpu_times_percent(before)
+        result = proc.cpu_times_percent(after)
+        self.assertEqual(result.user, 20.0)
+        self.assertEqual(result.system, 10.0)
+        self.assertEqual(result.idle, 60.0)
+        self.assertEqual(result.iowait, 10.0)
+        self.assertEqual(result.guest, 10.0)
+
+        # No time elapsed
+        result = proc.cpu_times_percent(after)
+        self.assertEqual(result.idle, 0.0)
+
+    def test_utilization(self):
+        """Testing function utilization."""
+        # Test
+        result = proc.utilization(
+            proc.CPUTimes(0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+            proc.CPUTimes(1, 0, 1, 2, 0, 0, 0, 0, 0, 0))
+        self.assertEqual(result.user, 25.0)
+        self.assertEqual(result.idle, 50.0)
+
+    def test_cpu_times(self):
+        """Testing function cpu_times."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(proc.cpu_times(proc=directory))
+            with open(os.path.join(directory, 'stat'), 'w') as f_handle:
+                f_handle.write(_STAT)
+            result = proc.cpu_times(proc=directory)
+        self.assertEqual(result.user, 4705 / os.sysconf('SC_CLK_TCK'))
+
+    def test_memory(self):
+        """Testing function memory."""
+        # Test
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(proc.memory(proc=directory))
+            with open(os.path.join(directory, 'meminfo'), 'w') as f_handle:
+                f_handle.write(_MEMINFO)
+            result = proc.memory(proc=directory)
+        self.assertEqual(result.percent, 40.0)
+
+    def test__loadavg(self):
+        """Testing function _loadavg."""
+        # Test
+        self.assertEqual(proc._loadavg(_LOADAVG), (0.20, 0.18, 0.12))
+
+    def test__process_count(self):
+        """Testing function _process_count."""
+        # Test. Only directories named after PIDs are counted.
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ['1', '20', 'self', 'net']:
+                os.mkdir(os.path.join(directory, name))
+            self.assertEqual(proc._process_count(directory), 2)
+
+    def test__stat(self):
+        """Testing function _stat."""
+        # Test
+        (cpu_times, cpu_stats, per_cpu_times) = proc._stat(_STAT, 100)
+        self.assertEqual(
+            cpu_times,
+            proc.CPUTimes(47.05, 3.56, 5.84, 36.99, 0.23, 0.23, 0, 0, 0, 0))
+        self.assertEqual(
+            cpu_stats,
+            proc.CPUStats(
+                ctx_switches=115315, interrupts=1462898,
+                soft_interrupts=229245, syscalls=0))
+        self.assertEqual(per_cpu_times, [(0, cpu_times)])
+
+        # CPUs keep their numbers when others are offline
+        text = _STAT.replace('cpu0 ', 'cpu2 ') + (
+            'cpu0 4705 356 584 3699 23 23 0 0 0 0\n')
+        (_, _, per_cpu_times) = proc._stat(text, 100)
+        self.assertEqual([_[0] for _ in per_cpu_times], [0, 2])
+
+        # Older kernels report fewer CPU times
+        (cpu_times, _, _) = proc._stat(
+            _STAT.replace(' 23 0 0 0 0\n', '\n'), 100)
+        self.assertEqual(cpu_times.irq, 0)
+
+    def test__meminfo(self):
+        """Testing function _meminfo."""
+        # Test
+        result = proc._meminfo(_MEMINFO)
+        self.assertEqual(result.total, 1024000)
+        self.assertEqual(result.available, 614400)
+        self.assertEqual(result.percent, 40.0)
+        self.assertEqual(result.cached, 286720)
+        self.assertEqual(result.used, 481280)
+        self.assertEqual(result.shared, 10240)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
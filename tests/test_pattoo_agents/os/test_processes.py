@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Test the processes module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents.os.processes import ProcessStats, Usage
+from pattoo_agents.os import processes
+from tests.libraries.configuration import UnittestConfig
+
+_TICKS = os.sysconf('SC_CLK_TCK')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+
+def _process(directory, pid, name, ticks, pages, read_bytes):
+    """Create the /proc files of a process."""
+    path = os.path.join(directory, str(pid))
+    os.makedirs(os.path.join(path, 'fd'), exist_ok=True)
+    open(os.path.join(path, 'fd', '0'), 'w').close()
+    fields = ['S'] + ['0'] * 10 + [str(ticks), '0'] + ['0'] * 6 + [
+        '1234', '0', str(pages)] + ['0'] * 20
+    with open(os.path.join(path, 'stat'), 'w') as f_handle:
+        f_handle.write('{} ({}) {}\n'.format(pid, name, ' '.join(fields)))
+    with open(os.path.join(path, 'io'), 'w') as f_handle:
+        f_handle.write('rchar: 1\nread_bytes: {}\nwrite_bytes: 0\n'.format(
+            read_bytes))
+
+
+class TestProcessStats(unittest.TestCase):
+    """Checks all ProcessStats methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_usage(self):
+        """Testing method / function usage."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Initialize key variables
+            process_stats = ProcessStats(proc=directory)
+            _process(directory, 100, 'my (app)', 0, 10, 0)
+
+            # Test. Nothing is known on the first call.
+            self.assertIsNone(process_stats.usage(now=0))
+            _process(directory, 100, 'my (app)', _TICKS * 5, 20, 1000)
+            result = process_stats.usage(now=10)
+            self.assertEqual(result, [Usage(
+                pid=100, name='my (app)', cpu_percent=50.0,
+                rss=20 * _PAGE_SIZE, read_rate=100.0, write_rate=0.0)])
+
+    def test_datapoints(self):
+        """Testing method / function datapoints."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Initialize key variables
+            process_stats = ProcessStats(top=1, proc=directory)
+            _process(directory, 100, 'busy', 0, 10, 0)
+            _process(directory, 200, 'idle', 0, 1, 0)
+
+            # Test. Only the top process is reported with a rollup.
+            self.assertEqual(process_stats.datapoints(now=0), [])
+            _process(directory, 100, 'busy', _TICKS, 10, 0)
+            result = process_stats.datapoints(now=1)
+            keys = [_.key for _ in result]
+            self.assertIn('process_cpu_percent', keys)
+            self.assertIn('process_fds', keys)
+            self.assertEqual(
+                result[keys.index('processes_other_count')].value, 1)
+            self.assertEqual(
+                result[keys.index('processes_other_rss')].value, _PAGE_SIZE)
+
+    def test_datapoints_restart(self):
+        """Testing method / function datapoints."""
+        # Initialize key variables
+        checksums = []
+
+        # Test. A restarted process keeps the checksums of its DataPoints.
+        for pid in [100, 300]:
+            with tempfile.TemporaryDirectory() as directory:
+                process_stats = ProcessStats(top=1, proc=directory)
+                _process(directory, pid, 'busy', 0, 10, 0)
+                process_stats.datapoints(now=0)
+                _process(directory, pid, 'busy', _TICKS, 10, 0)
+                result = process_stats.datapoints(now=1)
+                self.assertEqual(result[0].metadata['process_pid'], pid)
+                checksums.append([_.checksum for _ in result])
+        self.assertEqual(checksums[0], checksums[1])
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_top(self):
+        """Testing function top."""
+        # Initialize key variables
+        usages = [
+            Usage(pid=1, name='cpu', cpu_percent=90, rss=1, read_rate=0,
+                  write_rate=0),
+            Usage(pid=2, name='memory', cpu_percent=1, rss=100, read_rate=0,
+                  write_rate=0),
+            Usage(pid=3, name='io', cpu_percent=0, rss=2, read_rate=5,
+                  write_rate=5),
+            Usage(pid=4, name='idle', cpu_percent=0, rss=0, read_rate=0,
+                  write_rate=0)]
+
+        # Test
+        result = processes.top(usages, 1)
+        self.assertEqual([_.pid for _ in result], [1, 2, 3])
+        self.assertEqual(processes.top(usages, 0), [])
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
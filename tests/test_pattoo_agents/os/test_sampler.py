@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test the sampler module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents.os.sampler import Sampler
+from pattoo_agents.os import sampler
+from tests.libraries.configuration import UnittestConfig
+
+_MEMINFO = '''\
+MemTotal:        1000 kB
+MemFree:          200 kB
+MemAvailable:     600 kB
+'''
+
+
+def _proc(directory, busy, idle):
+    """Create the /proc files read by the sampler."""
+    ticks = os.sysconf('SC_CLK_TCK')
+    with open(os.path.join(directory, 'stat'), 'w') as f_handle:
+        f_handle.write('''\
+cpu  {} 0 0 {} 0 0 0 0 0 0
+intr 1
+ctxt 1
+'''.format(busy * ticks, idle * ticks))
+    with open(os.path.join(directory, 'meminfo'), 'w') as f_handle:
+        f_handle.write(_MEMINFO)
+
+
+class TestSampler(unittest.TestCase):
+    """Checks all Sampler methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_datapoints(self):
+        """Testing method / function datapoints."""
+        with tempfile.TemporaryDirectory() as directory:
+            # Initialize key variables
+            _proc(directory, 0, 0)
+            _sampler = Sampler(10, 20, proc_dir=directory)
+
+            # Test. The ring buffer only keeps the latest samples.
+            for busy, idle in [(10, 0), (10, 10), (15, 15), (15, 20)]:
+                _proc(directory, busy, idle)
+                _sampler.sample()
+            result = {
+                _.key: _.value for _ in _sampler.datapoints()}
+            self.assertEqual(result['cpu_busy_percent_min'], 0)
+            self.assertEqual(result['cpu_busy_percent_max'], 50)
+            self.assertEqual(result['cpu_busy_percent_avg'], 25)
+            self.assertEqual(result['memory_percent_p95'], 40)
+            self.assertEqual(len(result), 12)
+
+            # The buffers are emptied
+            self.assertEqual(_sampler.datapoints(), [])
+
+    def test_start(self):
+        """Testing method / function start."""
+        # Test
+        _sampler = Sampler(0.01, 1)
+        _sampler.start()
+        _sampler.stop()
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_summary(self):
+        """Testing function summary."""
+        # Test
+        self.assertEqual(sampler.summary([]), [])
+        result = dict(sampler.summary(list(range(1, 21))))
+        self.assertEqual(
+            result, {'min': 1, 'max': 20, 'avg': 10.5, 'p95': 19})
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
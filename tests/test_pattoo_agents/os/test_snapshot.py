@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Test the snapshot module."""
+
+# Standard imports
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(
+        os.path.abspath(os.path.join(
+            EXEC_DIR, os.pardir)), os.pardir)), os.pardir))
+_EXPECTED = (
+    '{0}pattoo-agents{0}tests{0}test_pattoo_agents{0}os'.format(os.sep))
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import threading
+import time
+
+# Pattoo imports
+from pattoo_agents.os.snapshot import Snapshots
+from tests.libraries.configuration import UnittestConfig
+
+
+class _Collector():
+    """Count the number of collections."""
+
+    def __init__(self, delay=0):
+        """Initialize the class."""
+        self.count = 0
+        self.delay = delay
+
+    def collect(self):
+        """Collect data."""
+        self.count += 1
+        time.sleep(self.delay)
+        return self.count
+
+
+class TestSnapshots(unittest.TestCase):
+    """Checks all Snapshots methods."""
+
+    ##########################################################################
+    # General object setup
+    ##########################################################################
+
+    def test_get(self):
+        """Testing method / function get."""
+        # Data is reused until it expires
+        snapshots = Snapshots(ttl=0.2)
+        collector = _Collector()
+        self.assertEqual(snapshots.get(300, collector.collect), 1)
+        self.assertEqual(snapshots.get(300, collector.collect), 1)
+
+        # Each polling interval has its own data
+        self.assertEqual(snapshots.get(200, collector.collect), 2)
+
+        # Expired data is collected again
+        time.sleep(0.25)
+        self.assertEqual(snapshots.get(300, collector.collect), 3)
+
+    def test_get_concurrent(self):
+        """Testing method / function get with simultaneous requests."""
+        # Initialize key variables
+        snapshots = Snapshots(ttl=10)
+        collector = _Collector(delay=0.2)
+        results = []
+
+        def request():
+            results.append(snapshots.get(300, collector.collect))
+
+        # Simultaneous requests share one collection
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(collector.count, 1)
+        self.assertEqual(results, [1] * 5)
+
+    def test_get_error(self):
+        """Testing method / function get with a failed collection."""
+        # Initialize key variables
+        snapshots = Snapshots(ttl=10)
+
+        def fail():
+            raise ValueError()
+
+        # Failures aren't cached
+        with self.assertRaises(ValueError):
+            snapshots.get(300, fail)
+        self.assertEqual(snapshots.get(300, _Collector().collect), 1)
+
+    def test_ttl(self):
+        """Testing method / function ttl."""
+        # Test
+        snapshots = Snapshots(ttl=10)
+        self.assertEqual(snapshots.ttl(300), 10)
+        self.assertEqual(snapshots.ttl(6), 3)
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Test the deadband module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir))
+_EXPECTED = '{0}pattoo-agents{0}tests{0}test_pattoo_agents'.format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Pattoo imports
+from pattoo_shared.variables import DataPoint, TargetDataPoints
+from pattoo_agents.deadband import Deadband, ChangeFilter, deadband
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestChangeFilter(unittest.TestCase):
+    """Checks all ChangeFilter methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_report(self):
+        """Testing method / function report."""
+        # Initialize key variables
+        changefilter = ChangeFilter()
+        setting = Deadband(absolute=2, percent=None, heartbeat=100)
+
+        # Values without deadbands are always reported
+        for _ in range(2):
+            result = changefilter.report(DataPoint('none', 1), None, now=0)
+            self.assertTrue(result)
+
+        # The first value is always reported
+        result = changefilter.report(DataPoint('abs', 10), setting, now=0)
+        self.assertTrue(result)
+
+        # Values within the deadband are suppressed
+        result = changefilter.report(DataPoint('abs', 12), setting, now=10)
+        self.assertFalse(result)
+
+        # Values outside the deadband are reported
+        result = changefilter.report(DataPoint('abs', 12.5), setting, now=20)
+        self.assertTrue(result)
+
+        # Values are reported after the heartbeat interval
+        result = changefilter.report(DataPoint('abs', 12.5), setting, now=110)
+        self.assertFalse(result)
+        result = changefilter.report(DataPoint('abs', 12.5), setting, now=120)
+        self.assertTrue(result)
+
+        # Test percentage deadbands
+        setting = Deadband(absolute=None, percent=10, heartbeat=None)
+        result = changefilter.report(DataPoint('pct', 200), setting, now=0)
+        self.assertTrue(result)
+        result = changefilter.report(DataPoint('pct', 219), setting, now=1)
+        self.assertFalse(result)
+        result = changefilter.report(DataPoint('pct', 221), setting, now=2)
+        self.assertTrue(result)
+
+        # Test change only reporting of strings
+        setting = Deadband(absolute=None, percent=None, heartbeat=None)
+        result = changefilter.report(DataPoint('str', 'a'), setting, now=0)
+        self.assertTrue(result)
+        result = changefilter.report(DataPoint('str', 'a'), setting, now=1)
+        self.assertFalse(result)
+        result = changefilter.report(DataPoint('str', 'b'), setting, now=2)
+        self.assertTrue(result)
+
+    def test_filter(self):
+        """Testing method / function filter."""
+        # Initialize key variables
+        changefilter = ChangeFilter()
+        setting = Deadband(absolute=5, percent=None, heartbeat=None)
+        datapoint_1 = DataPoint('one', 1)
+        datapoint_2 = DataPoint('two', 2)
+        settings = {datapoint_1.checksum: setting}
+
+        # Test
+        for expected in [2, 1]:
+            ddv = TargetDataPoints('localhost')
+            ddv.add([datapoint_1, datapoint_2])
+            result = changefilter.filter(ddv, settings, now=0)
+            self.assertTrue(isinstance(result, TargetDataPoints))
+            self.assertEqual(result.target, 'localhost')
+            self.assertEqual(len(result.data), expected)
+
+    def test_filter_targets(self):
+        """Testing method / function filter with several targets."""
+        # Initialize key variables
+        changefilter = ChangeFilter()
+        setting = Deadband(absolute=5, percent=None, heartbeat=None)
+        settings = {DataPoint('register', 100).checksum: setting}
+
+        # The same register of different targets is filtered separately
+        for (target, value, expected) in [
+                ('gw1', 100, 1), ('gw2', 102, 1), ('gw1', 102, 0),
+                ('gw2', 103, 0), ('gw2', 108, 1)]:
+            ddv = TargetDataPoints(target)
+            ddv.add(DataPoint('register', value))
+            result = changefilter.filter(ddv, settings, now=0)
+            self.assertEqual(len(result.data), expected)
+
+    def test_prune(self):
+        """Testing method / function _prune."""
+        # Initialize key variables
+        changefilter = ChangeFilter(ttl=100)
+        setting = Deadband(absolute=5, percent=None, heartbeat=None)
+        for key in ['kept', 'removed']:
+            changefilter.report(DataPoint(key, 1), setting, now=0)
+
+        # Test. Suppressed values are still seen.
+        result = changefilter.report(DataPoint('kept', 2), setting, now=90)
+        self.assertFalse(result)
+        self.assertEqual(len(changefilter._reported), 2)
+
+        # Values not seen for more than the ttl are forgotten
+        result = changefilter.report(DataPoint('kept', 3), setting, now=150)
+        self.assertFalse(result)
+        self.assertEqual(len(changefilter._reported), 1)
+        result = changefilter.report(
+            DataPoint('removed', 1), setting, now=160)
+        self.assertTrue(result)
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_deadband(self):
+        """Testing method / function deadband."""
+        # Test invalid and missing values
+        self.assertIsNone(deadband(None))
+        self.assertIsNone(deadband({}))
+        self.assertIsNone(deadband({'deadband': 'test', 'heartbeat': True}))
+
+        # Test valid values
+        result = deadband({'deadband': 1, 'deadband_percent': -2})
+        self.assertEqual(
+            result, Deadband(absolute=1, percent=2, heartbeat=None))
+
+        # Test inheritance from a default
+        default = Deadband(absolute=1, percent=None, heartbeat=600)
+        self.assertEqual(deadband({}, default=default), default)
+        result = deadband({'deadband_percent': 3}, default=default)
+        self.assertEqual(
+            result, Deadband(absolute=1, percent=3, heartbeat=600))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()
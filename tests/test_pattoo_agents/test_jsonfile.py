@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test the jsonfile module."""
+
+import sys
+import unittest
+import os
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(
+    os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir))
+_EXPECTED = '{0}pattoo-agents{0}tests{0}test_pattoo_agents'.format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case PattooShared has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print('''This script is not installed in the "{0}" directory. Please fix.\
+'''.format(_EXPECTED))
+    sys.exit(2)
+
+# Standard imports
+import tempfile
+
+# Pattoo imports
+from pattoo_agents import jsonfile
+from tests.libraries.configuration import UnittestConfig
+
+
+class TestBasicFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    def test_load(self):
+        """Testing function load."""
+        # Initialize key variables
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'cache.json')
+
+            # Test missing files
+            self.assertIsNone(jsonfile.load(None, 1, 'test'))
+            self.assertIsNone(jsonfile.load(filename, 1, 'test'))
+
+            # Test unreadable files
+            with open(filename, 'w') as f_handle:
+                f_handle.write('{')
+            self.assertIsNone(jsonfile.load(filename, 1, 'test'))
+
+    def test_save(self):
+        """Testing function save."""
+        # Initialize key variables
+        data = {'a': [1, 2]}
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'cache.json')
+
+            # Test
+            self.assertTrue(jsonfile.save(filename, data, 1, 'test'))
+            self.assertEqual(jsonfile.load(filename, 1, 'test'), data)
+            self.assertFalse(os.path.exists('{}.tmp'.format(filename)))
+
+            # Test files that can't be written
+            self.assertFalse(jsonfile.save(
+                os.path.join(directory, 'missing', 'cache.json'),
+                data, 1, 'test'))
+
+
+if __name__ == '__main__':
+    # Make sure the environment is OK to run unittests
+    UnittestConfig().create()
+
+    # Do the unit test
+    unittest.main()